@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the scaling of :func:`lorem.write_parallel` with worker processes.
+
+The output for each number of workers is checked to be identical::
+
+    python benchmarks/bench_parallel.py --size 256M --jobs 1 2 4 8
+
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lorem  # pylint: disable=wrong-import-position
+
+
+class Digest:
+    """Binary sink that only keeps a digest of the data written."""
+
+    def __init__(self) -> 'None':
+        self.hash = hashlib.blake2b()
+        self.mode = 'wb'
+
+    def write(self, data: 'bytes') -> 'int':
+        """Update digest with data."""
+        self.hash.update(data)
+        return len(data)
+
+
+def main() -> 'None':
+    """Entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-b', '--size', type=lorem._parse_size, default=64 << 20,  # pylint: disable=protected-access
+                        help='total size of output')
+    parser.add_argument('-j', '--jobs', type=int, nargs='+', default=[1, os.cpu_count() or 1],
+                        help='numbers of worker processes')
+    args = parser.parse_args()
+
+    digests = set()
+    baseline = None
+    for jobs in args.jobs:
+        sink = Digest()
+        start = time.perf_counter()
+        lorem.write_parallel(sink, size=args.size, seed=0, jobs=jobs)  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        digests.add(sink.hash.hexdigest())
+        print('jobs={:<3d} {:>10.1f} MB/s  speedup {:.2f}x'.format(
+            jobs, args.size / elapsed / 1e6, baseline / elapsed))
+    print('identical output:', len(digests) == 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the plan/render engine of :class:`lorem.LoremGenerator`.
+
+The legacy engine, which grows sentences and paragraphs word by word, is kept
+here as :class:`LegacyGenerator` for comparison::
+
+    python benchmarks/bench_render.py
+
+"""
+import argparse
+import os
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lorem  # pylint: disable=wrong-import-position
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
+class LegacyGenerator(lorem.LoremGenerator):
+    """Legacy word-by-word rendering engine."""
+
+    def _gen_pool(self, dupe: 'int' = 1) -> 'Iterator[str]':
+        pool = list(self._text)
+        self.rng.shuffle(pool)
+
+        while pool:
+            yield from pool
+            self.rng.shuffle(pool)
+
+    def gen_sentence(self, comma: 'tuple[int, int]',
+                     word_range: 'tuple[int, int]') -> 'str':
+        text = self.gen_word(func='capitalize')
+        for _ in range(self.rng.randint(*word_range) - 1):  # nosec B311
+            text += ' ' + self.gen_word()
+
+        for _ in range(self.rng.randint(*comma)):  # nosec B311
+            include_comma = self.rng.choice([True, False])  # nosec B311
+            if include_comma:
+                text += ','
+                for _ in range(self.rng.randint(*word_range)):  # nosec B311
+                    text += ' ' + self.gen_word()
+                continue
+            break
+        return text + '.'
+
+    def gen_paragraph(self, comma: 'tuple[int, int]',
+                      word_range: 'tuple[int, int]',
+                      sentence_range: 'tuple[int, int]') -> 'str':
+        text = self.gen_sentence(comma=comma, word_range=word_range)
+        for _ in range(self.rng.randint(*sentence_range) - 1):  # nosec B311
+            text += ' ' + self.gen_sentence(comma=comma, word_range=word_range)
+        return text
+
+
+def bench(generator: 'lorem.LoremGenerator', number: 'int', repeat: 'int') -> 'float':
+    """Return the best throughput of :meth:`~lorem.LoremGenerator.gen_paragraph` in paragraphs/s."""
+    timer = timeit.Timer(lambda: generator.gen_paragraph(comma=(0, 2), word_range=(4, 8),
+                                                         sentence_range=(5, 10)))
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def main() -> 'None':
+    """Entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=20_000, help='paragraphs per run')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of runs')
+    args = parser.parse_args()
+
+    legacy = bench(LegacyGenerator(seed=0), args.number, args.repeat)
+    current = bench(lorem.LoremGenerator(seed=0), args.number, args.repeat)
+    print('legacy:  {:>12,.0f} paragraphs/s'.format(legacy))
+    print('current: {:>12,.0f} paragraphs/s'.format(current))
+    print('speedup: {:>12.2f}x'.format(current / legacy))
+
+
+if __name__ == '__main__':
+    main()
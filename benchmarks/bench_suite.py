@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite of the throughput and memory usage of :mod:`lorem`.
+
+Each case is timed for its best throughput over several rounds, in operations and
+megabytes of text per second, and run once more under :mod:`tracemalloc` for its
+peak memory usage. Results can be saved as JSON, and compared against a baseline
+saved before, where a case slower or bigger than the threshold is a regression::
+
+    python benchmarks/bench_suite.py --output baseline.json
+    python benchmarks/bench_suite.py --baseline baseline.json --threshold 0.1
+
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lorem  # pylint: disable=wrong-import-position
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional
+
+
+class Sink:
+    """Text sink that only counts the characters written."""
+
+    def __init__(self) -> 'None':
+        self.size = 0
+
+    def write(self, data: 'str') -> 'int':
+        """Count characters."""
+        self.size += len(data)
+        return len(data)
+
+
+def write_text(size: 'int') -> 'int':
+    """Stream text to a sink, return the number of characters written."""
+    return lorem.write_text(Sink(), size=size)  # type: ignore[arg-type]
+
+
+#: Schema of records, as a typical table of posts.
+SCHEMA = {
+    'name': {'kind': 'word', 'count': (1, 3)},
+    'title': 'sentence',
+    'body': {'kind': 'paragraph', 'sentence_range': (2, 4)},
+}  # type: Dict[str, Any]
+
+
+def get_records(count: 'int') -> 'int':
+    """Generate records with a call for each cell, return the number of characters."""
+    return sum(len(lorem.get_word(count=(1, 3))) + len(lorem.get_sentence())
+               + len(lorem.get_paragraph(sentence_range=(2, 4))) for _ in range(count))
+
+
+def write_csv(count: 'int') -> 'int':
+    """Write records as CSV to a sink, return the number of characters written."""
+    sink = Sink()
+    lorem.RecordGenerator(SCHEMA).write_csv(sink, count)  # type: ignore[arg-type]
+    return sink.size
+
+
+#: Benchmark cases, each returning the text generated or its size.
+CASES = {
+    'get_word': lambda: lorem.get_word(count=3),
+    'get_sentence': lambda: lorem.get_sentence(),
+    'get_paragraph': lambda: lorem.get_paragraph(),
+    'get_word[10000]': lambda: lorem.get_word(count=10_000),
+    'get_sentence[1000]': lambda: lorem.get_sentence(count=1000),
+    'get_paragraph[100]': lambda: lorem.get_paragraph(count=100),
+    'word[10000]': lambda: ' '.join(itertools.islice(lorem.word(count=100), 10_000)),
+    'sentence[1000]': lambda: ' '.join(itertools.islice(lorem.sentence(count=100), 1000)),
+    'paragraph[100]': lambda: '\n'.join(itertools.islice(lorem.paragraph(count=10), 100)),
+    'iter_text[100]': lambda: '\n'.join(itertools.islice(lorem.LoremGenerator().iter_text(), 100)),
+    'get_text[1M]': lambda: lorem.get_text(1 << 20),
+    'write_text[16M]': lambda: write_text(16 << 20),
+    'get_records[1000]': lambda: get_records(1000),
+    'write_csv[1000]': lambda: write_csv(1000),
+}  # type: Dict[str, Callable[[], str | int]]
+
+
+def measure(func: 'Callable[[], str | int]', rounds: 'int', duration: 'float') -> 'Dict[str, float]':
+    """Measure a case.
+
+    Args:
+        func: The benchmark case.
+        rounds: Number of rounds of timing.
+        duration: Minimum duration of each round in seconds.
+
+    Returns:
+        Best operations and megabytes of text per second, and peak memory in bytes.
+
+    """
+    number = 1
+    while True:  # calibrate number of operations per round, as timeit.Timer.autorange
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= duration:
+            break
+        number *= 2
+
+    best_ops = best_mbps = 0.0
+    for _ in range(rounds):
+        size = 0
+        start = time.perf_counter()
+        for _ in range(number):
+            result = func()
+            size += result if isinstance(result, int) else len(result)
+        elapsed = time.perf_counter() - start
+        best_ops = max(best_ops, number / elapsed)
+        best_mbps = max(best_mbps, size / elapsed / 1e6)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'ops': best_ops, 'mbps': best_mbps, 'peak': peak}
+
+
+def compare(results: 'Dict[str, Dict[str, float]]', baseline: 'Dict[str, Dict[str, float]]',
+            threshold: 'float') -> 'List[str]':
+    """Compare results against the baseline.
+
+    Args:
+        results: Results of the cases.
+        baseline: Results of the baseline.
+        threshold: Relative change in throughput or peak memory to be a regression.
+
+    Returns:
+        Descriptions of the regressions.
+
+    """
+    regressions = []  # type: List[str]
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result['ops'] < base['ops'] * (1 - threshold):
+            regressions.append('{}: {:.0f} ops/s, baseline {:.0f} ops/s'.format(
+                name, result['ops'], base['ops']))
+        if result['peak'] > base['peak'] * (1 + threshold):
+            regressions.append('{}: {:.0f} KiB peak, baseline {:.0f} KiB peak'.format(
+                name, result['peak'] / 1024, base['peak'] / 1024))
+    return regressions
+
+
+def main(argv: 'Optional[List[str]]' = None) -> 'int':
+    """Entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--filter', default='', help='only run cases containing the substring')
+    parser.add_argument('-r', '--rounds', type=int, default=5, help='number of rounds of timing')
+    parser.add_argument('-d', '--duration', type=float, default=0.2,
+                        help='minimum duration of each round in seconds')
+    parser.add_argument('-o', '--output', help='save results as JSON to the file')
+    parser.add_argument('-b', '--baseline', help='compare results against the JSON file')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='relative slowdown or memory growth to be a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    results = {}  # type: Dict[str, Dict[str, float]]
+    for name, func in CASES.items():
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(func, args.rounds, args.duration)
+        print('{:<20s} {:>12,.0f} ops/s {:>10.1f} MB/s {:>10,.0f} KiB peak'.format(
+            name, result['ops'], result['mbps'], result['peak'] / 1024))
+
+    if args.output is not None:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'version': lorem.__version__,
+            'results': results,
+        }  # type: Dict[str, Any]
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print('REGRESSION', regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the scaling of :class:`lorem.ThreadLocalLoremGenerator` with threads.
+
+A shared :class:`lorem.ThreadLocalLoremGenerator` is compared against a shared
+:class:`lorem.LoremGenerator` guarded by a lock, which is otherwise the only safe
+way to share a generator. Threads only scale on free-threaded CPython builds::
+
+    python3.13t -X gil=0 benchmarks/bench_threads.py --count 20000 --threads 1 2 4 8
+
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lorem  # pylint: disable=wrong-import-position
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+
+def locked(gen: 'lorem.LoremGenerator') -> 'Callable[[], str]':
+    """Generate paragraphs from a generator guarded by a lock."""
+    lock = threading.Lock()
+
+    def gen_paragraph() -> 'str':
+        with lock:
+            return gen.gen_paragraph((0, 2), (4, 8), (5, 10))
+    return gen_paragraph
+
+
+def thread_local(gen: 'lorem.ThreadLocalLoremGenerator') -> 'Callable[[], str]':
+    """Generate paragraphs from a thread-local generator."""
+    def gen_paragraph() -> 'str':
+        return gen.gen_paragraph((0, 2), (4, 8), (5, 10))
+    return gen_paragraph
+
+
+def run(func: 'Callable[[], str]', count: 'int', threads: 'int') -> 'float':
+    """Generate ``count`` paragraphs with ``threads`` threads, return the elapsed time."""
+    barrier = threading.Barrier(threads + 1)
+
+    def target(share: 'int') -> 'None':
+        barrier.wait()
+        for _ in range(share):
+            func()
+
+    workers = [threading.Thread(target=target, args=(count // threads,)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> 'None':
+    """Entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--count', type=int, default=20_000, help='total number of paragraphs')
+    parser.add_argument('-t', '--threads', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1],
+                        help='numbers of threads')
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('GIL enabled:', gil)
+
+    for name, func in (('locked', locked(lorem.LoremGenerator(seed=0))),
+                       ('thread-local', thread_local(lorem.ThreadLocalLoremGenerator(seed=0)))):
+        baseline = None
+        for threads in args.threads:
+            elapsed = run(func, args.count, threads)
+            baseline = baseline or elapsed
+            print('{:<12s} threads={:<3d} {:>10.0f} paragraphs/s  speedup {:.2f}x'.format(
+                name, threads, args.count / elapsed, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -37,6 +37,10 @@ The :mod:`lorem` module provides two different ways for getting random words.
 
       get_word(count=1, sep=' ', func=None, args=(), kwargs={}) -> str
 
+Transforms by attribute names of :obj:`str`, e.g. ``func='capitalize'``, are
+applied only once per distinct word and looked up afterwards, for a bounded
+number of words; so are customised functions declared ``pure=True``.
+
 Get Random Sentences
 --------------------
 
@@ -44,208 +48,4059 @@ The :mod:`lorem` module provides two different ways for getting random sentences
 
 1. :func:`sentence` -- generate a list of random sentences
 
-   .. code-block:: python
+   .. code-block:: python
+
+      sentence(count=1, comma=(0, 2), word_range=(4, 8)) -> Iterator[str]
+
+2. :func:`get_sentence` -- return random sentences
+
+   .. code-block:: python
+
+      get_sentence(count=1, sep=' ', comma=(0, 2), word_range=(4, 8)) -> Union[str]
+
+Get Random Paragraphs
+---------------------
+
+The :mod:`lorem` module provides two different ways for getting random paragraphs.
+
+1. :func:`paragraph` -- generate a list of random paragraphs
+
+   .. code-block:: python
+
+      paragraph(count=1, comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10)) -> Iterator[str]
+
+2. :func:`get_paragraph` -- return random paragraphs
+
+   .. code-block:: python
+
+      get_paragraph(count=1, sep=os.linesep, comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10)) -> Union[str]
+
+Both :func:`sentence` and :func:`paragraph` keep the ``count`` distinct items for
+cycling. For a large ``count``, pass ``regenerate=True`` to have each item rendered
+again from its own seed whenever it is due instead, so that memory usage stays
+constant however long the iterator lives.
+
+Get Random Text of Exact Size
+-----------------------------
+
+:func:`get_text` returns random text of exactly the given number of characters
+or UTF-8 bytes, ending on a sentence boundary.
+
+.. code-block:: python
+
+   get_text(size, unit='chars', sep=' ', comma=(0, 2), word_range=(4, 8), *, filler=' ') -> str
+
+For a single sentence, :meth:`LoremGenerator.gen_fitted` builds one of exactly the
+given size, or of a random size within a range, in one pass; sizes which cannot
+be built from the word pool are rejected up front.
+
+.. code-block:: python
+
+   LoremGenerator().gen_fitted(24)
+   LoremGenerator().gen_fitted((40, 60))
+
+Stream Random Text
+------------------
+
+To produce bulk text without building it in memory, :func:`write_text` writes
+random words, sentences or paragraphs to a text or binary file object in
+fixed-size chunks, until a given count or size budget is reached.
+
+.. code-block:: python
+
+   write_text(fileobj, count=None, size=None, *, kind='paragraph', sep=None,
+              comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10)) -> int
+
+To make use of multiple cores, :func:`write_parallel` splits the text into shards,
+each generated by a worker process with its own seed derived from ``seed``, and
+writes them in order, so that the output does not depend on the number of workers.
+
+.. code-block:: python
+
+   write_parallel(fileobj, count=None, size=None, *, kind='paragraph', sep=None,
+                  comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10),
+                  jobs=None, shard_count=10000) -> int
+
+Where a file object is expected instead, :class:`LoremStream` is a read-only binary
+stream of random paragraphs, of a given size or unbounded, which fills the buffers
+passed to :meth:`~LoremStream.readinto` in constant memory.
+
+.. code-block:: python
+
+   requests.put(url, data=LoremStream(size=1 << 30))
+
+To fill send buffers in place, :meth:`LoremGenerator.gen_into` renders text from
+pre-encoded words directly in UTF-8, and writes whole items into a caller-supplied
+:obj:`bytearray` or :obj:`memoryview`, returning the number of bytes filled.
+
+.. code-block:: python
+
+   buffer = bytearray(1 << 16)
+   filled = LoremGenerator().gen_into(buffer, kind='paragraph', sep=b'\\n')
+
+Generate Records
+----------------
+
+To load test databases, :class:`RecordGenerator` generates records from a schema,
+where each column is a lorem spec, in batches column by column rather than one
+call per cell. Records can be written as CSV or JSON Lines with a single write per
+batch, or loaded into SQLite with :meth:`~sqlite3.Cursor.executemany`, a transaction
+per batch; the rows per second are reported.
+
+.. code-block:: python
+
+   records = RecordGenerator({'name': {'kind': 'word', 'count': (1, 3)},
+                              'title': 'sentence', 'body': 'paragraph'})
+   with open('records.csv', 'w', newline='') as file:
+       records.write_csv(file, 1_000_000)
+   records.load_sqlite('load.db', 'posts', 1_000_000)
+
+Word Distributions
+------------------
+
+By default, words are drawn uniformly from a shuffle bag. To make the text look
+more like natural language, words may be sampled from a weighted distribution
+instead, e.g. by Zipf's law, where the *k*-th word of the pool is the *k*-th most
+frequent.
+
+.. code-block:: python
+
+   get_paragraph(weights='zipf', exponent=1.1)
+   get_sentence(pool=['lorem', 'ipsum'], weights=[3, 1])
+
+Markov Chain Text
+-----------------
+
+For text with realistic word co-occurrence, a :class:`MarkovModel` can be trained
+from a corpus, saved and loaded, and walked by a :class:`MarkovLoremGenerator`.
+
+.. code-block:: python
+
+   with open('corpus.txt') as file:
+       model = MarkovModel.train(file, order=2)
+   model.save('model.bin')
+
+   gen = MarkovLoremGenerator(MarkovModel.load('model.bin'))
+   gen.gen_paragraph(comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10))
+
+Large Vocabularies
+------------------
+
+Word pools of millions of words can be kept in a word list file, which is mapped
+into memory by :class:`MappedPool` and shared by all processes using it. Words are
+decoded only when drawn.
+
+.. code-block:: python
+
+   with open('words.txt') as file:
+       pool = MappedPool.build(file, 'words.bin')
+   get_paragraph(pool=pool)
+
+Cache Rendered Text
+-------------------
+
+When freshly sampled text is not needed for every request, a
+:class:`FragmentCache` keeps a bounded reservoir of pre-rendered sentences and
+paragraphs, which are then reused in random order.
+
+.. code-block:: python
+
+   cache = FragmentCache(size=1024, refresh=0.01, maxsize=64 << 20)
+   get_paragraph(count=3, cache=cache)
+
+Instrumentation
+---------------
+
+To find out where the time goes, pass :class:`GeneratorStats` to a generator, or
+to any of the generation functions. Words, sentences, paragraphs, reshuffles,
+random draws and bytes are counted, and each stage is timed; the numbers can be
+polled by :meth:`GeneratorStats.snapshot`, or pushed to a callback. Generators
+without statistics are not instrumented at all.
+
+.. code-block:: python
+
+   stats = GeneratorStats(callback=export, interval=10.0)
+   get_paragraph(count=3, stats=stats)
+
+Token Arrays
+------------
+
+For machine learning pipelines consuming token IDs, :meth:`LoremGenerator.gen_tokens`
+draws whole batches of paragraphs as :mod:`numpy` arrays, i.e. indices of the words
+into the word pool, with offsets of the sentences and paragraphs in compressed sparse
+row form, see :class:`TokenBatch`; :meth:`LoremGenerator.render_tokens` renders them
+to text when strings are needed. :mod:`numpy` is an optional dependency.
+
+.. code-block:: python
+
+   gen = LoremGenerator(seed=42)
+   batch = gen.gen_tokens(count=1000)
+   texts = gen.render_tokens(batch)
+
+Random Access
+-------------
+
+Every word, sentence and paragraph of a seeded generator can also be generated
+from its index alone, through a random number generator seeded with a hash of
+the seed and the index, rather than the state of the sequential text. Thus a
+worker may generate any range of paragraphs without the ones before them.
+
+.. code-block:: python
+
+   gen = LoremGenerator(seed=42)
+   texts = [gen.paragraph_at(index) for index in range(start, start + 1000)]
+
+Checkpoint and Resume
+---------------------
+
+Long-running jobs can save where they are and resume later with the exact same
+text. :meth:`LoremGenerator.getstate` returns the state of the random number
+generator and the position in the word pool, which :meth:`LoremGenerator.setstate`
+restores; generators, as well as the iterators returned from :func:`sentence` and
+:func:`paragraph`, can also be pickled as a whole.
+
+.. code-block:: python
+
+   paragraphs = paragraph(count=1000, seed=42)
+   ...
+   with open('checkpoint.pickle', 'wb') as file:
+       pickle.dump(paragraphs, file)
+
+Thread Safety
+-------------
+
+A :class:`LoremGenerator` instance shall not be shared among threads. Instead,
+:class:`ThreadLocalLoremGenerator` keeps a separate shuffle bag and random number
+generator for each thread, all derived from a single ``seed``, so that it can be
+shared by a thread pool without any locking on the hot path.
+
+.. code-block:: python
+
+   gen = ThreadLocalLoremGenerator(seed=42)
+   with concurrent.futures.ThreadPoolExecutor() as executor:
+       texts = list(executor.map(lambda _: gen.gen_sentence((0, 2), (4, 8)), range(1000)))
+
+Asynchronous Generation
+-----------------------
+
+For use in :mod:`asyncio` applications, :func:`aword`, :func:`asentence` and
+:func:`aparagraph` are asynchronous generators mirroring their synchronous
+counterparts, which return control to the event loop whenever a chunk of text
+has been generated; and :func:`awrite_text` writes random text to a stream
+writer, awaiting ``drain()`` after each chunk.
+
+.. code-block:: python
+
+   async for text in aparagraph(count=3):
+       ...
+   await awrite_text(writer, size=1 << 20)
+
+Command Line Interface
+----------------------
+
+The :mod:`lorem` module can also be run as a script (or as the ``lorem``
+command), which streams random text to standard output::
+
+    python -m lorem paragraph --bytes 10G --seed 42 > corpus.txt
+
+"""
+import argparse
+import array
+import asyncio
+import bisect
+import codecs
+import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import copy
+import csv
+import functools
+import hashlib
+import inspect
+import io
+import itertools
+import json
+import math
+import mmap
+import operator
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, cast
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from random import Random
+    from sqlite3 import Connection
+    from typing import (IO, Any, AsyncIterator, Callable, Deque, Dict, Generator, Hashable,
+                        Iterable, Iterator, List, Mapping, Optional, Sequence)
+
+    from typing_extensions import Literal
+
+    #: Kind of text to be generated.
+    Kind = Literal['word', 'sentence', 'paragraph']
+    #: Unit of text size.
+    Unit = Literal['chars', 'bytes']
+    #: Named distribution of words.
+    Distribution = Literal['uniform', 'zipf']
+    #: Seed of a random number generator, see :meth:`random.Random.seed`.
+    Seed = int | float | str | bytes | bytearray
+    #: Column of records, i.e. kind of text, optionally with its options.
+    Column = Kind | Dict[str, Any]
+
+__all__ = [
+    'LoremGenerator', 'ThreadLocalLoremGenerator', 'FragmentCache',
+    'MarkovModel', 'MarkovLoremGenerator', 'MappedPool', 'GeneratorStats',
+    'LoremStream', 'TokenBatch', 'RecordGenerator',
+    'word', 'sentence', 'paragraph',
+    'get_word', 'get_sentence', 'get_paragraph',
+    'get_text', 'write_text', 'write_parallel',
+    'aword', 'asentence', 'aparagraph', 'awrite_text',
+]
+
+# version string
+__version__ = '1.3.0.post3'
+
+#: The original lorem ipsum text pool.
+_TEXT = ('ad', 'adipiscing', 'aliqua', 'aliquip', 'amet', 'anim', 'aute', 'cillum', 'commodo',
+         'consectetur', 'consequat', 'culpa', 'cupidatat', 'deserunt', 'do', 'dolor', 'dolore',
+         'duis', 'ea', 'eiusmod', 'elit', 'enim', 'esse', 'est', 'et', 'eu', 'ex', 'excepteur',
+         'exercitation', 'fugiat', 'id', 'in', 'incididunt', 'ipsum', 'irure', 'labore', 'laboris',
+         'laborum', 'lorem', 'magna', 'minim', 'mollit', 'nisi', 'non', 'nostrud', 'nulla',
+         'occaecat', 'officia', 'pariatur', 'proident', 'qui', 'quis', 'reprehenderit', 'sed',
+         'sint', 'sit', 'sunt', 'tempor', 'ullamco', 'ut', 'velit', 'veniam', 'voluptate')
+
+#: Number of fair coin flips drawn at once when planning commas.
+_COIN_BITS = 60
+#: Batches of coin flips, where a set bit means not to include further commas.
+_COINS = range(1 << _COIN_BITS)
+#: Maximum number of sentences planned with a single random integer.
+_PLAN_BATCH = 64
+#: Maximum number of compiled word pools kept by :func:`_compile_pool`.
+_POOL_CACHE_SIZE = 64
+#: Maximum number of words kept by each table of transformed words.
+_TRANSFORM_SIZE = 1 << 14
+#: Minimum size of word pools whose first shuffle bag is drawn lazily.
+_LAZY_BAG = 16
+#: Maximum number of words sampled at once from weighted word pools.
+_SAMPLE_BATCH = 1024
+#: Maximum number of entries in a sentence structure table.
+_TABLE_SIZE = 1 << 14
+#: Size of chunks written to file objects.
+_BUFFER_SIZE = 1 << 20
+#: Size of text generated before returning control to the event loop.
+_ASYNC_CHUNK_SIZE = 1 << 16
+#: Time spent generating text before returning control to the event loop.
+_ASYNC_CHUNK_TIME = 0.005
+#: Default number of non-repeated paragraphs cycled by a :class:`LoremStream`.
+_STREAM_COUNT = 100
+#: Default number of rows generated at once by a :class:`RecordGenerator`.
+_RECORD_BATCH = 1024
+#: Options of each kind of column of a :class:`RecordGenerator`, with default values.
+_COLUMN_OPTIONS = {
+    'word': {'count': 1, 'sep': ' '},
+    'sentence': {'count': 1, 'sep': ' ', 'comma': (0, 2), 'word_range': (4, 8)},
+    'paragraph': {'count': 1, 'sep': os.linesep, 'comma': (0, 2), 'word_range': (4, 8),
+                  'sentence_range': (5, 10)},
+}  # type: Dict[str, Dict[str, Any]]
+#: Number of items in each shard for parallel generation.
+_SHARD_COUNT = 10000
+#: Default number of fragments kept for each key of a :class:`FragmentCache`.
+_CACHE_SIZE = 1024
+#: Default maximum number of keys of a :class:`FragmentCache`.
+_CACHE_KEYS = 128
+#: Pattern of words when training a :class:`MarkovModel`.
+_TOKEN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+#: Magic number of saved :class:`MarkovModel` files.
+_MARKOV_MAGIC = b'LOREMMKV'
+#: Version of saved :class:`MarkovModel` files.
+_MARKOV_VERSION = 1
+#: Header of saved :class:`MarkovModel` files, i.e. magic number, version, byte order,
+#: order of the model, and sizes of the vocabulary, the states and the transitions.
+_MARKOV_HEADER = struct.Struct('<8sBcBxQQQ')
+#: Magic number of :class:`MappedPool` files.
+_MAPPED_MAGIC = b'LOREMWRD'
+#: Header of :class:`MappedPool` files, i.e. magic number, number of words and size
+#: of the UTF-8 encoded words, followed by the words and their offsets.
+_MAPPED_HEADER = struct.Struct('<8sQQ')
+#: Binary multiples of size suffixes for the command line interface.
+_SIZE_UNITS = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+
+def _get_rng(seed: 'Optional[Seed]' = None, rng: 'Optional[Random]' = None) -> 'Random':
+    """Return the random number generator to draw from.
+
+    Args:
+        seed: Seed for an isolated :class:`random.Random` instance.
+        rng: Random number generator to be used as is, takes precedence over ``seed``.
+
+    Returns:
+        The given ``rng``, or a new :class:`random.Random` instance seeded with ``seed``.
+        If neither is given, the global :mod:`random` module is returned.
+
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)  # nosec B311
+    return cast('Random', random)
+
+
+def _get_pool(pool: 'Iterable[str]') -> 'Sequence[str]':
+    """Return the compiled word pool.
+
+    Args:
+        pool: Words of the pool.
+
+    Returns:
+        The compiled word pool, see :func:`_compile_pool`. A :class:`MappedPool`
+        is used as is, so that its words are never loaded into memory.
+
+    Raises:
+        ValueError: If the pool is empty.
+
+    """
+    if isinstance(pool, MappedPool):
+        if not pool:
+            raise ValueError('word pool must not be empty')
+        return pool
+    return _compile_pool(pool if isinstance(pool, tuple) else tuple(pool))
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _compile_pool(words: 'tuple[str, ...]') -> 'tuple[str, ...]':
+    """Validate and prepare a word pool.
+
+    Compiled pools are cached by their content, so that a pool is validated only
+    once, and equal pools are deduplicated into the very same :obj:`tuple`.
+
+    Args:
+        words: Words of the pool.
+
+    Returns:
+        The compiled word pool.
+
+    Raises:
+        ValueError: If the pool is empty.
+        TypeError: If any of the words is not a :obj:`str`.
+
+    """
+    if not words:
+        raise ValueError('word pool must not be empty')
+    for text in words:
+        if not isinstance(text, str):
+            raise TypeError('words must be str, not {}'.format(type(text).__name__))
+    return words
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _index_lengths(words: 'tuple[str, ...]', unit: 'Unit') -> 'dict[int, list[str]]':
+    """Index words from a word pool by their sizes.
+
+    Args:
+        words: Words of the pool, as returned from :func:`_compile_pool`.
+        unit: Unit of the sizes, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+    Returns:
+        Mapping from sizes to the words of such size.
+
+    """
+    measure = _get_measure(unit)
+    index = {}  # type: dict[int, list[str]]
+    for text in words:
+        index.setdefault(measure(text), []).append(text)
+    return index
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _reachable_lengths(costs: 'tuple[int, ...]') -> 'tuple[bytes, int, int]':
+    """Find lengths reachable by sums of word costs.
+
+    A sentence of words whose sizes are ``size1, size2, ...`` is of length
+    ``(size1 + 1) + (size2 + 1) + ...``, counting the spaces and the full stop,
+    so a length is reachable if it is a sum of any number of costs ``size + 1``.
+    As lengths of the form ``gcd * n`` are all reachable once ``n`` is large
+    enough, only those below that bound are tabulated.
+
+    Args:
+        costs: Distinct costs of the words, in ascending order.
+
+    Returns:
+        Table of whether ``gcd * n`` is reachable for ``n`` below the bound, the
+        bound, and the greatest common divisor of the costs.
+
+    """
+    divisor = functools.reduce(math.gcd, costs)
+    steps = [cost // divisor for cost in costs]
+
+    table = bytearray(b'\x01')
+    run = 1
+    while run < steps[0]:
+        length = len(table)
+        table.append(any(table[length - step] for step in steps if step <= length))
+        run = run + 1 if table[-1] else 0
+    return bytes(table), len(table) - run, divisor
+
+
+class _Transformed(dict):
+    """Mapping from words to their transformed forms, computed on demand.
+
+    Up to :data:`_TRANSFORM_SIZE` words are kept, so that tables shared by all
+    generators stay bounded for large or lazily decoded word pools; further words
+    are transformed each time instead.
+
+    Args:
+        func: Transform function, or an attribute name of :obj:`str`.
+        args: Additional positional arguments for ``func``.
+        kwargs: Additional keyword arguments for ``func``.
+
+    """
+
+    __slots__ = ('func', 'args', 'kwargs')
+
+    def __init__(self, func: 'str | Callable[..., str]', args: 'tuple[Any, ...]',
+                 kwargs: 'dict[str, Any]') -> 'None':
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __missing__(self, text: 'str') -> 'str':
+        if isinstance(self.func, str):
+            value = getattr(text, self.func)(*self.args, **self.kwargs)  # type: str
+        else:
+            value = self.func(text, *self.args, **self.kwargs)
+        if len(self) < _TRANSFORM_SIZE:
+            self[text] = value
+        return value
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _transform_table(func: 'str | Callable[..., str]', args: 'tuple[Any, ...]',
+                     kwargs: 'tuple[tuple[str, Any], ...]') -> '_Transformed':
+    """Return the table of words transformed by a pure function.
+
+    Each distinct word is transformed only once, when first looked up, and the
+    table is shared by all generators.
+
+    Args:
+        func: Transform function, or an attribute name of :obj:`str`.
+        args: Additional positional arguments for ``func``.
+        kwargs: Additional keyword arguments for ``func``, as key-value pairs.
+
+    Returns:
+        Mapping from words to their transformed forms.
+
+    """
+    return _Transformed(func, args, dict(kwargs))
+
+
+def _get_transform(func: 'str | Callable[..., str]', args: 'tuple[Any, ...]',
+                   kwargs: 'dict[str, Any]') -> 'Optional[_Transformed]':
+    """Look up the table of words transformed by a pure function.
+
+    Args:
+        func: Transform function, or an attribute name of :obj:`str`.
+        args: Additional positional arguments for ``func``.
+        kwargs: Additional keyword arguments for ``func``.
+
+    Returns:
+        Mapping from words to their transformed forms, or :data:`None` if any
+        of the arguments is unhashable.
+
+    """
+    try:
+        return _transform_table(func, args, tuple(kwargs.items()))
+    except TypeError:
+        return None
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _encode_pool(words: 'tuple[str, ...]') -> 'tuple[dict[str, bytes], dict[bytes, bytes]]':
+    """Encode words from a word pool in UTF-8.
+
+    Args:
+        words: Words of the pool, as returned from :func:`_compile_pool`.
+
+    Returns:
+        Mappings from words to their encoded forms, and from the encoded forms to
+        those capitalized.
+
+    """
+    plain = {text: text.encode('utf-8') for text in words}
+    capital = {data: text.capitalize().encode('utf-8') for text, data in plain.items()}
+    return plain, capital
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _vocab_arrays(words: 'tuple[str, ...]') -> 'tuple[numpy.ndarray, numpy.ndarray]':
+    """Build :mod:`numpy` object arrays of words from a word pool.
+
+    Args:
+        words: Words of the pool, as returned from :func:`_compile_pool`.
+
+    Returns:
+        Arrays of the words and of their capitalized forms, indexed by token IDs.
+
+    """
+    plain = numpy.empty(len(words), dtype=object)
+    plain[:] = words
+    capital = numpy.empty(len(words), dtype=object)
+    capital[:] = [text.capitalize() for text in words]
+    return plain, capital
+
+
+class _Capitalized(dict):
+    """Mapping from encoded words to their capitalized forms, computed on demand."""
+
+    __slots__ = ()
+
+    def __missing__(self, data: 'bytes') -> 'bytes':
+        return str(data, 'utf-8').capitalize().encode('utf-8')
+
+
+def _get_weights(words: 'Sequence[str]', weights: 'Optional[str | Sequence[float]]',
+                 exponent: 'float' = 1.0) -> 'Optional[tuple[float, ...]]':
+    """Return the weights of words.
+
+    Args:
+        words: Words of the pool, as returned from :func:`_get_pool`.
+        weights: Weights of the words, or the name of a distribution, i.e. ``'uniform'``
+            or ``'zipf'``.
+        exponent: Exponent of the Zipf distribution.
+
+    Returns:
+        Weights of the words, or :data:`None` if not given.
+
+    Raises:
+        ValueError: If the distribution is unknown, or the weights are invalid, see
+            :func:`_alias_table`.
+
+    """
+    if weights is None:
+        return None
+    if weights == 'uniform':
+        return (1.0,) * len(words)
+    if weights == 'zipf':
+        return _zipf_weights(len(words), exponent)
+    if isinstance(weights, str):
+        raise ValueError('unknown distribution: {!r}'.format(weights))
+
+    weights = tuple(map(float, weights))
+    if len(weights) != len(words):
+        raise ValueError('expected {} weights, got {}'.format(len(words), len(weights)))
+    _alias_table(weights)  # validate and cache
+    return weights
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _zipf_weights(size: 'int', exponent: 'float') -> 'tuple[float, ...]':
+    """Weigh words by Zipf's law.
+
+    Args:
+        size: Number of words.
+        exponent: Exponent of the distribution.
+
+    Returns:
+        Weight of the word of rank *k*, i.e. ``1 / k ** exponent``.
+
+    """
+    return tuple(rank ** -exponent for rank in range(1, size + 1))
+
+
+@functools.lru_cache(maxsize=_POOL_CACHE_SIZE)
+def _alias_table(weights: 'tuple[float, ...]') -> 'tuple[tuple[float, ...], tuple[int, ...]]':
+    """Build the alias table of a discrete distribution.
+
+    The table is built in linear time with Vose's alias method. To sample from
+    the distribution, draw a uniformly random point from ``[0, len(weights))``;
+    let *i* be its integer part, the sample is *i* if the point is less than
+    ``cut[i]``, or ``alias[i]`` otherwise.
+
+    Args:
+        weights: Weights of the outcomes.
+
+    Returns:
+        The cut point and alias of each column.
+
+    Raises:
+        ValueError: If any of the weights is negative, or all of them are zero.
+
+    """
+    total = sum(weights)
+    if not total > 0 or min(weights) < 0:
+        raise ValueError('weights must be non-negative and not all zero')
+
+    size = len(weights)
+    prob = [weight * size / total for weight in weights]
+    alias = list(range(size))
+    small = [index for index, value in enumerate(prob) if value < 1.0]
+    large = [index for index, value in enumerate(prob) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large[-1]
+        alias[less] = more
+        prob[more] -= 1.0 - prob[less]
+        if prob[more] < 1.0:
+            small.append(large.pop())
+
+    # leftovers are due to rounding errors only
+    for index in itertools.chain(small, large):
+        prob[index] = 1.0
+    return tuple(index + value for index, value in enumerate(prob)), tuple(alias)
+
+
+@functools.lru_cache(maxsize=64)
+def _sentence_table(word_min: 'int', word_max: 'int',
+                    comma_min: 'int', comma_max: 'int') -> 'Optional[list[tuple[int, ...]]]':
+    """Tabulate all possible sentence structures.
+
+    The entry at index ``coins * radix + digit`` is the structure decoded from the
+    mixed radix ``digit`` and the ``coins`` flips of a sentence, in the very same
+    way as :meth:`LoremGenerator._plan` does.
+
+    Args:
+        word_min: Minimum number of words in each clause.
+        word_max: Maximum number of words in each clause.
+        comma_min: Minimum number of commas.
+        comma_max: Maximum number of commas.
+
+    Returns:
+        Number of words in each comma-separated clause of each possible sentence, or
+        :data:`None` if the ranges are invalid or the table would be too large.
+
+    """
+    word_radix = word_max - word_min + 1
+    comma_radix = comma_max - comma_min + 1
+    if word_radix <= 0 or comma_radix <= 0 or comma_max < 0:
+        return None
+
+    radix = comma_radix * word_radix ** (comma_max + 1)
+    if radix << comma_max > _TABLE_SIZE:
+        return None
+
+    interned = {}  # type: dict[tuple[int, ...], tuple[int, ...]]
+    table = []  # type: list[tuple[int, ...]]
+    for coins in range(1 << comma_max):
+        for digit in range(radix):
+            digit, words = divmod(digit, word_radix)
+            digit, commas = divmod(digit, comma_radix)
+
+            clauses = [max(word_min + words, 1)]
+            for index in range(comma_min + commas):
+                if coins >> index & 1:
+                    break
+                digit, words = divmod(digit, word_radix)
+                clauses.append(max(word_min + words, 0))
+            table.append(interned.setdefault(tuple(clauses), tuple(clauses)))
+    return table
+
+
+def _utf8_len(text: 'str') -> 'int':
+    """Return size of the text in UTF-8 encoding."""
+    return len(text.encode('utf-8'))
+
+
+def _get_measure(unit: 'Unit') -> 'Callable[[str], int]':
+    """Return the function to measure size of text.
+
+    Args:
+        unit: Unit of text size, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+    Returns:
+        Function to measure size of text.
+
+    Raises:
+        ValueError: If ``unit`` is unknown.
+
+    """
+    if unit == 'chars':
+        return len
+    if unit == 'bytes':
+        return _utf8_len
+    raise ValueError('unknown unit of text size: {!r}'.format(unit))
+
+
+def _is_binary(fileobj: 'object') -> 'bool':
+    """Check if the file object expects :obj:`bytes`.
+
+    Args:
+        fileobj: File object to be checked.
+
+    Returns:
+        Whether ``fileobj`` is a binary file object.
+
+    """
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+    if isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(fileobj, 'mode', '')
+
+
+def _truncate(data: 'str | bytes', size: 'int', encoding: 'str') -> 'str | bytes':
+    """Truncate text on a character boundary.
+
+    Args:
+        data: Text, or encoded text.
+        size: Maximum size of the text, in characters or in bytes.
+        encoding: Encoding of encoded text.
+
+    Returns:
+        The longest prefix of ``data`` of at most ``size``, which does not end
+        partway through a multi-byte character.
+
+    """
+    if isinstance(data, str):
+        return data[:size]
+    decoder = codecs.getincrementaldecoder(encoding)()
+    decoder.decode(data[:size])
+    return data[:size - len(decoder.getstate()[0])]
+
+
+def _chunked(items: 'Iterable[str]', sep: 'str', size: 'int') -> 'Iterator[str]':
+    """Join items and split the text into fixed-size chunks.
+
+    Args:
+        items: Items to be joined.
+        sep: Separator between each item.
+        size: Size of each chunk, except the last one which may be shorter.
+
+    Returns:
+        Chunks of the joined text.
+
+    """
+    items = iter(items)
+    for first in items:
+        break
+    else:
+        return
+
+    parts = [first]
+    length = len(first)
+    for item in items:
+        parts.append(sep)
+        parts.append(item)
+        length += len(sep) + len(item)
+        if length < size:
+            continue
+
+        text = ''.join(parts)
+        start = 0
+        while length - start >= size:
+            yield text[start:start + size]
+            start += size
+        parts = [text[start:]]
+        length -= start
+
+    if length:
+        yield ''.join(parts)
+
+
+def _group(items: 'list[str]', count: 'int', sizes: 'int | list[int]', sep: 'str') -> 'list[str]':
+    """Join consecutive items into groups.
+
+    Args:
+        items: Items to be grouped.
+        count: Number of groups.
+        sizes: Number of items in each group, or in all groups.
+        sep: Seperator between each item of a group.
+
+    Returns:
+        Joined groups.
+
+    """
+    if isinstance(sizes, int):
+        if sizes == 1:
+            return items
+        if sizes == 0:
+            return [''] * count
+        iterator = iter(items)
+        return list(map(sep.join, zip(*[iterator] * sizes)))
+    iterator = iter(items)
+    return [sep.join(itertools.islice(iterator, size)) for size in sizes]
+
+
+class _RandomCycle:
+    """Randomly cycle rendered items.
+
+    The items are rendered one at a time as they are first drawn, then kept and
+    cycled in a random order, reshuffled at the start of each cycle. Unlike a
+    generator, the iterator can be pickled, so that it can be resumed later.
+
+    Args:
+        render: Function rendering a new item.
+        count: Number of distinct items.
+        rng: Random number generator of the cycle order.
+
+    """
+
+    def __init__(self, render: 'Callable[..., Any]', count: 'int', rng: 'Random') -> 'None':
+        self._render = render
+        self._count = count
+        self._rng = rng
+        self._items = []  # type: list[Any]
+        self._index = 0
+
+    def __iter__(self) -> '_RandomCycle':
+        return self
+
+    def __next__(self) -> 'Any':
+        items = self._items
+        if len(items) < self._count:
+            items.append(self._render())
+            return items[-1]
+        if not items:
+            raise StopIteration
+
+        if not self._index:
+            self._rng.shuffle(items)
+        item = items[self._index]
+        self._index = (self._index + 1) % len(items)
+        return item
+
+    def __getstate__(self) -> 'dict[str, Any]':
+        state = self.__dict__.copy()
+        if state['_rng'] is random:
+            state['_rng'] = None
+        return state
+
+    def __setstate__(self, state: 'dict[str, Any]') -> 'None':
+        if state['_rng'] is None:
+            state['_rng'] = random
+        self.__dict__.update(state)
+
+
+class _SeededCycle(_RandomCycle):
+    """Randomly cycle items regenerated from their indices.
+
+    Unlike :class:`_RandomCycle`, no item is kept: each item is rendered from its
+    index whenever it is due. Each cycle visits the indices in the order of a random
+    affine permutation, i.e. ``(start + index * step) % count``, so that the order
+    takes constant memory as well.
+
+    Args:
+        render: Function rendering an item from its index, deterministically.
+        count: Number of distinct items.
+        rng: Random number generator of the cycle order.
+
+    """
+
+    def __init__(self, render: 'Callable[[int], Any]', count: 'int', rng: 'Random') -> 'None':
+        super().__init__(render, count, rng)
+        self._cycled = False
+        self._start = 0
+        self._step = 1
+
+    def __next__(self) -> 'Any':
+        count = self._count
+        if count <= 0:
+            raise StopIteration
+
+        if self._index == count:
+            self._index = 0
+            self._cycled = True
+        if self._cycled and not self._index:
+            step = 1
+            if count > 2:
+                step = self._rng.randrange(1, count)  # nosec B311
+                while math.gcd(step, count) != 1:
+                    step = self._rng.randrange(1, count)  # nosec B311
+            self._start = self._rng.randrange(count)  # nosec B311
+            self._step = step
+
+        index = (self._start + self._index * self._step) % count
+        self._index += 1
+        return self._render(index)
+
+
+def _render_seeded(lorem: 'LoremGenerator', seed: 'Optional[Seed]', method: 'str',
+                   args: 'tuple[Any, ...]', index: 'int') -> 'Any':
+    """Render an item from its own seed.
+
+    Args:
+        lorem: Generator to render the item, which owns its random number generator.
+        seed: Seed from which the seed of the item is derived.
+        method: Name of the generator method rendering the item.
+        args: Arguments of ``method``.
+        index: Index of the item.
+
+    Returns:
+        The rendered item.
+
+    """
+    lorem._restart(_derive_seed(seed, index))  # pylint: disable=protected-access
+    return getattr(lorem, method)(*args)
+
+
+class _SourceKey:
+    """Text source of a :class:`FragmentCache` key, hashed only once.
+
+    Hashing the text source, e.g. a word pool, takes time in proportion to its
+    vocabulary; the hash is thus computed once, instead of on each draw.
+
+    Args:
+        source: Hashable text source.
+
+    """
+
+    __slots__ = ('_source', '_hash')
+
+    def __init__(self, source: 'Hashable') -> 'None':
+        self._source = source
+        self._hash = hash(source)
+
+    def __hash__(self) -> 'int':
+        return self._hash
+
+    def __eq__(self, other: 'object') -> 'bool':
+        if not isinstance(other, _SourceKey):
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self._source == other._source)
+
+    def __reduce__(self) -> 'tuple[type[_SourceKey], tuple[Hashable]]':
+        # hash of strings differs between processes
+        return _SourceKey, (self._source,)
+
+
+class _Reservoir:
+    """Pre-rendered fragments of a :class:`FragmentCache` key."""
+
+    __slots__ = ('items', 'nbytes', 'credit', 'full')
+
+    def __init__(self) -> 'None':
+        #: Rendered fragments.
+        self.items = []  # type: list[str]
+        #: Memory used by the fragments.
+        self.nbytes = 0
+        #: Accumulated number of fragments to be refreshed.
+        self.credit = 0.0
+        #: If no more fragments shall be added.
+        self.full = False
+
+
+class FragmentCache:
+    """Cache of pre-rendered sentences and paragraphs.
+
+    For each key, i.e. the word pool and the ranges of a kind of text, up to ``size``
+    fragments are rendered on demand; once the reservoir is full, fragments are reused
+    in random order, whilst a ``refresh`` fraction of the draws are replaced with
+    freshly rendered ones. Keys are evicted in least recently used order when there
+    are more than ``maxkeys`` of them, or when the total memory of the fragments
+    exceeds ``maxsize`` bytes.
+
+    The cache is not thread-safe, and shall not be shared among threads.
+
+    Args:
+        size: Maximum number of fragments for each key.
+        refresh: Fraction of draws to be freshly rendered once the reservoir is full,
+            from ``0.0`` (never) to ``1.0`` (always).
+        maxkeys: Maximum number of keys.
+        maxsize: Memory budget of all fragments in bytes, as measured by the size
+            of the fragments in UTF-8. By default, the memory is unbounded.
+
+    Raises:
+        ValueError: If any of the arguments is out of range.
+
+    """
+
+    @property
+    def size(self) -> 'int':
+        """Return the maximum number of fragments for each key."""
+        return self._size
+
+    @property
+    def refresh(self) -> 'float':
+        """Return the fraction of draws to be freshly rendered."""
+        return self._refresh
+
+    @property
+    def nbytes(self) -> 'int':
+        """Return the memory used by all fragments in bytes."""
+        return self._nbytes
+
+    def __init__(self, size: 'int' = _CACHE_SIZE, refresh: 'float' = 0.0, *,
+                 maxkeys: 'int' = _CACHE_KEYS, maxsize: 'Optional[int]' = None) -> 'None':
+        if size < 1:
+            raise ValueError('size must be positive: {!r}'.format(size))
+        if not 0.0 <= refresh <= 1.0:
+            raise ValueError('refresh must be between 0.0 and 1.0: {!r}'.format(refresh))
+        if maxkeys < 1:
+            raise ValueError('maxkeys must be positive: {!r}'.format(maxkeys))
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must not be negative: {!r}'.format(maxsize))
+
+        self._size = size
+        self._refresh = refresh
+        self._maxkeys = maxkeys
+        self._maxsize = maxsize
+
+        self._nbytes = 0
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict[Hashable, _Reservoir]
+
+    def __len__(self) -> 'int':
+        return len(self._entries)
+
+    def __contains__(self, key: 'Hashable') -> 'bool':
+        return key in self._entries
+
+    def clear(self) -> 'None':
+        """Remove all fragments."""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def draw(self, key: 'Hashable', factory: 'Callable[[], str]', rng: 'Random') -> 'str':
+        """Draw a fragment.
+
+        Args:
+            key: Key of the fragments.
+            factory: Function to render a fresh fragment.
+            rng: Random number generator to choose and refresh fragments.
+
+        Returns:
+            A fresh fragment, if the reservoir is not yet full or the drawn fragment
+            is to be refreshed; otherwise, a random fragment from the reservoir.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Reservoir()
+            while len(self._entries) > self._maxkeys:
+                self._evict()
+        else:
+            self._entries.move_to_end(key)
+
+        items = entry.items
+        if not entry.full:
+            text = factory()
+            items.append(text)
+            self._resize(entry, _utf8_len(text))
+            entry.full = entry.full or len(items) >= self._size
+            return text
+
+        index = rng.randrange(len(items))  # nosec B311
+        if self._refresh:
+            entry.credit += self._refresh
+            if entry.credit >= 1.0:
+                entry.credit -= 1.0
+                text = factory()
+                delta = _utf8_len(text) - _utf8_len(items[index])
+                items[index] = text
+                self._resize(entry, delta)
+                return text
+        return items[index]
+
+    def _resize(self, entry: '_Reservoir', delta: 'int') -> 'None':
+        """Account for memory of fragments, and evict keys beyond the memory budget.
+
+        If the reservoir in use alone is beyond the budget, its last fragments are
+        dropped until it fits, and no more fragments are added to it.
+
+        Args:
+            entry: The reservoir in use, which is never evicted.
+            delta: Change of memory of the reservoir in bytes.
+
+        """
+        entry.nbytes += delta
+        self._nbytes += delta
+        if self._maxsize is None:
+            return
+
+        while self._nbytes > self._maxsize and len(self._entries) > 1:
+            self._evict()
+        if self._nbytes > self._maxsize:
+            items = entry.items
+            while self._nbytes > self._maxsize and items:
+                size = _utf8_len(items.pop())
+                entry.nbytes -= size
+                self._nbytes -= size
+            entry.full = bool(items)
+
+    def _evict(self) -> 'None':
+        """Evict the least recently used key."""
+        _, entry = self._entries.popitem(last=False)
+        self._nbytes -= entry.nbytes
+
+
+class MappedPool(collections.abc.Sequence):
+    """Word pool backed by a memory-mapped word list file.
+
+    The file, as written by :meth:`build`, holds the UTF-8 encoded words in a
+    single buffer, followed by the offsets of each word. It is mapped into memory
+    read-only, so that multiple processes share the very same pages without
+    copying, and words are decoded only when accessed. When pickled, e.g. to be
+    sent to worker processes of :func:`write_parallel`, only the path is kept and
+    the file is mapped again on unpickling. The pool is a read-only
+    :class:`~collections.abc.Sequence` of the words, of which slices are lists.
+
+    Args:
+        path: Path to the word list file.
+
+    Raises:
+        ValueError: If the file is not a word list file.
+
+    """
+
+    @property
+    def path(self) -> 'str':
+        """Return the path to the word list file."""
+        return self._path
+
+    def __init__(self, path: 'str | os.PathLike[str]') -> 'None':
+        self._path = os.fspath(path)
+        with open(self._path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, count, size = _MAPPED_HEADER.unpack_from(self._mmap)
+            start = _MAPPED_HEADER.size + size + (-size % 8)
+            if magic != _MAPPED_MAGIC or len(self._mmap) != start + 8 * (count + 1):
+                raise ValueError('not a word list file: {!r}'.format(self._path))
+        except (struct.error, ValueError):
+            self._mmap.close()
+            raise
+
+        self._data = memoryview(self._mmap)[_MAPPED_HEADER.size:_MAPPED_HEADER.size + size]
+        offsets = memoryview(self._mmap)[start:]
+        if sys.byteorder == 'little':
+            self._offsets = offsets.cast('Q')  # type: Sequence[int]
+        else:  # pragma: no cover
+            self._offsets = array.array('Q', offsets)
+            self._offsets.byteswap()
+            offsets.release()
+        self._count = count
+
+    def __len__(self) -> 'int':
+        return self._count
+
+    def __getitem__(self, index: 'Any') -> 'Any':
+        if isinstance(index, slice):
+            return list(map(self.__getitem__, range(*index.indices(self._count))))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('word index out of range')
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    def __iter__(self) -> 'Iterator[str]':
+        return map(self.__getitem__, range(self._count))
+
+    def __reduce__(self) -> 'tuple[type[MappedPool], tuple[str]]':
+        return type(self), (self._path,)
+
+    def __enter__(self) -> 'MappedPool':
+        return self
+
+    def __exit__(self, *args: 'Any') -> 'None':
+        self.close()
+
+    def close(self) -> 'None':
+        """Unmap the word list file."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._data.release()
+        self._mmap.close()
+
+    @classmethod
+    def build(cls, words: 'Iterable[str]', path: 'str | os.PathLike[str]') -> 'MappedPool':
+        """Write a word list file.
+
+        Args:
+            words: Words of the pool, e.g. lines of a file, where leading and trailing
+                whitespaces are stripped and blank lines are ignored.
+            path: Path to the word list file.
+
+        Returns:
+            The word pool mapped from the file written.
+
+        """
+        offsets = array.array('Q', [0])
+        with open(path, 'wb') as file:
+            file.write(_MAPPED_HEADER.pack(_MAPPED_MAGIC, 0, 0))
+            for text in words:
+                text = text.strip()
+                if text:
+                    offsets.append(offsets[-1] + file.write(text.encode('utf-8')))
+
+            size = offsets[-1]
+            file.write(bytes(-size % 8))
+            if sys.byteorder != 'little':  # pragma: no cover
+                offsets.byteswap()
+            offsets.tofile(file)
+
+            file.seek(0)
+            file.write(_MAPPED_HEADER.pack(_MAPPED_MAGIC, len(offsets) - 1, size))
+        return cls(path)
+
+
+class GeneratorStats:
+    """Statistics of text generation.
+
+    Once passed to a :class:`LoremGenerator`, the generator is instrumented to
+    count:
+
+    * ``words`` -- words drawn from the word pool
+    * ``sentences`` -- sentences rendered, including those of paragraphs
+    * ``paragraphs`` -- paragraphs generated
+    * ``reshuffles`` -- shuffles of the shuffle bag
+    * ``draws`` -- calls to the random number generator, and numbers drawn by shuffles
+    * ``bytes`` -- size in UTF-8 of the words, sentences and paragraphs generated
+
+    and to time (inclusively, in seconds) the stages of ``plan`` and ``render``,
+    ``shuffle``, and the generation of each ``word``, ``sentence`` and ``paragraph``.
+    Generators without statistics are not instrumented at all, thus cost nothing.
+
+    The same statistics may be shared by multiple generators, but not among threads.
+
+    Args:
+        callback: Function to be called with :meth:`snapshot` after generation.
+        interval: Minimum interval between calls to ``callback`` in seconds.
+
+    """
+
+    def __init__(self, callback: 'Optional[Callable[[Dict[str, Any]], Any]]' = None,
+                 interval: 'float' = 0.0) -> 'None':
+        self._callback = callback
+        self._interval = interval
+        self._last = time.monotonic()
+
+        self._counts = collections.Counter()  # type: collections.Counter[str]
+        self._times = collections.defaultdict(float)  # type: collections.defaultdict[str, float]
+        self._vocab = 0
+
+    def snapshot(self) -> 'Dict[str, Any]':
+        """Return the statistics.
+
+        Returns:
+            Counts and times of each stage, as described above, and the size of
+            the largest word pool in use.
+
+        """
+        return {
+            'counts': dict(self._counts),
+            'times': dict(self._times),
+            'vocab': self._vocab,
+        }
+
+    def reset(self) -> 'None':
+        """Reset all statistics."""
+        self._counts.clear()
+        self._times.clear()
+
+    def _instrument(self, gen: 'LoremGenerator') -> 'None':
+        """Instrument a generator.
+
+        Hot-path methods are wrapped and set on the instance, shadowing those of
+        the class, and the random number generator is wrapped by :class:`_CountingRandom`.
+
+        Args:
+            gen: The generator to be instrumented.
+
+        """
+        self._vocab = max(self._vocab, len(gen._text))  # pylint: disable=protected-access
+        gen._rng = _CountingRandom(gen._rng, self)  # pylint: disable=protected-access
+
+        counts = self._counts
+        times = self._times
+        perf_counter = time.perf_counter
+
+        def timed(stage: 'str', func: 'Callable[..., Any]', count: 'Optional[str]' = None,
+                  output: 'bool' = False) -> 'Callable[..., Any]':
+            def wrapper(*args: 'Any', **kwargs: 'Any') -> 'Any':
+                start = perf_counter()
+                result = func(*args, **kwargs)
+                times[stage] += perf_counter() - start
+                if count is not None:
+                    counts[count] += 1
+                if output:
+                    counts['bytes'] += _utf8_len(result)
+                    self._notify()
+                return result
+            return functools.update_wrapper(wrapper, func)
+
+        plan = timed('plan', gen._plan)  # pylint: disable=protected-access
+
+        def count_plan(count: 'int', *args: 'Any', **kwargs: 'Any') -> 'list[Sequence[int]]':
+            counts['sentences'] += count
+            return plan(count, *args, **kwargs)
+
+        # pylint: disable=protected-access
+        gen._plan = functools.update_wrapper(count_plan, plan)  # type: ignore[method-assign]
+        gen._render = timed('render', gen._render)  # type: ignore[method-assign]
+        gen.gen_word = timed('word', gen.gen_word, output=True)  # type: ignore[method-assign]
+        gen.gen_sentence = timed('sentence', gen.gen_sentence, output=True)  # type: ignore[method-assign]
+        gen.gen_paragraph = timed('paragraph', gen.gen_paragraph, 'paragraphs', True)  # type: ignore[method-assign]
+
+    def _count_words(self, pool: 'Iterator[str]') -> 'Iterator[str]':
+        """Count words drawn from the word pool.
+
+        Args:
+            pool: The word pool.
+
+        Returns:
+            The word pool.
+
+        """
+        counts = self._counts
+        for text in pool:
+            counts['words'] += 1
+            yield text
+
+    def _notify(self) -> 'None':
+        """Call the callback, if the interval has passed."""
+        if self._callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last >= self._interval:
+            self._last = now
+            self._callback(self.snapshot())
+
+
+class _CountingRandom(random.Random):
+    """Random number generator counting its draws for :class:`GeneratorStats`.
+
+    Every primitive the library draws with is counted, and the other methods of
+    :class:`random.Random` draw through them. The state of the generator, i.e.
+    :meth:`seed`, :meth:`getstate` and :meth:`setstate`, is that of ``rng``.
+
+    Args:
+        rng: The random number generator to draw from.
+        stats: The statistics.
+
+    """
+
+    def __new__(cls, rng: 'Random', stats: 'GeneratorStats') -> '_CountingRandom':  # pylint: disable=unused-argument
+        return super().__new__(cls)
+
+    def __init__(self, rng: 'Random', stats: 'GeneratorStats') -> 'None':  # pylint: disable=super-init-not-called
+        self._rng = rng
+        self._counts = stats._counts  # pylint: disable=protected-access
+        self._times = stats._times  # pylint: disable=protected-access
+        self.gauss_next = None  # type: Optional[float]
+
+    def seed(self, *args: 'Any', **kwargs: 'Any') -> 'None':
+        """Reseed the wrapped random number generator."""
+        self._rng.seed(*args, **kwargs)
+
+    def getstate(self) -> 'Any':
+        """Return the state of the wrapped random number generator."""
+        return self._rng.getstate()
+
+    def setstate(self, state: 'Any') -> 'None':
+        """Restore the state of the wrapped random number generator."""
+        self._rng.setstate(state)
+
+    def random(self) -> 'float':
+        """Counted :meth:`random.Random.random`."""
+        self._counts['draws'] += 1
+        return self._rng.random()  # nosec B311
+
+    def randint(self, a: 'int', b: 'int') -> 'int':
+        """Counted :meth:`random.Random.randint`."""
+        self._counts['draws'] += 1
+        return self._rng.randint(a, b)  # nosec B311
+
+    def randrange(self, *args: 'Any') -> 'int':
+        """Counted :meth:`random.Random.randrange`."""
+        self._counts['draws'] += 1
+        return self._rng.randrange(*args)  # nosec B311
+
+    def getrandbits(self, k: 'int') -> 'int':
+        """Counted :meth:`random.Random.getrandbits`."""
+        self._counts['draws'] += 1
+        return self._rng.getrandbits(k)  # nosec B311
+
+    def choice(self, seq: 'Any') -> 'Any':
+        """Counted :meth:`random.Random.choice`."""
+        self._counts['draws'] += 1
+        return self._rng.choice(seq)  # nosec B311
+
+    def shuffle(self, x: 'Any') -> 'None':
+        """Counted and timed :meth:`random.Random.shuffle`."""
+        start = time.perf_counter()
+        self._rng.shuffle(x)
+        self._times['shuffle'] += time.perf_counter() - start
+        self._counts['reshuffles'] += 1
+        self._counts['draws'] += max(len(x) - 1, 0)
+
+
+class TokenBatch(collections.namedtuple('TokenBatch', ['words', 'commas', 'sentences', 'paragraphs'])):
+    """Batch of random paragraphs as token IDs, see :meth:`LoremGenerator.gen_tokens`.
+
+    The structure is kept in compressed sparse row (CSR) form: the words of the
+    *i*-th sentence are ``words[sentences[i]:sentences[i + 1]]``, and the sentences
+    of the *j*-th paragraph are those from ``paragraphs[j]`` to ``paragraphs[j + 1]``.
+
+    Attributes:
+        words: Indices of the words into the word pool.
+        commas: Number of commas following each word.
+        sentences: Offsets of the sentences into ``words``.
+        paragraphs: Offsets of the paragraphs into ``sentences``.
+
+    """
+
+    __slots__ = ()
+
+
+class LoremGenerator:
+    """Generate random words.
+
+    Args:
+        pool: List of words to be used as random word pool.
+        dupe: Deprecated, the word pool is no longer duplicated. Kept for
+            backward compatibility only.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+            By default, the global :mod:`random` module is used.
+        cache: Cache of pre-rendered sentences and paragraphs to draw from. By default,
+            every sentence and paragraph is freshly rendered.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'`` (where the *k*-th word of ``pool`` is the *k*-th
+            most frequent). Words are then sampled independently through an alias
+            table, in constant time each. By default, words are drawn from a shuffle
+            bag, i.e. uniformly without repeats.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`. By default,
+            the generator is not instrumented.
+
+    """
+
+    @property
+    def pool(self) -> 'Iterator[str]':
+        """Return the current random word pool."""
+        return self._pool
+
+    @property
+    def rng(self) -> 'Random':
+        """Return the random number generator."""
+        return self._rng
+
+    @property
+    def cache(self) -> 'Optional[FragmentCache]':
+        """Return the cache of pre-rendered sentences and paragraphs."""
+        return self._cache
+
+    @property
+    def weights(self) -> 'Optional[tuple[float, ...]]':
+        """Return the weights of the words, if any."""
+        return self._weights
+
+    @property
+    def seed(self) -> 'Optional[Seed]':
+        """Return the seed of the generator, if any."""
+        return self._seed
+
+    def __init__(self, pool: 'Iterable[str]' = _TEXT, dupe: 'int' = 1, *,
+                 seed: 'Optional[Seed]' = None, rng: 'Optional[Random]' = None,
+                 cache: 'Optional[FragmentCache]' = None,
+                 weights: 'Optional[Distribution | Sequence[float]]' = None,
+                 exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None) -> 'None':
+        self._seed = seed
+        self._counter = None  # type: Optional[LoremGenerator]
+        self._rng = _get_rng(seed, rng)
+        self._text = _get_pool(pool)
+        self._weights = _get_weights(self._text, weights, exponent)
+        self._source = _SourceKey((self._text, self._weights))
+        if stats is not None:
+            stats._instrument(self)  # pylint: disable=protected-access
+        self._chunk = None  # type: Optional[tuple[list[str], Iterator[str]]]
+        self._pool = self._gen_pool(dupe)
+        if stats is not None:
+            self._pool = stats._count_words(self._pool)  # pylint: disable=protected-access
+        self._cache = cache
+        self._stats = stats
+        self._transform = (None, (), {}, None)  # type: tuple[Any, Any, Any, Optional[_Transformed]]
+        self._derived = {}  # type: dict[Hashable, tuple[Sequence[str], Any]]
+
+    def _restart(self, seed: 'Seed') -> 'None':
+        """Restart the generator from a seed.
+
+        The random number generator is reseeded and the word pool is started over,
+        so that the text generated afterwards depends on ``seed`` only. The generator
+        shall own its random number generator, i.e. created with ``seed``.
+
+        Args:
+            seed: Seed to restart from.
+
+        """
+        self.rng.seed(seed)
+        self._pool = self._gen_pool()
+        if self._stats is not None:
+            self._pool = self._stats._count_words(self._pool)  # pylint: disable=protected-access
+
+    def _fork(self, seed: 'Seed') -> 'LoremGenerator':
+        """Create a generator of the same word pool with its own seed.
+
+        Args:
+            seed: Seed of the new generator.
+
+        Returns:
+            The new generator, without cache or statistics.
+
+        """
+        return LoremGenerator(self._text, seed=seed, weights=self._weights)
+
+    def _derive(self, key: 'Hashable', factory: 'Callable[[Any], Any]') -> 'Any':
+        """Return data derived from the text pool, cached by the generator.
+
+        Looking up the module-level caches, e.g. :func:`_encode_pool`, hashes the
+        whole text pool each time; the data is thus looked up once and kept until
+        the text pool is replaced.
+
+        Args:
+            key: Key of the data.
+            factory: Function deriving the data from the text pool.
+
+        Returns:
+            The derived data.
+
+        """
+        cached = self._derived.get(key)
+        if cached is not None and cached[0] is self._text:
+            return cached[1]
+        value = factory(self._text)
+        self._derived[key] = (self._text, value)
+        return value
+
+    def _get_counter(self) -> 'LoremGenerator':
+        """Return the generator rendering items from their indices.
+
+        It is forked from this generator on first use, so that random access does
+        not disturb the sequential text. If the generator was not created with a
+        ``seed``, a random one is chosen now.
+
+        Returns:
+            The generator for random access.
+
+        """
+        if self._counter is None:
+            if self._seed is None:
+                self._seed = int.from_bytes(os.urandom(16), 'big')
+            self._counter = self._fork(self._seed)
+        return self._counter
+
+    def word_at(self, index: 'int') -> 'str':
+        """Generate the random word of an index.
+
+        The word depends only on the seed of the generator and ``index``, so that it
+        takes constant time regardless of ``index``.
+
+        Args:
+            index: Index of the word.
+
+        Returns:
+            Random word.
+
+        """
+        return _render_seeded(self._get_counter(), self._seed, 'gen_word', (), index)
+
+    def sentence_at(self, index: 'int', comma: 'tuple[int, int]' = (0, 2),
+                    word_range: 'tuple[int, int]' = (4, 8)) -> 'str':
+        """Generate the random sentence of an index.
+
+        The sentence depends only on the seed of the generator, ``index`` and the
+        other arguments, so that it takes constant time regardless of ``index``. It
+        is the same as the ``index``-th sentence from :func:`sentence` with the same
+        ``seed`` and ``regenerate=True``.
+
+        Args:
+            index: Index of the sentence.
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+
+        Returns:
+            Random sentence.
+
+        """
+        return _render_seeded(self._get_counter(), self._seed, 'gen_sentence', (comma, word_range), index)
+
+    def paragraph_at(self, index: 'int', comma: 'tuple[int, int]' = (0, 2),
+                     word_range: 'tuple[int, int]' = (4, 8),
+                     sentence_range: 'tuple[int, int]' = (5, 10)) -> 'str':
+        """Generate the random paragraph of an index.
+
+        The paragraph depends only on the seed of the generator, ``index`` and the
+        other arguments, so that it takes constant time regardless of ``index``. It
+        is the same as the ``index``-th paragraph from :func:`paragraph` with the same
+        ``seed`` and ``regenerate=True``.
+
+        .. code-block:: python
+
+            >>> gen = LoremGenerator(seed=42)
+            >>> texts = [gen.paragraph_at(index) for index in range(10 ** 12, 10 ** 12 + 10)]
+
+        Args:
+            index: Index of the paragraph.
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+            sentence_range: Random range for number of sentences in each paragraph. The function
+                will use :func:`random.randint` to choose a random integer as the number of sentences.
+
+        Returns:
+            Random paragraph.
+
+        """
+        return _render_seeded(self._get_counter(), self._seed, 'gen_paragraph',
+                              (comma, word_range, sentence_range), index)
+
+    def getstate(self) -> 'dict[str, Any]':
+        """Return the state of the generator.
+
+        The state consists of the state of the random number generator, and the
+        position in the word pool, e.g. the shuffle bag and how much of it has been
+        drawn. It can be passed to :meth:`setstate` of this generator, or of another
+        one created with the same arguments, to continue the exact same text.
+
+        The cache of pre-rendered text is not part of the state. For generators
+        drawing from the global :mod:`random` module, its global state is used.
+
+        Returns:
+            State of the generator, which can be pickled.
+
+        """
+        remaining = []  # type: list[str]
+        if self._chunk is not None:
+            chunk, iterator = self._chunk
+            remaining = chunk[len(chunk) - operator.length_hint(iterator):]
+        return {
+            'rng': self.rng.getstate(),
+            'pool': (remaining, copy.deepcopy(self._resume)),
+        }
+
+    def setstate(self, state: 'dict[str, Any]') -> 'None':
+        """Restore the state of the generator.
+
+        Args:
+            state: State of the generator, as returned from :meth:`getstate`.
+
+        """
+        self.rng.setstate(state['rng'])
+        remaining, resume = state['pool']
+        remaining = list(remaining)
+        iterator = iter(remaining)
+
+        self._resume = copy.deepcopy(resume)
+        self._chunk = (remaining, iterator)
+        self._pool = itertools.chain(iterator, self._resume_pool(self._resume))
+        if self._stats is not None:
+            self._pool = self._stats._count_words(self._pool)  # pylint: disable=protected-access
+
+    def __getstate__(self) -> 'dict[str, Any]':
+        if self._stats is not None:
+            raise TypeError('cannot pickle {} with statistics'.format(type(self).__name__))
+        state = self.__dict__.copy()
+        for name in ('_pool', '_chunk', '_resume', '_transform', '_derived'):
+            del state[name]
+        if state['_rng'] is random:
+            state['_rng'] = None
+        state['_state'] = self.getstate()
+        return state
+
+    def __setstate__(self, state: 'dict[str, Any]') -> 'None':
+        state = state.copy()
+        checkpoint = state.pop('_state')
+        if state['_rng'] is None:
+            state['_rng'] = random
+        self.__dict__.update(state)
+        self._transform = (None, (), {}, None)
+        self._derived = {}
+        self.setstate(checkpoint)
+
+    def _gen_pool(self, dupe: 'int' = 1) -> 'Iterator[str]':  # pylint: disable=unused-argument
+        """Generate word pool.
+
+        The word pool works as a *shuffle bag*, i.e. every word from the text pool
+        is yielded once before any of them repeats, then the bag is reshuffled. Only
+        one copy of the text pool is kept, so memory usage is bound to the size of
+        the vocabulary rather than the amount of text generated.
+
+        Args:
+            dupe: Deprecated, kept for backward compatibility only.
+
+        Returns:
+            An infinite loop word pool.
+
+        """
+        if self._weights is not None:
+            resume = ['sample', 16]  # type: list[Any]
+        elif isinstance(self._text, MappedPool):
+            resume = ['mapped', {}, None, 0]
+        elif len(self._text) >= _LAZY_BAG:
+            resume = ['draw', {}, 0]
+        else:
+            resume = ['bag', list(self._text)]
+        self._resume = resume
+        self._chunk = None
+        return self._resume_pool(resume)
+
+    def _resume_pool(self, resume: 'list[Any]') -> 'Iterator[str]':
+        """Generate word pool from where it was.
+
+        The word pool generators keep where they are in ``resume``, which is updated
+        in place as words are drawn; for batches of words iterated in C, the current
+        batch and its iterator are kept as :attr:`_chunk` as well. Together with the
+        state of the random number generator, it is enough to continue the word pool.
+
+        Args:
+            resume: Where the word pool was, e.g. ``['bag', pool]`` for a shuffle bag
+                to be reshuffled.
+
+        Returns:
+            An infinite loop word pool.
+
+        """
+        if resume[0] == 'sample':
+            return itertools.chain.from_iterable(self._gen_sample(resume))
+        if resume[0] == 'mapped':
+            return self._gen_mapped(cast('MappedPool', self._text), resume)
+        return itertools.chain.from_iterable(self._gen_bag(resume))
+
+    def _gen_mapped(self, text: 'MappedPool', resume: 'list[Any]') -> 'Iterator[str]':
+        """Generate word pool of a memory-mapped word list.
+
+        The shuffle bag holds the indices of the words instead, which are shuffled
+        incrementally, and words are decoded only when drawn. Alike :meth:`_draw_bag`,
+        only the swapped positions are recorded for the first words drawn, so that
+        a generator drawing only a few words costs constant time and memory; the
+        indices are laid out in an :class:`array.array` afterwards.
+
+        Args:
+            text: The memory-mapped word list.
+            resume: Where the word pool was, i.e. ``['mapped', swaps, indices, index]``.
+
+        Returns:
+            An infinite loop word pool.
+
+        """
+        rand = self.rng.random
+        size = len(text)
+        self._chunk = None
+
+        if resume[2] is None:
+            swaps = resume[1]  # type: dict[int, int]
+            for index in range(resume[3], size // _LAZY_BAG):
+                swap = index + int(rand() * (size - index))  # nosec B311
+                value = swaps.get(swap, swap)
+                swaps[swap] = swaps.get(index, index)
+                swaps[index] = value
+                resume[3] = index + 1
+                yield text[value]
+
+            indices = array.array('I' if size < 1 << 32 else 'Q', range(size))
+            for index, value in swaps.items():
+                indices[index] = value
+            resume[1:] = [None, indices, size // _LAZY_BAG]
+
+        indices = resume[2]
+        while True:
+            for index in range(resume[3], size):
+                swap = index + int(rand() * (size - index))  # nosec B311
+                indices[index], indices[swap] = indices[swap], indices[index]
+                resume[3] = index + 1
+                yield text[indices[index]]
+            resume[3] = 0
+
+    def _gen_sample(self, resume: 'list[Any]') -> 'Iterator[Iterable[str]]':
+        """Sample words independently from the weighted word pool.
+
+        Words are sampled in batches, doubling in size up to :data:`_SAMPLE_BATCH`,
+        through the alias table built by :func:`_alias_table`.
+
+        Args:
+            resume: Where the word pool was, i.e. ``['sample', batch]``.
+
+        Returns:
+            An infinite loop of batches of sampled words.
+
+        """
+        cut, alias = _alias_table(cast('tuple[float, ...]', self._weights))
+        words = self._text
+        size = len(words)
+        rand = self.rng.random
+
+        while True:
+            points = [rand() * size for _ in range(resume[1])]  # nosec B311
+            sample = [words[index] if point < cut[index] else words[alias[index]]
+                      for point, index in zip(points, map(int, points))]
+            resume[1] = min(resume[1] * 2, _SAMPLE_BATCH)
+            self._chunk = (sample, iter(sample))
+            yield self._chunk[1]
+
+    def _gen_bag(self, resume: 'list[Any]') -> 'Iterator[Iterable[str]]':
+        """Generate the shuffle bag.
+
+        The same list is reshuffled in place and yielded again once the consumer,
+        i.e. :func:`itertools.chain.from_iterable`, has exhausted it, so that the
+        words are iterated in C rather than resuming a generator for each word.
+
+        For pools of at least :data:`_LAZY_BAG` words, the first bag is shuffled
+        lazily by :meth:`_draw_bag` instead, so that a generator drawing only a few
+        words does not pay for copying and shuffling the whole pool.
+
+        Args:
+            resume: Where the word pool was, i.e. ``['draw', swaps, index]`` for the
+                first bag shuffled lazily, or ``['bag', pool]`` for the bag to be
+                reshuffled.
+
+        Returns:
+            An infinite loop of the shuffled text pool.
+
+        """
+        if resume[0] == 'draw':
+            self._chunk = None
+            yield self._draw_bag(resume)
+            resume[:] = ['bag', list(self._text)]
+
+        pool = resume[1]  # type: list[str]
+        while pool:  # pragma: no cover
+            self.rng.shuffle(pool)
+            self._chunk = (pool, iter(pool))
+            yield self._chunk[1]
+
+    def _draw_bag(self, resume: 'list[Any]') -> 'Iterator[str]':
+        """Shuffle the first bag lazily.
+
+        This is an incremental Fisher-Yates shuffle of the text pool, where only the
+        swapped positions are recorded, so that each word drawn costs constant time
+        and memory.
+
+        Args:
+            resume: Where the bag was, i.e. ``['draw', swaps, index]``.
+
+        Returns:
+            Words of the shuffled bag.
+
+        """
+        rand = self.rng.random
+        text = self._text
+        size = len(text)
+        swaps = resume[1]  # type: dict[int, str]
+        for index in range(resume[2], size):
+            swap = index + int(rand() * (size - index))  # nosec B311
+            value = swaps.get(swap, text[swap])
+            swaps[swap] = swaps.get(index, text[index])
+            resume[2] = index + 1
+            yield value
+
+    def gen_word(self, # pylint: disable=dangerous-default-value
+                 func: 'Optional[str | Callable[[str], str]]' = None,
+                 args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {},
+                 pure: 'bool' = False) -> 'str':
+        """Generate random word.
+
+        Args:
+            func: Filter function. It can be an attribute name of :obj:`str`, or a customised
+                function that takes the original :obj:`str` and returns the modified :obj:`str`.
+            args:  Additional positional arguments for ``func``.
+            kwargs: Additional keyword arguments for ``func``.
+            pure: If ``func`` is a pure function, i.e. its result depends only on its
+                arguments, it is applied only once per distinct word, and the results
+                are looked up afterwards. Attribute names of :obj:`str` are always pure.
+
+        Returns:
+            Random word.
+
+        """
+        text = next(self.pool)
+        if func is not None:
+            if pure or isinstance(func, str):
+                last_func, last_args, last_kwargs, table = self._transform
+                if func is not last_func or args != last_args or kwargs != last_kwargs:
+                    table = _get_transform(func, args, kwargs)
+                    self._transform = (func, args, dict(kwargs), table)
+                if table is not None:
+                    return table[text]
+            if isinstance(func, str):
+                text = getattr(text, func)(*args, **kwargs)
+            else:
+                text = func(text, *args, **kwargs)
+        return text
+
+    def _plan(self, count: 'int', comma: 'tuple[int, int]',
+              word_range: 'tuple[int, int]') -> 'list[Sequence[int]]':
+        """Plan the structure of random sentences.
+
+        Random numbers are drawn in bulk: word and comma counts of the sentences
+        are decoded from a single uniformly random integer in mixed radix, and
+        whether to continue after each comma is decoded from a batch of fair coin
+        flips. When the possible structures are few enough, the sentences are
+        looked up from the table built by :func:`_sentence_table` directly.
+
+        Args:
+            count: Number of sentences.
+            comma: Random range for number of commas.
+            word_range: Random range for number of words in each clause.
+
+        Returns:
+            Number of words in each comma-separated clause of each sentence.
+
+        """
+        word_min, word_max = word_range
+        comma_min, comma_max = comma
+        word_radix = word_max - word_min + 1
+        comma_radix = comma_max - comma_min + 1
+        radix = comma_radix * word_radix ** (comma_max + 1)
+
+        randint = self.rng.randint
+        choice = self.rng.choice
+        table = _sentence_table(word_min, word_max, comma_min, comma_max)
+
+        plan = []  # type: list[Sequence[int]]
+        coins = coin_count = 0
+        while count > 0:
+            batch = min(count, _PLAN_BATCH)
+            count -= batch
+            digits = randint(0, radix ** batch - 1)  # nosec B311
+
+            if table is not None:
+                mask = (1 << comma_max) - 1
+                for _ in range(batch):
+                    digits, digit = divmod(digits, radix)
+                    if coin_count < comma_max:
+                        coins, coin_count = choice(_COINS), _COIN_BITS  # nosec B311
+                    plan.append(table[(coins & mask) * radix + digit])
+                    coins >>= comma_max
+                    coin_count -= comma_max
+                continue
+
+            for _ in range(batch):
+                digits, digit = divmod(digits, radix)
+                digit, words = divmod(digit, word_radix)
+                digit, commas = divmod(digit, comma_radix)
+
+                clauses = [max(word_min + words, 1)]
+                for _ in range(comma_min + commas):
+                    if not coin_count:
+                        coins, coin_count = choice(_COINS), _COIN_BITS  # nosec B311
+                    coins, stop = divmod(coins, 2)
+                    coin_count -= 1
+                    if stop:
+                        break
+                    digit, words = divmod(digit, word_radix)
+                    clauses.append(max(word_min + words, 0))
+                plan.append(clauses)
+        return plan
+
+    def _render(self, plan: 'list[Sequence[int]]') -> 'str':
+        """Render planned sentences.
+
+        The words of all sentences are drawn from the word pool at once, then
+        punctuations are attached in place and the text is joined in one go.
+        Capitalized forms of the words starting the sentences are looked up from
+        a shared table rather than computed each time.
+
+        Args:
+            plan: Number of words in each clause of each sentence, as returned
+                from :meth:`_plan`.
+
+        Returns:
+            Rendered sentences.
+
+        """
+        words = list(itertools.islice(self.pool, sum(map(sum, plan))))
+        capital = _transform_table('capitalize', (), ())
+
+        index = 0
+        for clauses in plan:
+            words[index] = capital[words[index]]
+            for count in clauses:
+                index += count
+                words[index - 1] += ','
+            words[index - 1] = words[index - 1][:-1] + '.'
+        return ' '.join(words)
+
+    def _render_bytes(self, plan: 'list[Sequence[int]]') -> 'bytes':
+        """Render planned sentences in UTF-8.
+
+        The same as :meth:`_render`, but words are looked up from their pre-encoded
+        forms, so that no intermediate :obj:`str` is built.
+
+        Args:
+            plan: Number of words in each clause of each sentence, as returned
+                from :meth:`_plan`.
+
+        Returns:
+            Rendered sentences in UTF-8.
+
+        """
+        texts = itertools.islice(self.pool, sum(map(sum, plan)))
+        if isinstance(self._text, tuple):
+            plain, capital = self._derive('encoded', _encode_pool)
+            words = list(map(plain.__getitem__, texts))
+        else:
+            capital = _Capitalized()
+            words = [text.encode('utf-8') for text in texts]
+
+        index = 0
+        for clauses in plan:
+            words[index] = capital[words[index]]
+            for count in clauses:
+                index += count
+                words[index - 1] += b','
+            words[index - 1] = words[index - 1][:-1] + b'.'
+        return b' '.join(words)
+
+    def _render_items(self, plan: 'list[Sequence[int]]', sizes: 'int | Iterable[int]' = 1) -> 'list[str]':
+        """Render planned sentences as separate items.
+
+        The same as :meth:`_render`, but consecutive sentences are joined into
+        items of their own, e.g. the paragraphs of a batch.
+
+        Args:
+            plan: Number of words in each clause of each sentence, as returned
+                from :meth:`_plan`.
+            sizes: Number of sentences in each item, or ``1`` for each sentence on
+                its own.
+
+        Returns:
+            Rendered items.
+
+        """
+        words = list(itertools.islice(self.pool, sum(map(sum, plan))))
+        capital = _transform_table('capitalize', (), ())
+
+        stops = [0]
+        index = 0
+        for clauses in plan:
+            words[index] = capital[words[index]]
+            for count in clauses:
+                index += count
+                words[index - 1] += ','
+            words[index - 1] = words[index - 1][:-1] + '.'
+            stops.append(index)
+
+        if not isinstance(sizes, int):
+            stops = list(map(stops.__getitem__, itertools.accumulate(itertools.chain((0,), sizes))))
+        return list(map(' '.join, map(words.__getitem__, map(slice, stops, stops[1:]))))
+
+    def gen_sentence(self, comma: 'tuple[int, int]',
+                     word_range: 'tuple[int, int]') -> 'str':
+        """Generate random sentence.
+
+        Args:
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+
+        Returns:
+            Random sentence.
+
+        """
+        if self._cache is not None:
+            return self._cache.draw((self._source, 'sentence', comma, word_range),
+                                    lambda: self._render(self._plan(1, comma, word_range)), self.rng)
+        return self._render(self._plan(1, comma, word_range))
+
+    def gen_paragraph(self, comma: 'tuple[int, int]',
+                      word_range: 'tuple[int, int]',
+                      sentence_range: 'tuple[int, int]') -> 'str':
+        """Generate random paragraph.
+
+        The structure of the paragraph, i.e. number of sentences, clauses and words,
+        is planned first, then the paragraph is rendered at once.
+
+        Args:
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+            sentence_range: Random range for number of sentences in each  paragraph. The function
+                will use :func:`random.randint` to choose a random integer as the number of sentences.
+
+        Returns:
+            Random paragraph.
+
+        """
+        if self._cache is not None:
+            return self._cache.draw((self._source, 'paragraph', comma, word_range, sentence_range),
+                                    lambda: self._gen_paragraph(comma, word_range, sentence_range),
+                                    self.rng)
+        return self._gen_paragraph(comma, word_range, sentence_range)
+
+    def _gen_paragraph(self, comma: 'tuple[int, int]', word_range: 'tuple[int, int]',
+                       sentence_range: 'tuple[int, int]') -> 'str':
+        """Render a fresh random paragraph, bypassing the cache.
+
+        Args:
+            comma: Random range for number of commas.
+            word_range: Random range for number of words in each clause.
+            sentence_range: Random range for number of sentences.
+
+        Returns:
+            Random paragraph.
+
+        """
+        count = max(self.rng.randint(*sentence_range), 1)  # nosec B311
+        return self._render(self._plan(count, comma, word_range))
+
+    def iter_text(self, kind: 'Kind' = 'paragraph', comma: 'tuple[int, int]' = (0, 2),
+                  word_range: 'tuple[int, int]' = (4, 8),
+                  sentence_range: 'tuple[int, int]' = (5, 10)) -> 'Iterator[str]':
+        """Generate an infinite stream of random text.
+
+        Unlike :func:`word`, :func:`sentence` and :func:`paragraph`, which cycle a
+        fixed number of non-repeated items, every item from the stream is freshly
+        generated, so nothing is kept in memory.
+
+        Args:
+            kind: Kind of text, i.e. ``'word'``, ``'sentence'`` or ``'paragraph'``.
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+            sentence_range: Random range for number of sentences in each  paragraph. The function
+                will use :func:`random.randint` to choose a random integer as the number of sentences.
+
+        Returns:
+            Indefinite random text generator.
+
+        Raises:
+            ValueError: If ``kind`` is unknown.
+
+        """
+        if kind == 'word':
+            if self._stats is not None:  # counted by the instrumented method
+                return iter(self.gen_word, None)
+            return self.pool
+        if kind == 'sentence':
+            return iter(functools.partial(self.gen_sentence, comma, word_range), None)
+        if kind == 'paragraph':
+            return iter(functools.partial(self.gen_paragraph, comma, word_range, sentence_range), None)
+        raise ValueError('unknown kind of text: {!r}'.format(kind))
+
+    def gen_into(self, buffer: 'bytearray | memoryview', kind: 'Kind' = 'paragraph',
+                 sep: 'bytes' = b'\n', comma: 'tuple[int, int]' = (0, 2),
+                 word_range: 'tuple[int, int]' = (4, 8),
+                 sentence_range: 'tuple[int, int]' = (5, 10)) -> 'int':
+        """Generate random text in UTF-8 directly into a buffer.
+
+        Words are kept in their pre-encoded forms and rendered as :obj:`bytes`,
+        which are then copied into ``buffer`` in place. Whole items are written,
+        each followed by ``sep``, for as long as they fit; the first item that
+        does not fit is discarded.
+
+        Args:
+            buffer: Writable buffer to fill, e.g. a :obj:`bytearray` or a :obj:`memoryview`.
+            kind: Kind of text, i.e. ``'word'``, ``'sentence'`` or ``'paragraph'``.
+            sep: Separator following each item.
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+            sentence_range: Random range for number of sentences in each  paragraph. The function
+                will use :func:`random.randint` to choose a random integer as the number of sentences.
+
+        Returns:
+            Number of bytes filled, which is zero if ``buffer`` is too small for a single item.
+
+        Raises:
+            ValueError: If ``kind`` is unknown.
+
+        """
+        if kind == 'word':
+            if isinstance(self._text, tuple):
+                plain = self._derive('encoded', _encode_pool)[0]
+
+                def render() -> 'bytes':
+                    return plain[next(self.pool)]
+            else:
+                def render() -> 'bytes':
+                    return next(self.pool).encode('utf-8')
+        elif kind == 'sentence':
+            def render() -> 'bytes':
+                return self._render_bytes(self._plan(1, comma, word_range))
+        elif kind == 'paragraph':
+            def render() -> 'bytes':
+                count = max(self.rng.randint(*sentence_range), 1)  # nosec B311
+                return self._render_bytes(self._plan(count, comma, word_range))
+        else:
+            raise ValueError('unknown kind of text: {!r}'.format(kind))
+
+        with memoryview(buffer) as raw, raw.cast('B') as view:
+            size = len(view)
+            filled = 0
+            while True:
+                data = render()
+                end = filled + len(data)
+                if end + len(sep) > size:
+                    return filled
+                view[filled:end] = data
+                view[end:end + len(sep)] = sep
+                filled = end + len(sep)
+
+    def gen_tokens(self, count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+                   word_range: 'tuple[int, int]' = (4, 8),
+                   sentence_range: 'tuple[int, int]' = (5, 10)) -> 'TokenBatch':
+        """Generate random paragraphs as arrays of token IDs.
+
+        The whole batch is drawn from a :mod:`numpy` random number generator seeded
+        from :attr:`rng`, with a handful of vectorised calls: one each for the
+        numbers of sentences, commas, clauses and words, and one for the words of
+        all full shuffle bags. Each batch starts its shuffle bags afresh, and weighted
+        word pools are sampled independently as usual. No text is rendered, see
+        :meth:`render_tokens` for that.
+
+        Args:
+            count: Number of paragraphs.
+            comma: Random range for number of commas.
+            word_range: Random range for number of words in each clause.
+            sentence_range: Random range for number of sentences in each paragraph.
+
+        Returns:
+            Token IDs and structure of the paragraphs.
+
+        Raises:
+            ImportError: If :mod:`numpy` is not installed.
+
+        """
+        if numpy is None:
+            raise ImportError('numpy is required for token arrays')
+        rng = numpy.random.default_rng(self.rng.getrandbits(128))  # nosec B311
+
+        sentences = numpy.maximum(rng.integers(*sentence_range, size=count, endpoint=True), 1)
+        total = int(sentences.sum())
+        # the same as :meth:`_plan`, continuing after each comma on a fair coin flip
+        extra = numpy.minimum(rng.integers(*comma, size=total, endpoint=True),
+                              rng.geometric(0.5, size=total) - 1)
+        clause_offsets = numpy.zeros(total + 1, dtype=numpy.int64)
+        numpy.cumsum(extra + 1, out=clause_offsets[1:])
+
+        lengths = numpy.maximum(rng.integers(*word_range, size=int(clause_offsets[-1]), endpoint=True), 0)
+        firsts = clause_offsets[:-1]
+        lengths[firsts] = numpy.maximum(lengths[firsts], 1)
+        word_offsets = numpy.zeros(len(lengths) + 1, dtype=numpy.int64)
+        numpy.cumsum(lengths, out=word_offsets[1:])
+
+        ends = word_offsets[1:] - 1
+        ends[clause_offsets[1:] - 1] = -1  # the last clause ends with a full stop instead
+        commas = numpy.bincount(ends[ends >= 0], minlength=int(word_offsets[-1]))
+
+        size = int(word_offsets[-1])
+        vocab = len(self._text)
+        if self._weights is not None:
+            weights = numpy.asarray(self._weights, dtype=numpy.float64)
+            words = rng.choice(vocab, size=size, p=weights / weights.sum())
+        else:
+            bags, rest = divmod(size, vocab)
+            full = numpy.tile(numpy.arange(vocab, dtype=numpy.int64), (bags, 1))
+            rng.permuted(full, axis=1, out=full)
+            words = numpy.concatenate((full.ravel(), rng.choice(vocab, size=rest, replace=False)))
+
+        paragraph_offsets = numpy.zeros(count + 1, dtype=numpy.int64)
+        numpy.cumsum(sentences, out=paragraph_offsets[1:])
+        return TokenBatch(words, commas, word_offsets[clause_offsets], paragraph_offsets)
+
+    def render_tokens(self, batch: 'TokenBatch') -> 'list[str]':
+        """Render random paragraphs from arrays of token IDs.
+
+        Words are looked up from object arrays of the word pool by fancy indexing,
+        and punctuations are attached to all sentences at once; only the final join
+        of each paragraph is done in Python.
+
+        Args:
+            batch: Token IDs and structure of the paragraphs, as returned from
+                :meth:`gen_tokens`.
+
+        Returns:
+            Rendered paragraphs.
+
+        Raises:
+            ImportError: If :mod:`numpy` is not installed.
+
+        """
+        if numpy is None:
+            raise ImportError('numpy is required for token arrays')
+        starts = batch.sentences[:-1]
+        if isinstance(self._text, tuple):
+            plain, capital = self._derive('vocab', _vocab_arrays)
+            words = plain[batch.words]
+            words[starts] = capital[batch.words[starts]]
+        else:
+            words = numpy.empty(len(batch.words), dtype=object)
+            words[:] = list(map(self._text.__getitem__, batch.words.tolist()))
+            words[starts] = [text.capitalize() for text in words[starts]]
+
+        marks = batch.commas.nonzero()[0]
+        words[marks] += batch.commas[marks].astype(object) * ','
+        words[batch.sentences[1:] - 1] += '.'
+
+        texts = words.tolist()
+        bounds = batch.sentences[batch.paragraphs].tolist()
+        return [' '.join(texts[start:stop]) for start, stop in zip(bounds, bounds[1:])]
+
+    def _length_index(self, unit: 'Unit') -> 'dict[int, list[str]]':
+        """Index words from the text pool by their sizes.
+
+        Args:
+            unit: Unit of the sizes, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+        Returns:
+            Mapping from sizes to the words of such size.
+
+        """
+        return self._derive(('lengths', unit), functools.partial(_index_lengths, unit=unit))
+
+    def _reachable(self, unit: 'Unit') -> 'Callable[[int], bool]':
+        """Find sizes of sentences that can be built from the word pool.
+
+        Args:
+            unit: Unit of the sizes, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+        Returns:
+            Function checking if a sentence (or the rest of one) of a size can be built,
+            where size ``0`` is always reachable by no words.
+
+        """
+        index = self._length_index(unit)
+        table, bound, divisor = self._derive(('reachable', unit), lambda _: _reachable_lengths(
+            tuple(item + 1 for item in sorted(index))))
+
+        def reachable(size: 'int') -> 'bool':
+            step, rest = divmod(size, divisor)
+            return size >= 0 and not rest and (step >= bound or bool(table[step]))
+        return reachable
+
+    def _fit_words(self, size: 'int', unit: 'Unit') -> 'list[str]':
+        """Draw words of a sentence of exact size.
+
+        Words are drawn from the word pool as long as the room left after each
+        is still reachable, see :func:`_reachable_lengths`. Otherwise, a size
+        keeping the room reachable is chosen at random, and a random word of such
+        size is used instead. The first word is capitalized.
+
+        Args:
+            size: Size of the sentence, which must be reachable.
+            unit: Unit of ``size``, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+        Returns:
+            Words of the sentence, without the full stop.
+
+        """
+        measure = _get_measure(unit)
+        index = self._length_index(unit)
+        reachable = self._reachable(unit)
+
+        words = []  # type: list[str]
+        room = size
+        while room:
+            text = next(self.pool)
+            if not words:
+                text = text.capitalize()
+
+            if not reachable(room - measure(text) - 1):
+                fits = self.rng.choice([item for item in index  # nosec B311
+                                        if reachable(room - item - 1)])
+                text = self.rng.choice(index[fits])  # nosec B311
+                if not words and measure(text.capitalize()) == fits:
+                    text = text.capitalize()
+            room -= measure(text) + 1
+            words.append(text)
+        return words
+
+    def gen_fitted(self, size: 'int | tuple[int, int]', unit: 'Unit' = 'chars') -> 'str':
+        """Generate random sentence of exact size.
+
+        The sentence is built in one pass, using an index of words by their sizes
+        and a precomputed table of sizes reachable by such words, so that every
+        word drawn leaves room that can still be filled up exactly.
+
+        Args:
+            size: Size of the sentence, including the full stop. To generate a sentence
+                of random size, supply a 2-element tuple of :obj:`int`, the function will
+                choose a random size among those reachable in the range.
+            unit: Unit of ``size``, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+
+        Returns:
+            Random sentence of size ``size``, without commas.
+
+        Raises:
+            ValueError: If no sentence of size ``size`` can be built from the word pool.
+
+        """
+        reachable = self._reachable(unit)
+        if isinstance(size, tuple):
+            low, high = size
+            sizes = [item for item in range(max(low, 1), high + 1) if reachable(item)]
+            if not sizes:
+                raise ValueError('no sentence of size in {!r} can be built from the word pool'.format(size))
+            size = self.rng.choice(sizes)  # nosec B311
+        elif size <= 0 or not reachable(size):
+            raise ValueError('no sentence of size {!r} can be built from the word pool'.format(size))
+        return ' '.join(self._fit_words(size, unit)) + '.'
+
+    def _fit_sentence(self, size: 'int', unit: 'Unit', filler: 'str') -> 'str':
+        """Generate random sentence of exact size.
+
+        If the size is reachable, the sentence is built by :meth:`_fit_words`.
+        Otherwise, the longest reachable size that fits is used, and the room left
+        is padded with ``filler`` after the sentence.
+
+        Args:
+            size: Size of the sentence.
+            unit: Unit of ``size``, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+            filler: Filler of size ``1``.
+
+        Returns:
+            Random sentence of size ``size``.
+
+        """
+        reachable = self._reachable(unit)
+        length = size
+        while length > 0 and not reachable(length):
+            length -= 1
+        if not length:
+            return filler * size
+        return ' '.join(self._fit_words(length, unit)) + '.' + filler * (size - length)
+
+    def gen_text(self, size: 'int', unit: 'Unit' = 'chars', sep: 'str' = ' ',
+                 comma: 'tuple[int, int]' = (0, 2), word_range: 'tuple[int, int]' = (4, 8),
+                 filler: 'str' = ' ') -> 'str':
+        """Generate random text of exact size.
+
+        Random sentences are appended as long as they fit in the remaining room,
+        then the room left is filled up by a sentence fitted to its exact size, so
+        that the text ends on a sentence boundary, followed by ``filler`` if any
+        room is still left.
+
+        Args:
+            size: Size of the text.
+            unit: Unit of ``size``, i.e. ``'chars'`` or ``'bytes'`` (in UTF-8).
+            sep: Seperator between each sentence.
+            comma: Random range for number of commas. The function will use :func:`random.randint`
+                to choose a random integer as the number of commas.
+            word_range: Random range for number of words in each sentence. The function will use
+                :func:`random.randint` to choose a random integer as the number of words.
+            filler: Filler to pad the text, which must be of size ``1``.
+
+        Returns:
+            Random text of size ``size``.
+
+        Raises:
+            ValueError: If ``filler`` is not of size ``1``.
+
+        """
+        measure = _get_measure(unit)
+        if measure(filler) != 1:
+            raise ValueError('filler must be of size 1: {!r}'.format(filler))
+        sep_size = measure(sep)
+
+        parts = []  # type: list[str]
+        room = size
+        for text in self.iter_text('sentence', comma, word_range):
+            cost = measure(text) + (sep_size if parts else 0)
+            if cost > room:
+                break
+            if parts:
+                parts.append(sep)
+            parts.append(text)
+            room -= cost
+
+        if parts and room > sep_size:
+            parts.append(sep)
+            room -= sep_size
+        elif parts:
+            parts.append(filler * room)
+            room = 0
+        if room:
+            parts.append(self._fit_sentence(room, unit, filler))
+        return ''.join(parts)
+
+
+class ThreadLocalLoremGenerator(LoremGenerator):
+    """Generate random words, safely shared among threads.
+
+    Each thread using the generator gets its own shuffle bag and random number
+    generator, so that no lock is taken on the hot path, and threads never contend
+    for the same generator or random state (e.g. on free-threaded CPython). The
+    random number generator of the *n*-th thread to use the generator is seeded
+    from ``seed`` and *n*, thus the text generated by each thread is reproducible
+    as long as the threads first use the generator in the same order.
+
+    Args:
+        pool: List of words to be used as random word pool.
+        dupe: Deprecated, the word pool is no longer duplicated. Kept for
+            backward compatibility only.
+        seed: Seed from which the random number generator of each thread is derived.
+        rng: Random number generator to draw ``seed`` from, if not given. By default,
+            the global :mod:`random` module is used.
+        weights: Weights of the words in ``pool``, or the name of a distribution, see
+            :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+
+    """
+
+    @property
+    def pool(self) -> 'Iterator[str]':
+        """Return the random word pool of the current thread."""
+        try:
+            return self._local.pool
+        except AttributeError:
+            return self._init_local().pool
+
+    @property
+    def rng(self) -> 'Random':
+        """Return the random number generator of the current thread."""
+        try:
+            return self._local.rng
+        except AttributeError:
+            return self._init_local().rng
+
+    @property
+    def seed(self) -> 'Seed':
+        """Return the seed from which the random number generators are derived."""
+        return cast('Seed', self._seed)
+
+    @property
+    def _chunk(self) -> 'Optional[tuple[list[str], Iterator[str]]]':
+        """Current batch of the word pool of the current thread, see :meth:`_resume_pool`."""
+        return getattr(self._local, 'chunk', None)
+
+    @_chunk.setter
+    def _chunk(self, value: 'Optional[tuple[list[str], Iterator[str]]]') -> 'None':
+        self._local.chunk = value
+
+    @property
+    def _resume(self) -> 'Optional[list[Any]]':
+        """Where the word pool of the current thread is, see :meth:`_resume_pool`."""
+        return getattr(self._local, 'resume', None)
+
+    @_resume.setter
+    def _resume(self, value: 'list[Any]') -> 'None':
+        self._local.resume = value
+
+    def __init__(self, pool: 'Iterable[str]' = _TEXT, dupe: 'int' = 1, *,  # pylint: disable=super-init-not-called
+                 seed: 'Optional[Seed]' = None, rng: 'Optional[Random]' = None,
+                 weights: 'Optional[Distribution | Sequence[float]]' = None,
+                 exponent: 'float' = 1.0) -> 'None':
+        if seed is None:
+            seed = _get_rng(rng=rng).getrandbits(128)  # nosec B311
+        self._seed = seed
+        self._text = _get_pool(pool)
+        self._weights = _get_weights(self._text, weights, exponent)
+        self._source = _SourceKey((self._text, self._weights))
+        self._cache = None  # type: Optional[FragmentCache]
+        self._stats = None  # type: Optional[GeneratorStats]
+        self._counter = None  # type: Optional[LoremGenerator]
+        self._transform = (None, (), {}, None)  # type: tuple[Any, Any, Any, Optional[_Transformed]]
+        self._derived = {}  # type: dict[Hashable, tuple[Sequence[str], Any]]
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def _init_local(self) -> 'threading.local':
+        """Initialise the state of the current thread.
+
+        Returns:
+            Thread-local state, with the random number generator and the word pool.
+
+        """
+        with self._lock:
+            index = self._count
+            self._count += 1
+
+        local = self._local
+        local.rng = random.Random(_derive_seed(self.seed, index))  # nosec B311
+        local.pool = self._gen_pool()
+        return local
+
+    def _get_counter(self) -> 'LoremGenerator':
+        """Return the generator rendering items from their indices for the current thread.
+
+        Returns:
+            The generator for random access.
+
+        """
+        try:
+            return self._local.counter
+        except AttributeError:
+            self._local.counter = self._fork(self.seed)
+            return self._local.counter
+
+    def getstate(self) -> 'dict[str, Any]':
+        """Not supported, as the state is kept per thread.
+
+        Where the word pool of each thread is, is kept in the thread-local storage
+        as well, so that threads never write to the shared instance when drawing.
+
+        Raises:
+            TypeError: Always.
+
+        """
+        raise TypeError('cannot get state of {}'.format(type(self).__name__))
+
+    def setstate(self, state: 'dict[str, Any]') -> 'None':
+        """Not supported, as the state is kept per thread.
+
+        Raises:
+            TypeError: Always.
+
+        """
+        raise TypeError('cannot set state of {}'.format(type(self).__name__))
+
+    def __getstate__(self) -> 'dict[str, Any]':
+        raise TypeError('cannot pickle {}'.format(type(self).__name__))
+
+
+class MarkovModel:
+    """Markov chain model of words.
+
+    The model is trained from a corpus by :meth:`train`, where each state of the
+    chain is the last ``order`` words. Transitions are stored in compact arrays
+    in compressed sparse row (CSR) layout, i.e. the transitions from state *s* are
+    those in ``range(offsets[s], offsets[s + 1])``, each with the word emitted,
+    the next state and the cumulative weight of all transitions up to it. Models
+    can be saved to and loaded from files of the raw arrays by :meth:`save` and
+    :meth:`load`.
+
+    Args:
+        vocab: Words of the model.
+        order: Number of words of each state.
+        offsets: Offsets of the transitions from each state.
+        words: Word emitted by each transition.
+        targets: Next state of each transition.
+        cumweights: Cumulative weights of the transitions.
+
+    Raises:
+        ValueError: If the arrays are inconsistent.
+
+    """
+
+    @property
+    def vocab(self) -> 'tuple[str, ...]':
+        """Return the words of the model."""
+        return self._vocab
+
+    @property
+    def order(self) -> 'int':
+        """Return the number of words of each state."""
+        return self._order
+
+    def __init__(self, vocab: 'Sequence[str]', order: 'int', offsets: 'array.array[int]',
+                 words: 'array.array[int]', targets: 'array.array[int]',
+                 cumweights: 'array.array[int]') -> 'None':
+        if not len(words) == len(targets) == len(cumweights) or not cumweights:
+            raise ValueError('transitions must be non-empty and of the same length')
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(words):
+            raise ValueError('offsets do not match the transitions')
+
+        self._vocab = tuple(vocab)
+        self._order = order
+        self._offsets = offsets
+        self._words = words
+        self._targets = targets
+        self._cumweights = cumweights
+
+    def __len__(self) -> 'int':
+        return len(self._words)
+
+    @classmethod
+    def train(cls, corpus: 'Iterable[str]', order: 'int' = 1) -> 'MarkovModel':
+        """Train a model from a corpus.
+
+        Words are the runs of letters (and apostrophes in between) of the corpus,
+        which are lowercased and chained across all texts of the corpus.
+
+        Args:
+            corpus: Texts of the corpus, e.g. lines of a file.
+            order: Number of words of each state.
+
+        Returns:
+            The trained model.
+
+        Raises:
+            ValueError: If ``order`` is not positive, or the corpus has no more
+                than ``order`` words.
+
+        """
+        if order < 1:
+            raise ValueError('order must be positive: {!r}'.format(order))
+
+        ids = collections.defaultdict(itertools.count().__next__)  # type: Dict[str, int]
+        counts = collections.Counter()  # type: collections.Counter[tuple[int, ...]]
+        tokens = []  # type: list[int]
+        for text in corpus:
+            tokens.extend(map(ids.__getitem__, _TOKEN.findall(text.lower())))
+            counts.update(zip(*(itertools.islice(tokens, index, None) for index in range(order + 1))))
+            # keep the last words to chain across texts
+            del tokens[:-order]
+        if not counts:
+            raise ValueError('corpus shall have more than {} words'.format(order))
+
+        # n-grams are sorted, so that transitions from the same state are adjacent
+        grams = sorted(counts)
+        heads = collections.Counter(map(operator.itemgetter(slice(None, -1)), grams))
+        tails = map(operator.itemgetter(slice(1, None)), grams)
+
+        # states only reached at the end of the corpus have no transitions
+        states = dict(zip(itertools.chain(heads, (tail for tail in tails if tail not in heads)),
+                          itertools.count()))
+        offsets = array.array('Q', itertools.chain((0,), itertools.accumulate(heads.values()),
+                                                   itertools.repeat(len(grams), len(states) - len(heads))))
+        words = array.array('I', map(operator.itemgetter(-1), grams))
+        targets = array.array('I', map(states.__getitem__,
+                                       map(operator.itemgetter(slice(1, None)), grams)))
+        cumweights = array.array('Q', itertools.accumulate(map(counts.__getitem__, grams)))
+        return cls(list(ids), order, offsets, words, targets, cumweights)
+
+    def save(self, file: 'str | os.PathLike[str] | IO[bytes]') -> 'None':
+        """Save the model.
+
+        Args:
+            file: Path or binary file object to save the model to.
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'wb') as fileobj:
+                self.save(fileobj)
+            return
+
+        vocab = '\n'.join(self._vocab).encode('utf-8')
+        file.write(_MARKOV_HEADER.pack(_MARKOV_MAGIC, _MARKOV_VERSION,
+                                       b'<' if sys.byteorder == 'little' else b'>',
+                                       self._order, len(vocab), len(self._offsets) - 1,
+                                       len(self._words)))
+        file.write(vocab)
+        for data in (self._offsets, self._cumweights, self._words, self._targets):
+            file.write(data.tobytes())
+
+    @classmethod
+    def load(cls, file: 'str | os.PathLike[str] | IO[bytes]') -> 'MarkovModel':
+        """Load a model saved by :meth:`save`.
+
+        The arrays are read from the file as is, without any parsing.
+
+        Args:
+            file: Path or binary file object to load the model from.
+
+        Returns:
+            The loaded model.
+
+        Raises:
+            ValueError: If the file is not a saved model.
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'rb') as fileobj:
+                return cls.load(fileobj)
+
+        header = file.read(_MARKOV_HEADER.size)
+        if len(header) != _MARKOV_HEADER.size:
+            raise ValueError('not a saved model')
+        magic, version, byteorder, order, vocab_size, state_count, count = _MARKOV_HEADER.unpack(header)
+        if magic != _MARKOV_MAGIC or version != _MARKOV_VERSION:
+            raise ValueError('not a saved model, or unsupported version')
+
+        vocab = file.read(vocab_size).decode('utf-8').split('\n')
+        arrays = []
+        for typecode, size in (('Q', state_count + 1), ('Q', count), ('I', count), ('I', count)):
+            data = array.array(typecode)
+            try:
+                data.fromfile(file, size)
+            except EOFError as error:
+                raise ValueError('truncated model') from error
+            if byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+                data.byteswap()
+            arrays.append(data)
+
+        offsets, cumweights, words, targets = arrays
+        return cls(vocab, order, offsets, words, targets, cumweights)
+
+    def walk(self, rng: 'Optional[Random]' = None, batch: 'int' = 16) -> 'Iterator[list[str]]':
+        """Walk the chain.
+
+        The walk starts from a random transition, chosen by its weight among all
+        transitions, and restarts so whenever it reaches a state with no transitions.
+
+        Args:
+            rng: Random number generator, defaults to the global :mod:`random` module.
+            batch: Initial number of words in each batch, doubling up to
+                :data:`_SAMPLE_BATCH`.
+
+        Returns:
+            An infinite loop of batches of words.
+
+        """
+        return self._walk(_get_rng(rng=rng), ['markov', -1, batch])
+
+    def _walk(self, rng: 'Random', resume: 'list[Any]') -> 'Iterator[list[str]]':
+        """Walk the chain from where it was.
+
+        Args:
+            rng: Random number generator.
+            resume: Where the walk was, i.e. ``['markov', state, batch]``, which is
+                updated in place before each batch is yielded.
+
+        Returns:
+            An infinite loop of batches of words.
+
+        """
+        rand = rng.random
+        vocab = self._vocab
+        offsets = self._offsets
+        words = self._words
+        targets = self._targets
+        cumweights = self._cumweights
+        total = cumweights[-1]
+
+        _, state, batch = resume
+        while True:
+            sample = []  # type: list[str]
+            for _ in range(batch):
+                if state < 0 or offsets[state] == offsets[state + 1]:
+                    edge = bisect.bisect_right(cumweights, int(rand() * total))  # nosec B311
+                else:
+                    low, high = offsets[state], offsets[state + 1]
+                    base = cumweights[low - 1] if low else 0
+                    point = base + int(rand() * (cumweights[high - 1] - base))  # nosec B311
+                    edge = bisect.bisect_right(cumweights, point, low, high)
+                sample.append(vocab[words[edge]])
+                state = targets[edge]
+            batch = min(batch * 2, _SAMPLE_BATCH)
+            resume[1:] = [state, batch]
+            yield sample
+
+
+class MarkovLoremGenerator(LoremGenerator):
+    """Generate random words by walking a Markov chain.
+
+    Words are drawn by walking the chain of the ``model``, so that the generated
+    text follows the word co-occurrence of the corpus it was trained from.
+
+    Args:
+        model: The Markov chain model.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+            By default, the global :mod:`random` module is used.
+        cache: Cache of pre-rendered sentences and paragraphs to draw from.
+
+    """
+
+    @property
+    def model(self) -> 'MarkovModel':
+        """Return the Markov chain model."""
+        return self._model
+
+    def __init__(self, model: 'MarkovModel', *, seed: 'Optional[Seed]' = None,
+                 rng: 'Optional[Random]' = None, cache: 'Optional[FragmentCache]' = None) -> 'None':
+        self._model = model
+        super().__init__(model.vocab, seed=seed, rng=rng, cache=cache)
+        self._source = _SourceKey(model)
+
+    def _fork(self, seed: 'Seed') -> 'LoremGenerator':
+        """Create a generator of the same model with its own seed.
+
+        Args:
+            seed: Seed of the new generator.
+
+        Returns:
+            The new generator, without cache.
+
+        """
+        return MarkovLoremGenerator(self._model, seed=seed)
+
+    def gen_tokens(self, count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+                   word_range: 'tuple[int, int]' = (4, 8),
+                   sentence_range: 'tuple[int, int]' = (5, 10)) -> 'TokenBatch':
+        """Not supported, as each word of a Markov chain depends on those before it.
+
+        Raises:
+            TypeError: Always.
+
+        """
+        raise TypeError('Markov chain text cannot be generated as token arrays')
+
+    def _gen_pool(self, dupe: 'int' = 1) -> 'Iterator[str]':  # pylint: disable=unused-argument
+        """Generate word pool by walking the Markov chain.
+
+        Args:
+            dupe: Deprecated, kept for backward compatibility only.
+
+        Returns:
+            An infinite loop word pool.
+
+        """
+        self._resume = ['markov', -1, 16]  # type: list[Any]
+        self._chunk = None
+        return self._resume_pool(self._resume)
+
+    def _resume_pool(self, resume: 'list[Any]') -> 'Iterator[str]':
+        """Generate word pool from where the walk was.
+
+        Args:
+            resume: Where the walk was, i.e. ``['markov', state, batch]``.
+
+        Returns:
+            An infinite loop word pool.
+
+        """
+        return itertools.chain.from_iterable(self._gen_walk(resume))
+
+    def _gen_walk(self, resume: 'list[Any]') -> 'Iterator[Iterable[str]]':
+        """Walk the Markov chain, keeping the current batch.
+
+        Args:
+            resume: Where the walk was, i.e. ``['markov', state, batch]``.
+
+        Returns:
+            An infinite loop of batches of words.
+
+        """
+        for sample in self._model._walk(self.rng, resume):  # pylint: disable=protected-access
+            self._chunk = (sample, iter(sample))
+            yield self._chunk[1]
+
+
+def word(count: int = 1, func: 'Optional[str | Callable[[str], str]]' = None,
+         args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {}, *,
+         pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+         rng: 'Optional[Random]' = None,
+         weights: 'Optional[Distribution | Sequence[float]]' = None,
+         exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None,
+         pure: 'bool' = False) -> 'Iterator[str]':  # pylint: disable=dangerous-default-value
+    """Generate a list of random words.
+
+    .. code-block:: python
+
+        >>> list(itertools.cycle(word(count=3), 3))
+        ['labore', 'tempor', 'commodo']
+        >>> list(itertools.cycle(word(count=3, func='capitalize'), 3))
+        ['Ea', 'Lorem', 'Do']
+        >>> list(itertools.cycle(word(count=3, func=lambda s: s.upper()), 3))
+        ['UT', 'AMET', 'EXCEPTEUR']
+
+    Args:
+        count: Number of non-repeated random words.
+        func: Filter function. It can be an attribute name of :obj:`str`, or a customised
+            function that takes the original :obj:`str` and returns the modified :obj:`str`.
+        args: Additional positional arguments for ``func``.
+        kwargs: Additional keyword arguments for ``func``.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+        pure: If ``func`` is a pure function, it is applied only once per distinct word,
+            see :meth:`LoremGenerator.gen_word`.
+
+    Returns:
+        Indefinite random words generator.
+
+    """
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng, weights=weights, exponent=exponent,
+                           stats=stats)
+    yield from itertools.cycle(lorem.gen_word(func=func,
+                                              args=args,
+                                              kwargs=kwargs,
+                                              pure=pure) for _ in range(count))
+
+
+def sentence(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+             word_range: 'tuple[int, int]' = (4, 8), *,
+             pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+             rng: 'Optional[Random]' = None,
+             cache: 'Optional[FragmentCache]' = None,
+             weights: 'Optional[Distribution | Sequence[float]]' = None,
+             exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None,
+             regenerate: 'bool' = False) -> 'Iterator[str]':
+    """Generate a list of random sentences.
+
+    .. code-block:: python
+
+        >>> list(itertools.islice(sentence(), 1))
+        ['Aute irure et commodo sunt do duis dolor.']
+
+    Args:
+        count: Number of non-repeated random sentences.
+        comma: Random range for number of commas. The function will use :func:`random.randint`
+            to choose a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        cache: Cache of pre-rendered sentences to draw from, see :class:`FragmentCache`.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+        regenerate: Instead of keeping the generated sentences for cycling, regenerate
+            each of them from its own seed derived from ``seed``, so that memory usage
+            is constant regardless of ``count``. It cannot be used with ``cache``.
+
+    Returns:
+        Indefinite random sentence generator, which can be pickled to be resumed later.
+
+    """
+    if regenerate:
+        if cache is not None:
+            raise ValueError('cache cannot be used with regenerate')
+        source = _get_rng(seed, rng)
+        if seed is None:
+            seed = source.getrandbits(128)  # nosec B311
+        lorem = LoremGenerator(pool=pool, seed=seed, weights=weights, exponent=exponent, stats=stats)
+        # the cycle order has a generator of its own, as that of items is reseeded for each item
+        return _SeededCycle(functools.partial(_render_seeded, lorem, seed, 'gen_sentence', (comma, word_range)),
+                            count, random.Random(source.getrandbits(128)))  # nosec B311
+
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng, cache=cache,
+                           weights=weights, exponent=exponent, stats=stats)
+    return _RandomCycle(functools.partial(lorem.gen_sentence, comma, word_range), count, lorem.rng)
+
+
+def paragraph(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+              word_range: 'tuple[int, int]' = (4, 8),
+              sentence_range: 'tuple[int, int]' = (5, 10), *,
+              pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+              rng: 'Optional[Random]' = None,
+              cache: 'Optional[FragmentCache]' = None,
+              weights: 'Optional[Distribution | Sequence[float]]' = None,
+              exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None,
+              regenerate: 'bool' = False) -> 'Iterator[str]':
+    """Generate a list of random paragraphs.
+
+    .. code-block:: python
+
+        >>> list(itertools.islice(paragraph(), 1))
+        ['Aute sint et cupidatat aliquip. Non exercitation est aliquip voluptate '
+            'fugiat, reprehenderit ad occaecat laboris velit consequat. Magna enim '
+            'deserunt aute laborum fugiat exercitation. Aliqua ex sunt fugiat in '
+            'magna voluptate. Elit nisi exercitation nostrud. Magna proident et '
+            'fugiat eiusmod cupidatat fugiat, sit culpa fugiat non ea eu '
+            'reprehenderit elit. Proident mollit mollit ut cillum. Nostrud voluptate '
+            'aliquip cupidatat anim.']
+
+    Args:
+        count: Number of non-repeated random paragraphs.
+        comma: Random range for number of commas. The function will use :func:`random.randint`
+            to choose a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function
+            will use :func:`random.randint` to choose a random integer as the number of sentences.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        cache: Cache of pre-rendered paragraphs to draw from, see :class:`FragmentCache`.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+        regenerate: Instead of keeping the generated paragraphs for cycling, regenerate
+            each of them from its own seed derived from ``seed``, so that memory usage
+            is constant regardless of ``count``. It cannot be used with ``cache``.
+
+    Returns:
+        Random paragraph generator, which can be pickled to be resumed later.
+
+    """
+    if regenerate:
+        if cache is not None:
+            raise ValueError('cache cannot be used with regenerate')
+        source = _get_rng(seed, rng)
+        if seed is None:
+            seed = source.getrandbits(128)  # nosec B311
+        lorem = LoremGenerator(pool=pool, seed=seed, weights=weights, exponent=exponent, stats=stats)
+        # the cycle order has a generator of its own, as that of items is reseeded for each item
+        return _SeededCycle(functools.partial(_render_seeded, lorem, seed, 'gen_paragraph',
+                                              (comma, word_range, sentence_range)),
+                            count, random.Random(source.getrandbits(128)))  # nosec B311
+
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng, cache=cache,
+                           weights=weights, exponent=exponent, stats=stats)
+    return _RandomCycle(functools.partial(lorem.gen_paragraph, comma, word_range, sentence_range),
+                        count, lorem.rng)
+
+
+def get_word(count: 'int | tuple[int, int]' = 1,
+             sep: 'str' = ' ',
+             func: 'Optional[str | Callable[[str], str]]' = None,
+             args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {},
+             pool: 'Iterable[str]' = _TEXT, *, seed: 'Optional[Seed]' = None,
+             rng: 'Optional[Random]' = None,
+             weights: 'Optional[Distribution | Sequence[float]]' = None,
+             exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None,
+             pure: 'bool' = False) -> 'str':  # pylint: disable=dangerous-default-value
+    """Return random words.
+
+    .. code-block:: python
+
+        >>> get_word(count=3)
+        'anim voluptate non'
+        >>> get_word(count=3, func='capitalize')
+        'Non Labore Ut'
+        >>> get_word(count=3, func=lambda s: s.upper())
+        'NISI TEMPOR CILLUM'
+
+    Args:
+        count: Number of random words. To generate random number of words, supply a 2-element
+            tuple of :obj:`int`, the function will use :func:`random.randint` to choose a
+            random integer as the number of random words.
+        sep: Seperator between each word.
+        func: Filter function. It can be a function name of :obj:`str`, or a customised
+            function that takes the original :obj:`str` and returns the modified :obj:`str`.
+        args: Additional positional arguments for ``func``.
+        kwargs: Additional keyword arguments for ``func``.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+        pure: If ``func`` is a pure function, it is applied only once per distinct word,
+            see :meth:`LoremGenerator.gen_word`.
+
+    Returns:
+        Random words.
+
+    """
+    rng = _get_rng(seed, rng)
+    if isinstance(count, tuple):
+        count = rng.randint(*count)  # nosec B311
+    return sep.join(itertools.islice(word(count, func, args, kwargs, pool=pool, rng=rng,
+                                          weights=weights, exponent=exponent, stats=stats,
+                                          pure=pure), count))
+
+
+def get_sentence(count: 'int | tuple[int, int]' = 1,
+                 sep: 'str' = ' ',
+                 comma: 'tuple[int, int]' = (0, 2),
+                 word_range: 'tuple[int, int]' = (4, 8), *,
+                 pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                 rng: 'Optional[Random]' = None,
+                 cache: 'Optional[FragmentCache]' = None,
+                 weights: 'Optional[Distribution | Sequence[float]]' = None,
+                 exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None) -> 'str':
+    """Return random sentences.
+
+    .. code-block:: python
+
+        >>> get_sentence()
+        'Nostrud laboris lorem minim sit culpa, aliqua nostrud in amet, sint pariatur eiusmod esse.'
+
+    Args:
+        count: Number of random sentences. To generate random number of sentences, supply a
+            2-element tuple of :obj:`int`, the function will use :func:`random.randint` to
+            choose a random integer as the number of random sentences.
+        sep: Seperator between each sentence.
+        comma: Random range for number of commas. The function will use :func:`random.randint`
+            to choose a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        cache: Cache of pre-rendered sentences to draw from, see :class:`FragmentCache`.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+
+    Returns:
+        Random sentences.
+
+    """
+    rng = _get_rng(seed, rng)
+    if isinstance(count, tuple):
+        count = rng.randint(*count)  # nosec B311
+    return sep.join(itertools.islice(sentence(count, comma, word_range,
+                                              pool=pool, rng=rng, cache=cache,
+                                              weights=weights, exponent=exponent, stats=stats), count))
+
+
+def get_paragraph(count: 'int | tuple[int, int]' = 1,
+                  sep: 'str' = os.linesep,
+                  comma: 'tuple[int, int]' = (0, 2),
+                  word_range: 'tuple[int, int]' = (4, 8),
+                  sentence_range: 'tuple[int, int]' = (5, 10), *,
+                  pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                  rng: 'Optional[Random]' = None,
+                  cache: 'Optional[FragmentCache]' = None,
+                  weights: 'Optional[Distribution | Sequence[float]]' = None,
+                  exponent: 'float' = 1.0, stats: 'Optional[GeneratorStats]' = None) -> 'str':
+    r"""Return random paragraphs.
+
+    .. code-block:: python
+
+        >>> get_paragraph()
+        'Exercitation magna sunt excepteur irure adipiscing commodo duis. Est '
+        'ipsum qui deserunt, deserunt nostrud reprehenderit esse. Do velit '
+        'est in velit sed. Sunt officia officia lorem. Commodo lorem '
+        'exercitation veniam officia pariatur velit. Deserunt deserunt sed '
+        'consequat laborum consequat dolor. Et consectetur irure sint elit tempor,'
+        ' est minim nisi eiusmod id excepteur. Minim cillum veniam sed aliquip '
+        'anim sit, pariatur nostrud ex cillum laboris laborum. Laborum ullamco '
+        'mollit elit. Amet id incididunt ipsum sed.'
+
+    Args:
+        count: Number of random paragraphs. To generate random number of paragraphs, supply a
+            2-element tuple of :obj:`int`, the function will use :func:`random.randint` to choose
+            a random integer as the number of random paragraphs.
+        sep: Seperator between each paragraph. The default value is OS-dependent as :data:`os.linsep`
+            (``\r\n`` on Windows, ``\n`` on POSIX).
+        comma: Random range for number of commas. The function will use :func:`random.randint` to choose
+            a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function will use
+            :func:`random.randint` to choose a random integer as the number of sentences.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        cache: Cache of pre-rendered paragraphs to draw from, see :class:`FragmentCache`.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+        stats: Statistics to be collected, see :class:`GeneratorStats`.
+
+    Returns:
+        Random paragraphs.
+
+    """
+    rng = _get_rng(seed, rng)
+    if isinstance(count, tuple):
+        count = rng.randint(*count)  # nosec B311
+    return sep.join(itertools.islice(paragraph(count, comma, word_range, sentence_range,
+                                               pool=pool, rng=rng, cache=cache,
+                                               weights=weights, exponent=exponent, stats=stats), count))
+
+
+def get_text(size: 'int', unit: 'Unit' = 'chars', sep: 'str' = ' ',
+             comma: 'tuple[int, int]' = (0, 2),
+             word_range: 'tuple[int, int]' = (4, 8), *,
+             filler: 'str' = ' ', pool: 'Iterable[str]' = _TEXT,
+             seed: 'Optional[Seed]' = None, rng: 'Optional[Random]' = None) -> 'str':
+    """Return random text of exact size.
+
+    .. code-block:: python
+
+        >>> get_text(64)
+        'Lorem culpa sint laboris nisi sunt. Ipsum elit irure ex commodo.'
+        >>> len(get_text(4096, unit='bytes').encode())
+        4096
+
+    Args:
+        size: Size of the text.
+        unit: Unit of ``size``, i.e. ``'chars'`` for number of characters or ``'bytes'``
+            for number of bytes in UTF-8 encoding.
+        sep: Seperator between each sentence.
+        comma: Random range for number of commas. The function will use :func:`random.randint`
+            to choose a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        filler: Filler to pad the text, which must be of size ``1``. It is only used when the
+            room left after the last sentence is too small for any word.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+
+    Returns:
+        Random text of size ``size``, ending on a sentence boundary (plus ``filler``).
+
+    """
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng)
+    return lorem.gen_text(size, unit, sep, comma, word_range, filler)
+
+
+def write_text(fileobj: 'IO[Any]', count: 'Optional[int]' = None, size: 'Optional[int]' = None, *,
+               kind: 'Kind' = 'paragraph', sep: 'Optional[str]' = None,
+               comma: 'tuple[int, int]' = (0, 2),
+               word_range: 'tuple[int, int]' = (4, 8),
+               sentence_range: 'tuple[int, int]' = (5, 10),
+               pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+               rng: 'Optional[Random]' = None, encoding: 'str' = 'utf-8',
+               buffer_size: 'int' = _BUFFER_SIZE) -> 'int':
+    r"""Write random text to a file object.
+
+    The text is generated and written in chunks of ``buffer_size``, so memory usage
+    is constant regardless of ``count`` and ``size``.
+
+    .. code-block:: python
+
+        >>> with open('lorem.txt', 'wb') as file:
+        ...     write_text(file, size=1 << 30)
+        1073741824
+
+    Args:
+        fileobj: Text or binary file object to write to.
+        count: Number of random words, sentences or paragraphs.
+        size: Maximum size of the text, in bytes for binary file objects, or in characters
+            for text file objects. The last item may be truncated to fit,
+            on a character boundary.
+        kind: Kind of text, i.e. ``'word'``, ``'sentence'`` or ``'paragraph'``.
+        sep: Seperator between each item. The default value is :data:`os.linesep` for
+            paragraphs, and ``' '`` for words and sentences.
+        comma: Random range for number of commas. The function will use :func:`random.randint` to choose
+            a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function will use
+            :func:`random.randint` to choose a random integer as the number of sentences.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        encoding: Encoding of the text for binary file objects.
+        buffer_size: Size of each chunk written to ``fileobj``.
+
+    Returns:
+        Number of bytes (or characters) written. If neither ``count`` nor ``size`` is
+        given, the text is written indefinitely.
+
+    """
+    if sep is None:
+        sep = os.linesep if kind == 'paragraph' else ' '
+    binary = _is_binary(fileobj)
+
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng)
+    items = lorem.iter_text(kind, comma, word_range, sentence_range)
+    if count is not None:
+        items = itertools.islice(items, count)
+
+    written = 0
+    for chunk in _chunked(items, sep, buffer_size):
+        data = chunk.encode(encoding) if binary else chunk  # type: str | bytes
+        if size is not None and written + len(data) >= size:
+            data = _truncate(data, size - written, encoding)
+            fileobj.write(data)
+            written += len(data)
+            break
+        fileobj.write(data)
+        written += len(data)
+    return written
+
+
+class LoremStream(io.RawIOBase):
+    r"""Read-only binary stream of random paragraphs.
+
+    Paragraphs are drawn from :func:`paragraph`, encoded one at a time and copied
+    into the buffers passed to :meth:`readinto`, so memory usage is constant
+    regardless of ``size``. The stream may be wrapped in :class:`io.BufferedReader`,
+    or passed as is to anything reading from a file object.
+
+    .. code-block:: python
+
+        >>> stream = LoremStream(size=1 << 30, seed=42)
+        >>> len(stream)
+        1073741824
+        >>> shutil.copyfileobj(stream, file)
+
+    Args:
+        size: Size of the stream in bytes. The last paragraph is truncated to fit.
+            If not given, the stream never ends, and has no length.
+        count: Number of non-repeated random paragraphs.
+        sep: Seperator between each paragraph, defaults to :data:`os.linesep`.
+        comma: Random range for number of commas. The function will use :func:`random.randint`
+            to choose a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function
+            will use :func:`random.randint` to choose a random integer as the number of sentences.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        encoding: Encoding of the text.
+
+    """
+
+    def __init__(self, size: 'Optional[int]' = None, count: 'int' = _STREAM_COUNT, *,
+                 sep: 'Optional[str]' = None, comma: 'tuple[int, int]' = (0, 2),
+                 word_range: 'tuple[int, int]' = (4, 8),
+                 sentence_range: 'tuple[int, int]' = (5, 10),
+                 pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                 rng: 'Optional[Random]' = None, encoding: 'str' = 'utf-8') -> 'None':
+        super().__init__()
+        if size is not None and size < 0:
+            raise ValueError('size must be non-negative')
+        self._size = size
+        self._position = 0
+        self._sep = os.linesep if sep is None else sep
+        self._encoding = encoding
+        self._items = paragraph(count, comma, word_range, sentence_range,
+                                pool=pool, seed=seed, rng=rng)
+        self._pending = memoryview(b'')
+
+    def __len__(self) -> 'int':
+        """Return the size of the stream.
+
+        Raises:
+            TypeError: If the stream never ends.
+
+        """
+        if self._size is None:
+            raise TypeError('unbounded LoremStream has no len()')
+        return self._size
+
+    def __bool__(self) -> 'bool':
+        """Return :data:`True`, as a file object regardless of its length."""
+        return True
+
+    def readable(self) -> 'bool':
+        """Return :data:`True`, as the stream is readable."""
+        return True
+
+    def tell(self) -> 'int':
+        """Return the number of bytes read so far."""
+        if self.closed:
+            raise ValueError('I/O operation on closed stream')
+        return self._position
+
+    def readinto(self, buffer: 'bytearray | memoryview') -> 'int':  # type: ignore[override]
+        """Read random text into a buffer.
+
+        Args:
+            buffer: Writable buffer to fill.
+
+        Returns:
+            Number of bytes read, which is less than the size of ``buffer`` only
+            at the end of the stream.
+
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed stream')
+
+        with memoryview(buffer) as raw, raw.cast('B') as view:
+            limit = len(view)
+            if self._size is not None:
+                limit = min(limit, self._size - self._position)
+
+            filled = 0
+            pending = self._pending
+            while filled < limit:
+                if not pending:
+                    pending = memoryview((next(self._items) + self._sep).encode(self._encoding))
+                chunk = pending[:limit - filled]
+                view[filled:filled + len(chunk)] = chunk
+                pending = pending[len(chunk):]
+                filled += len(chunk)
+            self._pending = pending
+
+        self._position += filled
+        return filled
+
+
+def _report(rows: 'int', seconds: 'float') -> 'Dict[str, float]':
+    """Report the throughput of records.
+
+    Args:
+        rows: Number of records.
+        seconds: Time elapsed in seconds.
+
+    Returns:
+        Number of ``rows``, ``seconds`` elapsed and ``rows_per_second``.
+
+    """
+    return {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds > 0 else 0.0}
+
+
+def _get_column(name: 'str', spec: 'Column') -> 'tuple[Any, ...]':
+    """Normalise the spec of a column.
+
+    Args:
+        name: Name of the column.
+        spec: Kind of text, or options of :func:`get_word`, :func:`get_sentence` or
+            :func:`get_paragraph` with the kind of text as ``'kind'``.
+
+    Returns:
+        Kind of text, ``count``, ``sep``, ``comma``, ``word_range`` and ``sentence_range``.
+
+    Raises:
+        ValueError: If the kind of text or any option is unknown.
+
+    """
+    options = {'kind': spec} if isinstance(spec, str) else dict(spec)
+    kind = options.pop('kind', None)
+    if kind not in _COLUMN_OPTIONS:
+        raise ValueError('unknown kind of text of column {!r}: {!r}'.format(name, kind))
+    unknown = options.keys() - _COLUMN_OPTIONS[kind].keys()
+    if unknown:
+        raise ValueError('unknown options of column {!r}: {}'.format(name, ', '.join(sorted(unknown))))
+
+    values = dict(_COLUMN_OPTIONS['paragraph'], **_COLUMN_OPTIONS[kind])
+    values.update(options)
+    return (kind, values['count'], values['sep'], tuple(values['comma']),
+            tuple(values['word_range']), tuple(values['sentence_range']))
+
+
+class RecordGenerator:
+    """Generate records of random text, column by column.
+
+    Each column of the ``schema`` is a lorem spec, i.e. the kind of text (``'word'``,
+    ``'sentence'`` or ``'paragraph'``), or a mapping of the kind as ``'kind'`` and
+    options as of :func:`get_word`, :func:`get_sentence` or :func:`get_paragraph`,
+    i.e. ``count``, ``sep``, ``comma``, ``word_range`` and ``sentence_range``.
+
+    .. code-block:: python
+
+        >>> records = RecordGenerator({
+        ...     'name': {'kind': 'word', 'count': (1, 3)},
+        ...     'title': 'sentence',
+        ...     'body': {'kind': 'paragraph', 'sentence_range': (2, 4)},
+        ... }, seed=42)
+        >>> report = records.load_sqlite('load.db', 'posts', 1_000_000)
+        >>> report['rows']
+        1000000
+
+    Rows are generated in batches, column by column: the structure of all cells
+    of a column is planned, and their words are drawn, at once, rather than one
+    call to the generation functions for each cell.
+
+    Args:
+        schema: Columns of the records, mapping names to specs.
+        pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            records are reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        weights: Weights of the words in ``pool``, or the name of a distribution, i.e.
+            ``'uniform'`` or ``'zipf'``, see :class:`LoremGenerator`.
+        exponent: Exponent of the Zipf distribution.
+
+    Raises:
+        ValueError: If a column is of an unknown kind of text, or has unknown options.
+
+    """
+
+    @property
+    def columns(self) -> 'tuple[str, ...]':
+        """Return the names of the columns."""
+        return self._columns
+
+    def __init__(self, schema: 'Mapping[str, Column]', *, pool: 'Iterable[str]' = _TEXT,
+                 seed: 'Optional[Seed]' = None, rng: 'Optional[Random]' = None,
+                 weights: 'Optional[Distribution | Sequence[float]]' = None,
+                 exponent: 'float' = 1.0) -> 'None':
+        self._columns = tuple(schema)
+        self._specs = [_get_column(name, spec) for name, spec in schema.items()]
+        self._lorem = LoremGenerator(pool, seed=seed, rng=rng, weights=weights, exponent=exponent)
+
+    def _gen_column(self, count: 'int', kind: 'Kind', number: 'int | tuple[int, int]', sep: 'str',
+                    comma: 'tuple[int, int]', word_range: 'tuple[int, int]',
+                    sentence_range: 'tuple[int, int]') -> 'list[str]':
+        """Generate the cells of a column.
+
+        Args:
+            count: Number of cells.
+            kind: Kind of text.
+            number: Number of words, sentences or paragraphs in each cell, or its random range.
+            sep: Seperator between each word, sentence or paragraph.
+            comma: Random range for number of commas.
+            word_range: Random range for number of words in each clause.
+            sentence_range: Random range for number of sentences in each paragraph.
+
+        Returns:
+            Random text of each cell.
+
+        """
+        lorem = self._lorem
+        randint = lorem.rng.randint
+
+        if isinstance(number, tuple):
+            ranged = [randint(*number) for _ in range(count)]  # nosec B311
+            sizes, total = ranged, sum(ranged)  # type: int | list[int], int
+        else:
+            sizes, total = number, count * number
+
+        if kind == 'word':
+            items = list(itertools.islice(lorem.pool, total))
+        elif kind == 'sentence':
+            items = lorem._render_items(lorem._plan(total, comma, word_range))  # pylint: disable=protected-access
+        else:
+            counts = [max(randint(*sentence_range), 1) for _ in range(total)]  # nosec B311
+            plan = lorem._plan(sum(counts), comma, word_range)  # pylint: disable=protected-access
+            items = lorem._render_items(plan, counts)  # pylint: disable=protected-access
+        return _group(items, count, sizes, sep)
+
+    def gen_columns(self, count: 'int') -> 'Dict[str, list[str]]':
+        """Generate a batch of records, column-wise.
+
+        Args:
+            count: Number of records.
+
+        Returns:
+            Cells of each column.
+
+        """
+        return {name: self._gen_column(count, *spec) for name, spec in zip(self._columns, self._specs)}
+
+    def _iter_batches(self, count: 'Optional[int]', batch: 'int') -> 'Iterator[list[list[str]]]':
+        """Generate batches of records, column-wise.
+
+        Args:
+            count: Number of records. If not given, records are generated indefinitely.
+            batch: Number of records in each batch.
+
+        Returns:
+            Cells of each column of each batch.
+
+        """
+        while count is None or count > 0:
+            size = batch if count is None else min(batch, count)
+            if count is not None:
+                count -= size
+            yield [self._gen_column(size, *spec) for spec in self._specs]
+
+    def iter_rows(self, count: 'Optional[int]' = None, batch: 'int' = _RECORD_BATCH) -> 'Iterator[tuple[str, ...]]':
+        """Generate records, row by row.
+
+        Args:
+            count: Number of records. If not given, records are generated indefinitely.
+            batch: Number of records generated at once.
+
+        Returns:
+            Cells of each record, in the order of :attr:`columns`.
+
+        """
+        for columns in self._iter_batches(count, batch):
+            yield from zip(*columns)
+
+    def _write(self, fileobj: 'IO[Any]', count: 'int', batch: 'int', encoding: 'str',
+               header: 'str', render: 'Callable[[list[list[str]]], str]') -> 'Dict[str, float]':
+        """Write records to a file object, a batch per write.
+
+        Args:
+            fileobj: Text or binary file object to write to.
+            count: Number of records.
+            batch: Number of records in each write.
+            encoding: Encoding of the text for binary file objects.
+            header: Text written before the records.
+            render: Function rendering a batch of records as text.
+
+        Returns:
+            Report of the writing, see :meth:`write_csv`.
+
+        """
+        binary = _is_binary(fileobj)
+        start = time.perf_counter()
+        for chunk in itertools.chain((header,), map(render, self._iter_batches(count, batch))):
+            if chunk:
+                fileobj.write(chunk.encode(encoding) if binary else chunk)
+        return _report(count, time.perf_counter() - start)
+
+    def write_csv(self, fileobj: 'IO[Any]', count: 'int', *, header: 'bool' = True,
+                  batch: 'int' = _RECORD_BATCH, encoding: 'str' = 'utf-8',
+                  **fmtparams: 'Any') -> 'Dict[str, float]':
+        """Write records to a file object as CSV.
+
+        Each batch is formatted by :func:`csv.writer` into memory, then written with
+        a single call. Text file objects shall be opened with ``newline=''``.
+
+        Args:
+            fileobj: Text or binary file object to write to.
+            count: Number of records.
+            header: Whether to write the names of the columns first.
+            batch: Number of records in each write.
+            encoding: Encoding of the text for binary file objects.
+            **fmtparams: Formatting parameters of :func:`csv.writer`.
+
+        Returns:
+            Report of the writing, i.e. number of ``rows``, ``seconds`` elapsed and
+            ``rows_per_second``.
+
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, **fmtparams)
 
-      sentence(count=1, comma=(0, 2), word_range=(4, 8)) -> Iterator[str]
+        def render(columns: 'list[list[str]]') -> 'str':
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(zip(*columns))
+            return buffer.getvalue()
 
-2. :func:`get_sentence` -- return random sentences
+        if header:
+            writer.writerow(self._columns)
+        return self._write(fileobj, count, batch, encoding, buffer.getvalue(), render)
 
-   .. code-block:: python
+    def write_jsonl(self, fileobj: 'IO[Any]', count: 'int', *, batch: 'int' = _RECORD_BATCH,
+                    encoding: 'str' = 'utf-8') -> 'Dict[str, float]':
+        """Write records to a file object as JSON Lines.
 
-      get_sentence(count=1, sep=' ', comma=(0, 2), word_range=(4, 8)) -> Union[str]
+        Each record is written as a JSON object of its columns. Keys are encoded
+        only once, and the cells of each column are encoded at once.
 
-Get Random Paragraphs
----------------------
+        Args:
+            fileobj: Text or binary file object to write to.
+            count: Number of records.
+            batch: Number of records in each write.
+            encoding: Encoding of the text for binary file objects.
 
-The :mod:`lorem` module provides two different ways for getting random paragraphs.
+        Returns:
+            Report of the writing, see :meth:`write_csv`.
 
-1. :func:`paragraph` -- generate a list of random paragraphs
+        """
+        keys = (json.dumps(name, ensure_ascii=False).replace('{', '{{').replace('}', '}}')
+                for name in self._columns)
+        template = '{{' + ', '.join(key + ': {}' for key in keys) + '}}\n'
+        encode = json.encoder.encode_basestring
 
-   .. code-block:: python
+        def render(columns: 'list[list[str]]') -> 'str':
+            return ''.join(map(template.format, *(map(encode, cells) for cells in columns)))
 
-      paragraph(count=1, comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10)) -> Iterator[str]
+        return self._write(fileobj, count, batch, encoding, '', render)
 
-2. :func:`get_paragraph` -- return random paragraphs
+    def load_sqlite(self, database: 'Connection | str | os.PathLike[str]', table: 'str', count: 'int', *,
+                    create: 'bool' = True, batch: 'int' = _RECORD_BATCH) -> 'Dict[str, float]':
+        """Load records into a SQLite table.
 
-   .. code-block:: python
+        Each batch is inserted by :meth:`sqlite3.Cursor.executemany` in its own
+        transaction.
 
-      get_paragraph(count=1, sep=os.linesep, comma=(0, 2), word_range=(4, 8), sentence_range=(5, 10)) -> Union[str]
+        Args:
+            database: Connection to the database, or path to the database file.
+            table: Name of the table.
+            count: Number of records.
+            create: Whether to create the table, with a ``TEXT`` column for each
+                column, if it does not exist.
+            batch: Number of records in each transaction.
 
-"""
-import itertools
-import os
-import random
-from typing import TYPE_CHECKING
+        Returns:
+            Report of the loading, see :meth:`write_csv`.
 
-if TYPE_CHECKING:
-    from typing import Any, Callable, Iterable, Iterator, Optional
+        """
+        if isinstance(database, (str, os.PathLike)):
+            import sqlite3  # pylint: disable=import-outside-toplevel
+            with contextlib.closing(sqlite3.connect(os.fspath(database))) as connection:
+                return self.load_sqlite(connection, table, count, create=create, batch=batch)
 
-__all__ = [
-    'LoremGenerator',
-    'word', 'sentence', 'paragraph',
-    'get_word', 'get_sentence', 'get_paragraph',
-]
+        def quote(name: 'str') -> 'str':
+            return '"{}"'.format(name.replace('"', '""'))
 
-# version string
-__version__ = '1.3.0.post3'
+        columns = ', '.join(map(quote, self._columns))
+        if create:
+            with database:
+                database.execute('CREATE TABLE IF NOT EXISTS {} ({})'.format(
+                    quote(table), ', '.join(quote(name) + ' TEXT' for name in self._columns)))
+        statement = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(table), columns, ', '.join('?' * len(self._columns)))  # nosec B608
 
-#: The original lorem ipsum text pool.
-_TEXT = ('ad', 'adipiscing', 'aliqua', 'aliquip', 'amet', 'anim', 'aute', 'cillum', 'commodo',
-         'consectetur', 'consequat', 'culpa', 'cupidatat', 'deserunt', 'do', 'dolor', 'dolore',
-         'duis', 'ea', 'eiusmod', 'elit', 'enim', 'esse', 'est', 'et', 'eu', 'ex', 'excepteur',
-         'exercitation', 'fugiat', 'id', 'in', 'incididunt', 'ipsum', 'irure', 'labore', 'laboris',
-         'laborum', 'lorem', 'magna', 'minim', 'mollit', 'nisi', 'non', 'nostrud', 'nulla',
-         'occaecat', 'officia', 'pariatur', 'proident', 'qui', 'quis', 'reprehenderit', 'sed',
-         'sint', 'sit', 'sunt', 'tempor', 'ullamco', 'ut', 'velit', 'veniam', 'voluptate')
+        start = time.perf_counter()
+        for cells in self._iter_batches(count, batch):
+            with database:
+                database.executemany(statement, zip(*cells))
+        return _report(count, time.perf_counter() - start)
 
 
-def _random_cycle(iterable: 'Iterable[Any]') -> 'Iterator[Any]':
-    """Randomly cycle the given iterable.
+def _derive_seed(seed: 'Optional[Seed]', index: 'int') -> 'int':
+    """Derive seed of a shard.
 
     Args:
-        iterable: Iterable to be cycled.
+        seed: Seed of the whole text.
+        index: Index of the shard.
 
     Returns:
-        Randomly cycled iterable.
+        Seed of the shard, which is stable across processes and platforms.
 
     """
-    pool = []  # type: list
-    for item in iterable:
-        yield item
-        pool.append(item)
-    random.shuffle(pool)
+    key = '{!r}:{}'.format(seed, index).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(key, digest_size=16).digest(), 'big')
 
-    while True:
-        for item in pool:
-            yield item
-        random.shuffle(pool)
 
-
-class LoremGenerator:
-    """Generate random words.
+def _gen_shard(options: 'Dict[str, Any]', index: 'int', count: 'int') -> 'bytes':
+    """Generate a shard of random text.
 
     Args:
-        pool: List of words to be used as random word pool.
-        dupe: Duplication to generate the word pool.
+        options: Generation options, see :func:`write_parallel`.
+        index: Index of the shard.
+        count: Number of items in the shard.
+
+    Returns:
+        Encoded text of the shard.
 
     """
+    lorem = LoremGenerator(pool=options['pool'], seed=_derive_seed(options['seed'], index))
+    items = lorem.iter_text(options['kind'], options['comma'],
+                            options['word_range'], options['sentence_range'])
+    return options['sep'].join(itertools.islice(items, count)).encode(options['encoding'])
 
-    @property
-    def pool(self) -> 'Iterator[str]':
-        """Return the current random word pool."""
-        return self._pool
 
-    def __init__(self, pool: 'Iterable[str]' = _TEXT, dupe: 'int' = 1) -> 'None':
-        self._text = pool
-        self._pool = self._gen_pool(dupe)
+def _iter_shards(options: 'Dict[str, Any]', counts: 'Iterable[int]',
+                 jobs: 'int') -> 'Generator[bytes, None, None]':
+    """Generate shards of random text in order.
 
-    def _gen_pool(self, dupe: 'int' = 1) -> 'Iterator[str]':
-        """Generate word pool.
+    At most twice as many shards as workers are in flight, so that memory usage
+    is bound regardless of the number of shards.
 
-        Args:
-            dupe: Duplication to generate the word pool.
+    Args:
+        options: Generation options, see :func:`write_parallel`.
+        counts: Number of items in each shard.
+        jobs: Number of worker processes. If ``1``, the shards are generated in the
+            current process.
 
-        Returns:
-            An infinite loop word pool.
+    Returns:
+        Encoded text of each shard.
 
-        """
-        pool = []  # type: list[str]
-        for _ in range(dupe):
-            pool.extend(self._text)
-        random.shuffle(pool)
+    """
+    if jobs == 1:
+        for index, count in enumerate(counts):
+            yield _gen_shard(options, index, count)
+        return
 
-        while pool:  # pragma: no cover
-            for text in pool:
-                yield text
-            random.shuffle(pool)
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        pending = collections.deque()  # type: Deque[concurrent.futures.Future[bytes]]
+        try:
+            for index, count in enumerate(counts):
+                pending.append(executor.submit(_gen_shard, options, index, count))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
-    def gen_word(self, # pylint: disable=dangerous-default-value
-                 func: 'Optional[str | Callable[[str], str]]' = None,
-                 args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {}) -> 'str':
-        """Generate random word.
 
-        Args:
-            func: Filter function. It can be an attribute name of :obj:`str`, or a customised
-                function that takes the original :obj:`str` and returns the modified :obj:`str`.
-            args:  Additional positional arguments for ``func``.
-            kwargs: Additional keyword arguments for ``func``.
+def write_parallel(fileobj: 'IO[Any] | str', count: 'Optional[int]' = None,
+                   size: 'Optional[int]' = None, *,
+                   kind: 'Kind' = 'paragraph', sep: 'Optional[str]' = None,
+                   comma: 'tuple[int, int]' = (0, 2),
+                   word_range: 'tuple[int, int]' = (4, 8),
+                   sentence_range: 'tuple[int, int]' = (5, 10),
+                   pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                   encoding: 'str' = 'utf-8', jobs: 'Optional[int]' = None,
+                   shard_count: 'int' = _SHARD_COUNT) -> 'int':
+    """Write random text to a file object with multiple processes.
 
-        Returns:
-            Random word.
+    The text is split into shards of ``shard_count`` items, each generated by a
+    worker process with a seed derived from ``seed`` and the index of the shard.
+    The output thus only depends on ``seed`` and ``shard_count``, but not on
+    the number of workers.
 
-        """
-        text = next(self.pool)
-        if func is not None:
-            if isinstance(func, str):
-                text = getattr(text, func)(*args, **kwargs)
-            else:
-                text = func(text, *args, **kwargs)
-        return text
+    .. code-block:: python
 
-    def gen_sentence(self, comma: 'tuple[int, int]',
-                     word_range: 'tuple[int, int]') -> 'str':
-        """Generate random sentence.
+        >>> with open('lorem.txt', 'wb') as file:
+        ...     write_parallel(file, size=1 << 30, seed=42, jobs=8)
+        1073741824
+        >>> write_parallel('lorem-{:04d}.txt', count=100_000, seed=42)
+        46231948
 
-        Args:
-            comma: Random range for number of commas. The function will use :func:`random.randint`
-                to choose a random integer as the number of commas.
-            word_range: Random range for number of words in each sentence. The function will use
-                :func:`random.randint` to choose a random integer as the number of words.
+    Args:
+        fileobj: Text or binary file object to write to, or a path template to be formatted
+            with the index of each shard, so that each shard is written to its own file.
+        count: Number of random words, sentences or paragraphs.
+        size: Maximum size of the text, in bytes for binary file objects (and files of shards),
+            or in characters for text file objects. The last item may be
+            truncated to fit, on a character boundary.
+        kind: Kind of text, i.e. ``'word'``, ``'sentence'`` or ``'paragraph'``.
+        sep: Seperator between each item. The default value is :data:`os.linesep` for
+            paragraphs, and ``' '`` for words and sentences.
+        comma: Random range for number of commas. The function will use :func:`random.randint` to choose
+            a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function will use
+            :func:`random.randint` to choose a random integer as the number of sentences.
+        pool: List of words to be used as random word pool.
+        seed: Seed of the text, from which seeds of the shards are derived. If not given,
+            a random seed is drawn from the global :mod:`random` module.
+        encoding: Encoding of the text for binary file objects.
+        jobs: Number of worker processes, defaults to the number of processors.
+        shard_count: Number of items in each shard.
 
-        Returns:
-            Random sentence.
+    Returns:
+        Number of bytes (or characters) written. If neither ``count`` nor ``size`` is
+        given, the text is written indefinitely.
 
-        """
-        text = self.gen_word(func='capitalize')
-        for _ in range(random.randint(*word_range) - 1):  # nosec B311
-            text += ' ' + self.gen_word()
+    """
+    if sep is None:
+        sep = os.linesep if kind == 'paragraph' else ' '
+    if seed is None:
+        seed = random.getrandbits(64)  # nosec B311
+    options = {
+        'kind': kind, 'sep': sep, 'comma': tuple(comma), 'word_range': tuple(word_range),
+        'sentence_range': tuple(sentence_range), 'pool': _get_pool(pool), 'seed': seed,
+        'encoding': encoding,
+    }
 
-        for _ in range(random.randint(*comma)):  # nosec B311
-            include_comma = random.choice([True, False])  # nosec B311
-            if include_comma:
-                text += ','
-                for _ in range(random.randint(*word_range)):  # nosec B311
-                    text += ' ' + self.gen_word()
-                continue
-            break
-        return text + '.'
+    if count is None:
+        counts = itertools.repeat(shard_count)  # type: Iterable[int]
+    else:
+        full, rest = divmod(count, shard_count)
+        counts = itertools.chain(itertools.repeat(shard_count, full), [rest] if rest else [])
 
-    def gen_paragraph(self, comma: 'tuple[int, int]',
-                      word_range: 'tuple[int, int]',
-                      sentence_range: 'tuple[int, int]') -> 'str':
-        """Generate random paragraph.
+    binary = isinstance(fileobj, str) or _is_binary(fileobj)
+    written = 0
+    with contextlib.closing(_iter_shards(options, counts, jobs or os.cpu_count() or 1)) as shards:
+        for index, shard in enumerate(shards):
+            data = shard if binary else shard.decode(encoding)  # type: Any
+            if index and not isinstance(fileobj, str):
+                data = (sep.encode(encoding) if binary else sep) + data
+            last = size is not None and written + len(data) >= size
+            if last:
+                data = _truncate(data, cast('int', size) - written, encoding)
 
-        Args:
-            comma: Random range for number of commas. The function will use :func:`random.randint`
-                to choose a random integer as the number of commas.
-            word_range: Random range for number of words in each sentence. The function will use
-                :func:`random.randint` to choose a random integer as the number of words.
-            sentence_range: Random range for number of sentences in each  paragraph. The function
-                will use :func:`random.randint` to choose a random integer as the number of sentences.
+            if isinstance(fileobj, str):
+                with open(fileobj.format(index), 'wb') as file:
+                    file.write(data)
+            else:
+                fileobj.write(data)
+            written += len(data)
+            if last:
+                break
+    return written
 
-        Returns:
-            Random paragraph.
 
-        """
-        text = self.gen_sentence(comma=comma, word_range=word_range)
-        for _ in range(random.randint(*sentence_range) - 1):  # nosec B311
-            text += ' ' + self.gen_sentence(comma=comma, word_range=word_range)
-        return text
+async def _achunked(items: 'Iterable[str]', chunk_size: 'int',
+                    chunk_time: 'float') -> 'AsyncIterator[str]':
+    """Asynchronously iterate items, returning control to the event loop by chunks.
 
+    Args:
+        items: Items to be iterated.
+        chunk_size: Size of items iterated before returning control to the event loop.
+        chunk_time: Time in seconds spent before returning control to the event loop.
 
-def word(count: int = 1, func: 'Optional[str | Callable[[str], str]]' = None,
-         args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {}, *,
-         pool: 'Iterable[str]' = _TEXT,) -> 'Iterator[str]':  # pylint: disable=dangerous-default-value
-    """Generate a list of random words.
+    Returns:
+        Asynchronous iterator of the items.
+
+    """
+    clock = time.perf_counter
+    size = 0
+    deadline = clock() + chunk_time
+    for item in items:
+        yield item
+        size += len(item)
+        if size >= chunk_size or clock() >= deadline:
+            await asyncio.sleep(0)
+            size = 0
+            deadline = clock() + chunk_time
+
+
+async def aword(count: int = 1, func: 'Optional[str | Callable[[str], str]]' = None,  # pylint: disable=dangerous-default-value
+                args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {}, *,
+                pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                rng: 'Optional[Random]' = None, chunk_size: 'int' = _ASYNC_CHUNK_SIZE,
+                chunk_time: 'float' = _ASYNC_CHUNK_TIME,
+                pure: 'bool' = False) -> 'AsyncIterator[str]':
+    """Asynchronously generate a list of random words.
 
     .. code-block:: python
 
-        >>> list(itertools.cycle(word(count=3), 3))
-        ['labore', 'tempor', 'commodo']
-        >>> list(itertools.cycle(word(count=3, func='capitalize'), 3))
-        ['Ea', 'Lorem', 'Do']
-        >>> list(itertools.cycle(word(count=3, func=lambda s: s.upper()), 3))
-        ['UT', 'AMET', 'EXCEPTEUR']
+        >>> async for text in aword(count=3):
+        ...     print(text)
 
     Args:
         count: Number of non-repeated random words.
@@ -254,26 +4109,34 @@ def word(count: int = 1, func: 'Optional[str | Callable[[str], str]]' = None,
         args: Additional positional arguments for ``func``.
         kwargs: Additional keyword arguments for ``func``.
         pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        chunk_size: Number of characters generated before returning control to the event loop.
+        chunk_time: Time in seconds spent generating before returning control to the event loop.
+        pure: If ``func`` is a pure function, it is applied only once per distinct word,
+            see :meth:`LoremGenerator.gen_word`.
 
     Returns:
-        Indefinite random words generator.
+        Indefinite asynchronous random words generator.
 
     """
-    lorem = LoremGenerator(pool=pool, dupe=count)
-    yield from itertools.cycle(lorem.gen_word(func=func,
-                                              args=args,
-                                              kwargs=kwargs) for _ in range(count))
+    items = word(count, func, args, kwargs, pool=pool, seed=seed, rng=rng, pure=pure)
+    async for text in _achunked(items, chunk_size, chunk_time):
+        yield text
 
 
-def sentence(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
-             word_range: 'tuple[int, int]' = (4, 8), *,
-             pool: 'Iterable[str]' = _TEXT) -> 'Iterator[str]':
-    """Generate a list of random sentences.
+async def asentence(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+                    word_range: 'tuple[int, int]' = (4, 8), *,
+                    pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                    rng: 'Optional[Random]' = None, chunk_size: 'int' = _ASYNC_CHUNK_SIZE,
+                    chunk_time: 'float' = _ASYNC_CHUNK_TIME) -> 'AsyncIterator[str]':
+    """Asynchronously generate a list of random sentences.
 
     .. code-block:: python
 
-        >>> list(itertools.islice(sentence(), 1))
-        ['Aute irure et commodo sunt do duis dolor.']
+        >>> async for text in asentence(count=3):
+        ...     print(text)
 
     Args:
         count: Number of non-repeated random sentences.
@@ -282,32 +4145,33 @@ def sentence(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
         word_range: Random range for number of words in each sentence. The function will use
             :func:`random.randint` to choose a random integer as the number of words.
         pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        chunk_size: Number of characters generated before returning control to the event loop.
+        chunk_time: Time in seconds spent generating before returning control to the event loop.
 
     Returns:
-        Indefinite random sentence generator.
+        Indefinite asynchronous random sentence generator.
 
     """
-    lorem = LoremGenerator(pool=pool, dupe=count)
-    yield from _random_cycle(lorem.gen_sentence(comma=comma,
-                                                word_range=word_range) for _ in range(count))
+    items = sentence(count, comma, word_range, pool=pool, seed=seed, rng=rng)
+    async for text in _achunked(items, chunk_size, chunk_time):
+        yield text
 
 
-def paragraph(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
-              word_range: 'tuple[int, int]' = (4, 8),
-              sentence_range: 'tuple[int, int]' = (5, 10), *,
-              pool: 'Iterable[str]' = _TEXT) -> 'Iterator[str]':
-    """Generate a list of random paragraphs.
+async def aparagraph(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
+                     word_range: 'tuple[int, int]' = (4, 8),
+                     sentence_range: 'tuple[int, int]' = (5, 10), *,
+                     pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                     rng: 'Optional[Random]' = None, chunk_size: 'int' = _ASYNC_CHUNK_SIZE,
+                     chunk_time: 'float' = _ASYNC_CHUNK_TIME) -> 'AsyncIterator[str]':
+    """Asynchronously generate a list of random paragraphs.
 
     .. code-block:: python
 
-        >>> list(itertools.islice(paragraph(), 1))
-        ['Aute sint et cupidatat aliquip. Non exercitation est aliquip voluptate '
-            'fugiat, reprehenderit ad occaecat laboris velit consequat. Magna enim '
-            'deserunt aute laborum fugiat exercitation. Aliqua ex sunt fugiat in '
-            'magna voluptate. Elit nisi exercitation nostrud. Magna proident et '
-            'fugiat eiusmod cupidatat fugiat, sit culpa fugiat non ea eu '
-            'reprehenderit elit. Proident mollit mollit ut cillum. Nostrud voluptate '
-            'aliquip cupidatat anim.']
+        >>> async for text in aparagraph(count=3):
+        ...     print(text)
 
     Args:
         count: Number of non-repeated random paragraphs.
@@ -318,126 +4182,237 @@ def paragraph(count: 'int' = 1, comma: 'tuple[int, int]' = (0, 2),
         sentence_range: Random range for number of sentences in each paragraph. The function
             will use :func:`random.randint` to choose a random integer as the number of sentences.
         pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        chunk_size: Number of characters generated before returning control to the event loop.
+        chunk_time: Time in seconds spent generating before returning control to the event loop.
 
     Returns:
-        Random paragraph generator.
+        Indefinite asynchronous random paragraph generator.
 
     """
-    lorem = LoremGenerator(
-        pool=pool,
-        dupe=count * random.randint(*word_range) * random.randint(*sentence_range),  # nosec B311
-    )
-    yield from _random_cycle(lorem.gen_paragraph(comma=comma,
-                                                 word_range=word_range,
-                                                 sentence_range=sentence_range) for _ in range(count))
+    items = paragraph(count, comma, word_range, sentence_range, pool=pool, seed=seed, rng=rng)
+    async for text in _achunked(items, chunk_size, chunk_time):
+        yield text
 
 
-def get_word(count: 'int | tuple[int, int]' = 1,
-             sep: 'str' = ' ',
-             func: 'Optional[str | Callable[[str], str]]' = None,
-             args: 'tuple[str, ...]' = (), kwargs: 'dict[str, Any]' = {},
-             pool: 'Iterable[str]' = _TEXT,) -> 'str':  # pylint: disable=dangerous-default-value
-    """Return random words.
+async def awrite_text(writer: 'Any', count: 'Optional[int]' = None, size: 'Optional[int]' = None, *,
+                      kind: 'Kind' = 'paragraph', sep: 'Optional[str]' = None,
+                      comma: 'tuple[int, int]' = (0, 2),
+                      word_range: 'tuple[int, int]' = (4, 8),
+                      sentence_range: 'tuple[int, int]' = (5, 10),
+                      pool: 'Iterable[str]' = _TEXT, seed: 'Optional[Seed]' = None,
+                      rng: 'Optional[Random]' = None, encoding: 'str' = 'utf-8',
+                      chunk_size: 'int' = _ASYNC_CHUNK_SIZE) -> 'int':
+    """Asynchronously write random text to a stream writer.
+
+    The text is encoded and written in chunks of ``chunk_size``. After each chunk,
+    the writer is drained for backpressure, i.e. ``await writer.drain()`` as for
+    :class:`asyncio.StreamWriter`, or the result of ``writer.write()`` is awaited
+    if it is awaitable, as for :meth:`aiohttp.web.StreamResponse.write`; then
+    control is returned to the event loop.
 
     .. code-block:: python
 
-        >>> get_word(count=3)
-        'anim voluptate non'
-        >>> get_word(count=3, func='capitalize')
-        'Non Labore Ut'
-        >>> get_word(count=3, func=lambda s: s.upper())
-        'NISI TEMPOR CILLUM'
+        >>> async def handle(reader, writer):
+        ...     await awrite_text(writer, size=1 << 20)
+        ...     writer.close()
+        >>> await asyncio.start_server(handle, port=8080)
 
     Args:
-        count: Number of random words. To generate random number of words, supply a 2-element
-            tuple of :obj:`int`, the function will use :func:`random.randint` to choose a
-            random integer as the number of random words.
-        sep: Seperator between each word.
-        func: Filter function. It can be a function name of :obj:`str`, or a customised
-            function that takes the original :obj:`str` and returns the modified :obj:`str`.
-        args: Additional positional arguments for ``func``.
-        kwargs: Additional keyword arguments for ``func``.
+        writer: Stream writer to write to.
+        count: Number of random words, sentences or paragraphs.
+        size: Maximum size of the text in bytes. The last item may be truncated
+            to fit, on a character boundary.
+        kind: Kind of text, i.e. ``'word'``, ``'sentence'`` or ``'paragraph'``.
+        sep: Seperator between each item. The default value is :data:`os.linesep` for
+            paragraphs, and ``' '`` for words and sentences.
+        comma: Random range for number of commas. The function will use :func:`random.randint` to choose
+            a random integer as the number of commas.
+        word_range: Random range for number of words in each sentence. The function will use
+            :func:`random.randint` to choose a random integer as the number of words.
+        sentence_range: Random range for number of sentences in each paragraph. The function will use
+            :func:`random.randint` to choose a random integer as the number of sentences.
         pool: List of words to be used as random word pool.
+        seed: Seed for an isolated random number generator, so that the generated
+            text is reproducible.
+        rng: Random number generator to draw from, takes precedence over ``seed``.
+        encoding: Encoding of the text.
+        chunk_size: Size of each chunk written to ``writer``.
 
     Returns:
-        Random words.
+        Number of bytes written. If neither ``count`` nor ``size`` is given, the text
+        is written indefinitely.
 
     """
-    if isinstance(count, tuple):
-        count = random.randint(*count)  # nosec B311
-    return sep.join(itertools.islice(word(count, func, args, kwargs, pool=pool), count))
+    if sep is None:
+        sep = os.linesep if kind == 'paragraph' else ' '
 
+    lorem = LoremGenerator(pool=pool, seed=seed, rng=rng)
+    items = lorem.iter_text(kind, comma, word_range, sentence_range)
+    if count is not None:
+        items = itertools.islice(items, count)
 
-def get_sentence(count: 'int | tuple[int, int]' = 1,
-                 sep: 'str' = ' ',
-                 comma: 'tuple[int, int]' = (0, 2),
-                 word_range: 'tuple[int, int]' = (4, 8), *,
-                 pool: 'Iterable[str]' = _TEXT) -> 'str':
-    """Return random sentences.
+    written = 0
+    for chunk in _chunked(items, sep, chunk_size):
+        data = chunk.encode(encoding)
+        last = size is not None and written + len(data) >= size
+        if last:
+            data = cast('bytes', _truncate(data, cast('int', size) - written, encoding))
 
-    .. code-block:: python
+        result = writer.write(data)
+        if inspect.isawaitable(result):
+            await result
+        elif hasattr(writer, 'drain'):
+            await writer.drain()
+        await asyncio.sleep(0)
+
+        written += len(data)
+        if last:
+            break
+    return written
 
-        >>> get_sentence()
-        'Nostrud laboris lorem minim sit culpa, aliqua nostrud in amet, sint pariatur eiusmod esse.'
+
+def _parse_size(size: 'str') -> 'int':
+    """Parse size from the command line, e.g. ``512``, ``64K``, ``10G`` or ``1.5MiB``.
 
     Args:
-        count: Number of random sentences. To generate random number of sentences, supply a
-            2-element tuple of :obj:`int`, the function will use :func:`random.randint` to
-            choose a random integer as the number of random sentences.
-        sep: Seperator between each sentence.
-        comma: Random range for number of commas. The function will use :func:`random.randint`
-            to choose a random integer as the number of commas.
-        word_range: Random range for number of words in each sentence. The function will use
-            :func:`random.randint` to choose a random integer as the number of words.
-        pool: List of words to be used as random word pool.
+        size: Size with an optional binary multiple suffix.
 
     Returns:
-        Random sentences.
+        Number of bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If ``size`` is malformed.
 
     """
-    if isinstance(count, tuple):
-        count = random.randint(*count)  # nosec B311
-    return sep.join(itertools.islice(sentence(count, comma, word_range, pool=pool), count))
+    match = re.fullmatch(r'(\d+(?:\.\d*)?)\s*([KMGT]?)(?:i?B)?', size.strip(), re.IGNORECASE)
+    if match is None:
+        raise argparse.ArgumentTypeError('invalid size: {!r}'.format(size))
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
 
 
-def get_paragraph(count: 'int | tuple[int, int]' = 1,
-                  sep: 'str' = os.linesep,
-                  comma: 'tuple[int, int]' = (0, 2),
-                  word_range: 'tuple[int, int]' = (4, 8),
-                  sentence_range: 'tuple[int, int]' = (5, 10), *,
-                  pool: 'Iterable[str]' = _TEXT) -> 'str':
-    r"""Return random paragraphs.
+def _parse_seed(seed: 'str') -> 'int | str':
+    """Parse seed from the command line, as :obj:`int` if possible."""
+    try:
+        return int(seed)
+    except ValueError:
+        return seed
 
-    .. code-block:: python
 
-        >>> get_paragraph()
-        'Exercitation magna sunt excepteur irure adipiscing commodo duis. Est '
-        'ipsum qui deserunt, deserunt nostrud reprehenderit esse. Do velit '
-        'est in velit sed. Sunt officia officia lorem. Commodo lorem '
-        'exercitation veniam officia pariatur velit. Deserunt deserunt sed '
-        'consequat laborum consequat dolor. Et consectetur irure sint elit tempor,'
-        ' est minim nisi eiusmod id excepteur. Minim cillum veniam sed aliquip '
-        'anim sit, pariatur nostrud ex cillum laboris laborum. Laborum ullamco '
-        'mollit elit. Amet id incididunt ipsum sed.'
+def _parse_sep(sep: 'str') -> 'str':
+    """Parse separator from the command line, with backslash escapes, e.g. ``\\n``."""
+    return codecs.decode(sep, 'unicode_escape')
+
+
+def get_parser() -> 'argparse.ArgumentParser':
+    """Create the command line argument parser.
+
+    Returns:
+        Argument parser of the ``lorem`` command.
+
+    """
+    parser = argparse.ArgumentParser(prog='lorem', description='Lorem ipsum generator.')
+    parser.add_argument('-V', '--version', action='version', version=__version__)
+
+    common = argparse.ArgumentParser(add_help=False)
+    limit = common.add_mutually_exclusive_group()
+    limit.add_argument('-n', '--count', type=int, help='number of items (default: 1)')
+    limit.add_argument('-b', '--bytes', type=_parse_size, metavar='SIZE', dest='size',
+                       help='total size of output in bytes, e.g. 64K, 10G '
+                            '(the output is truncated to the size, on a character boundary)')
+    common.add_argument('-s', '--seed', type=_parse_seed, help='seed for reproducible output')
+    common.add_argument('--sep', type=_parse_sep, help='separator between items, '
+                                                       'backslash escapes are supported')
+    common.add_argument('-p', '--pool', type=argparse.FileType('r', encoding='utf-8'),
+                        metavar='FILE', help='file of whitespace-separated words as the word pool')
+    common.add_argument('--buffer-size', type=_parse_size, default=_BUFFER_SIZE, metavar='SIZE',
+                        help='size of each write to standard output (default: 1M)')
+    common.add_argument('-j', '--jobs', type=int, nargs='?', const=0, metavar='N',
+                        help='generate in shards with N worker processes (default: number of '
+                             'processors); the output only depends on the seed and shard count')
+    common.add_argument('--shard-count', type=int, default=_SHARD_COUNT, metavar='N',
+                        help='number of items in each shard (default: %(default)s)')
+    common.add_argument('-o', '--output', metavar='TEMPLATE',
+                        help='write each shard to its own file, with path formatted with the '
+                             'index of shard, e.g. lorem-{:04d}.txt (implies --jobs)')
+
+    sentence = argparse.ArgumentParser(add_help=False)
+    sentence.add_argument('--comma', type=int, nargs=2, default=(0, 2), metavar=('MIN', 'MAX'),
+                          help='random range for number of commas (default: 0 2)')
+    sentence.add_argument('--word-range', type=int, nargs=2, default=(4, 8), metavar=('MIN', 'MAX'),
+                          help='random range for number of words in each sentence (default: 4 8)')
+
+    subparsers = parser.add_subparsers(dest='kind', metavar='KIND')
+    subparsers.required = True
+    subparsers.add_parser('word', parents=[common], help='generate random words')
+    subparsers.add_parser('sentence', parents=[common, sentence], help='generate random sentences')
+    paragraph_parser = subparsers.add_parser('paragraph', parents=[common, sentence],
+                                             help='generate random paragraphs')
+    paragraph_parser.add_argument('--sentence-range', type=int, nargs=2, default=(5, 10),
+                                  metavar=('MIN', 'MAX'),
+                                  help='random range for number of sentences in each paragraph '
+                                       '(default: 5 10)')
+    return parser
+
+
+def main(argv: 'Optional[List[str]]' = None) -> 'int':
+    """Entrypoint of the command line interface.
+
+    The text is streamed to standard output with :func:`write_text`, or with
+    :func:`write_parallel` if ``--jobs`` or ``--output`` is given. Unless the size
+    of output is limited by ``--bytes``, a trailing line separator is written to
+    standard output.
 
     Args:
-        count: Number of random paragraphs. To generate random number of paragraphs, supply a
-            2-element tuple of :obj:`int`, the function will use :func:`random.randint` to choose
-            a random integer as the number of random paragraphs.
-        sep: Seperator between each paragraph. The default value is OS-dependent as :data:`os.linsep`
-            (``\r\n`` on Windows, ``\n`` on POSIX).
-        comma: Random range for number of commas. The function will use :func:`random.randint` to choose
-            a random integer as the number of commas.
-        word_range: Random range for number of words in each sentence. The function will use
-            :func:`random.randint` to choose a random integer as the number of words.
-        sentence_range: Random range for number of sentences in each paragraph. The function will use
-            :func:`random.randint` to choose a random integer as the number of sentences.
-        pool: List of words to be used as random word pool.
+        argv: Command line arguments, defaults to :data:`sys.argv`.
 
     Returns:
-        Random paragraphs.
+        Exit code.
 
     """
-    if isinstance(count, tuple):
-        count = random.randint(*count)  # nosec B311
-    return sep.join(itertools.islice(paragraph(count, comma, word_range, sentence_range, pool=pool), count))
+    args = get_parser().parse_args(argv)
+
+    pool = _TEXT  # type: Iterable[str]
+    if args.pool is not None:
+        with args.pool as file:
+            pool = file.read().split()
+
+    count = args.count
+    if count is None and args.size is None:
+        count = 1
+
+    options = {
+        'kind': args.kind, 'sep': args.sep, 'pool': pool, 'seed': args.seed,
+        'comma': tuple(getattr(args, 'comma', (0, 2))),
+        'word_range': tuple(getattr(args, 'word_range', (4, 8))),
+        'sentence_range': tuple(getattr(args, 'sentence_range', (5, 10))),
+    }  # type: Dict[str, Any]
+
+    if args.output is not None:
+        write_parallel(args.output, count, args.size, jobs=args.jobs or None,
+                       shard_count=args.shard_count, **options)
+        return 0
+
+    stdout = sys.stdout.buffer
+    try:
+        if args.jobs is None:
+            write_text(stdout, count, args.size, buffer_size=args.buffer_size, **options)
+        else:
+            write_parallel(stdout, count, args.size, jobs=args.jobs or None,
+                           shard_count=args.shard_count, **options)
+        if args.size is None:
+            stdout.write(os.linesep.encode())
+        stdout.flush()
+    except BrokenPipeError:
+        # Python flushes standard streams on exit; redirect remaining output
+        # to devnull to avoid another BrokenPipeError at shutdown
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,20 @@
 # pylint: disable=protected-access, unused-argument
 """Test suite for `lorem` module."""
 
+import asyncio
+import collections
+import collections.abc
+import contextlib
+import csv
+import io
 import itertools
+import json
+import os
+import pickle
+import random
+import sqlite3
+import tempfile
+import threading
 import unittest
 from typing import TYPE_CHECKING, TypeVar
 from unittest import mock
@@ -10,7 +23,7 @@ from unittest import mock
 import lorem
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Iterator, Optional, Sequence
+    from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Sequence
 
 # Type variable.
 _T = TypeVar('_T')
@@ -21,6 +34,15 @@ def islice(iterable: 'Iterator[_T]', stop: 'int') -> 'list[_T]':
     return list(itertools.islice(iterable, stop))
 
 
+def run_async(coro: 'Awaitable[_T]') -> '_T':
+    """Wrapper function for :meth:`asyncio.AbstractEventLoop.run_until_complete`."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
 def shuffle(x: 'list[Any]',
             random: 'Optional[Callable[[], float]]' = None) -> 'None':
     """Mock :func:`random.shuffle`, but actually do nothing."""
@@ -70,6 +92,445 @@ class TestLorem(unittest.TestCase):
         self.assertEqual(list_pool, ['lorem', 'ipsum', 'lorem', 'ipsum', 'lorem',
                                      'ipsum', 'lorem', 'ipsum', 'lorem', 'ipsum'])
 
+    def test_gen_pool(self) -> 'None':
+        """Test :func:`lorem.LoremGenerator._gen_pool`."""
+        inst = lorem.LoremGenerator(dupe=10_000)
+        size = len(lorem._TEXT)
+        for _ in range(3):
+            self.assertEqual(sorted(islice(inst.pool, size)), sorted(lorem._TEXT))
+
+    def test_compile_pool(self) -> 'None':
+        """Test :func:`lorem._compile_pool`."""
+        words = ['lorem', 'ipsum', 'dolor']
+        inst = lorem.LoremGenerator(pool=words)
+        self.assertIs(lorem.LoremGenerator(pool=iter(words))._text, inst._text)
+        self.assertIs(lorem.LoremGenerator(pool=tuple(words))._text, inst._text)
+        self.assertIs(lorem.LoremGenerator()._text, lorem._TEXT)
+
+        words.append('sit')
+        self.assertEqual(lorem.LoremGenerator(pool=words)._text, tuple(words))
+
+        with self.assertRaises(ValueError):
+            lorem.LoremGenerator(pool=[])
+        with self.assertRaises(TypeError):
+            lorem.get_word(pool=['lorem', b'ipsum'])  # type: ignore[list-item]
+
+    def test_weights(self) -> 'None':
+        """Test weighted sampling of words."""
+        inst = lorem.LoremGenerator(pool=['lorem', 'ipsum', 'dolor'], weights=[0, 1, 3], seed=42)
+        counts = collections.Counter(islice(inst.pool, 10_000))
+        self.assertEqual(set(counts), {'ipsum', 'dolor'})
+        self.assertAlmostEqual(counts['dolor'] / 10_000, 0.75, delta=0.02)
+
+        inst = lorem.LoremGenerator(weights='zipf', exponent=2.0, seed=42)
+        counts = collections.Counter(islice(inst.pool, 10_000))
+        self.assertEqual(counts.most_common(1)[0][0], lorem._TEXT[0])
+        self.assertAlmostEqual(counts[lorem._TEXT[0]] / counts[lorem._TEXT[1]], 4.0, delta=0.5)
+
+        inst = lorem.LoremGenerator(weights='uniform', seed=42)
+        self.assertEqual(set(islice(inst.pool, 10_000)), set(lorem._TEXT))
+
+        self.assertEqual(lorem.get_paragraph(seed=42, weights='zipf'),
+                         lorem.get_paragraph(seed=42, weights='zipf'))
+        self.assertEqual(lorem.get_word(count=3, pool=['lorem', 'ipsum'], weights=[1, 0]),
+                         'lorem lorem lorem')
+
+        with self.assertRaises(ValueError):
+            lorem.LoremGenerator(weights='pareto')  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            lorem.LoremGenerator(pool=['lorem', 'ipsum'], weights=[1])
+        with self.assertRaises(ValueError):
+            lorem.LoremGenerator(pool=['lorem', 'ipsum'], weights=[1, -1])
+
+    def test_markov(self) -> 'None':
+        """Test :class:`lorem.MarkovModel` and :class:`lorem.MarkovLoremGenerator`."""
+        corpus = ['Lorem ipsum dolor sit amet.', 'Lorem ipsum, dolor sit AMET; ipsum dolor sed.']
+        model = lorem.MarkovModel.train(corpus)
+        self.assertEqual(model.vocab, ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'sed'))
+        self.assertEqual(len(model), 7)
+
+        bigrams = {('lorem', 'ipsum'), ('ipsum', 'dolor'), ('dolor', 'sit'), ('sit', 'amet'),
+                   ('amet', 'lorem'), ('amet', 'ipsum'), ('dolor', 'sed')}
+        words = islice(itertools.chain.from_iterable(model.walk(random.Random(42))), 1000)
+        self.assertLessEqual(set(zip(words, words[1:])) - {('sed', word) for word in model.vocab},
+                             bigrams)
+
+        model = lorem.MarkovModel.train(corpus, order=2)
+        words = islice(itertools.chain.from_iterable(model.walk(random.Random(42))), 1000)
+        trigrams = {('lorem', 'ipsum', 'dolor'), ('ipsum', 'dolor', 'sit'), ('dolor', 'sit', 'amet'),
+                    ('sit', 'amet', 'lorem'), ('amet', 'lorem', 'ipsum'), ('sit', 'amet', 'ipsum'),
+                    ('amet', 'ipsum', 'dolor'), ('ipsum', 'dolor', 'sed')}
+        self.assertLessEqual({trigram for trigram in zip(words, words[1:], words[2:])
+                              if 'sed' not in trigram[:2]}, trigrams)
+
+        binary = io.BytesIO()
+        model.save(binary)
+        binary.seek(0)
+        loaded = lorem.MarkovModel.load(binary)
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'model.bin')
+            model.save(path)
+            self.assertEqual(lorem.MarkovModel.load(path).vocab, model.vocab)
+
+        inst = lorem.MarkovLoremGenerator(loaded, seed=42)
+        paragraph = inst.gen_paragraph((0, 2), (4, 8), (5, 10))
+        self.assertEqual(lorem.MarkovLoremGenerator(model, seed=42).gen_paragraph((0, 2), (4, 8), (5, 10)),
+                         paragraph)
+        self.assertLessEqual(set(paragraph.lower().replace(',', '').replace('.', '').split()),
+                             set(model.vocab))
+
+        with self.assertRaises(ValueError):
+            lorem.MarkovModel.load(io.BytesIO(b'lorem ipsum'))
+        with self.assertRaises(ValueError):
+            lorem.MarkovModel.load(io.BytesIO(binary.getvalue()[:-1]))
+        with self.assertRaises(ValueError):
+            lorem.MarkovModel.train(['lorem'])
+
+    def test_mapped_pool(self) -> 'None':
+        """Test :class:`lorem.MappedPool`."""
+        words = ['lorem{}'.format(index) for index in range(100)] + ['ipsum', 'dólor']
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'pool.bin')
+            with lorem.MappedPool.build(itertools.chain(words, ['  ', 'sit\n']), path) as pool:
+                self.assertEqual(len(pool), 103)
+                self.assertEqual((pool[0], pool[-1], pool[101]), ('lorem0', 'sit', 'dólor'))
+                self.assertEqual(list(pool), words + ['sit'])
+                self.assertEqual(pool[-3:], ['ipsum', 'dólor', 'sit'])
+                self.assertIsInstance(pool, collections.abc.Sequence)
+                self.assertEqual(pool.index('ipsum'), 100)
+                self.assertIs(lorem._get_pool(pool), pool)
+                with self.assertRaises(IndexError):
+                    pool[103]  # pylint: disable=pointless-statement
+
+                inst = lorem.LoremGenerator(pool=pool, seed=42)
+                for _ in range(3):
+                    self.assertEqual(sorted(islice(inst.pool, 103)), sorted(pool))
+                self.assertEqual(lorem.get_sentence(count=3, pool=pool, seed=42),
+                                 lorem.get_sentence(count=3, pool=pool, seed=42))
+
+                serial = io.BytesIO()
+                lorem.write_parallel(serial, count=20, pool=pool, seed=42, jobs=1, shard_count=7)
+                parallel = io.BytesIO()
+                lorem.write_parallel(parallel, count=20, pool=pool, seed=42, jobs=2, shard_count=7)
+                self.assertEqual(parallel.getvalue(), serial.getvalue())
+
+            with open(path, 'r+b') as file:
+                file.write(b'LOREMMKV')
+            with self.assertRaises(ValueError):
+                lorem.MappedPool(path)
+
+    def test_stats(self) -> 'None':
+        """Test :class:`lorem.GeneratorStats`."""
+        self.assertNotIn('gen_paragraph', vars(lorem.LoremGenerator()))
+
+        snapshots = []  # type: list[dict[str, Any]]
+        stats = lorem.GeneratorStats(callback=snapshots.append)
+        inst = lorem.LoremGenerator(seed=42, stats=stats)
+        paragraphs = [inst.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(10)]
+        plain = lorem.LoremGenerator(seed=42)
+        self.assertEqual(paragraphs, [plain.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(10)])
+        sentence = inst.gen_sentence((0, 2), (4, 8))
+        word = inst.gen_word()
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshots[-1], snapshot)
+        self.assertEqual(len(snapshots), 12)
+
+        counts = snapshot['counts']
+        texts = paragraphs + [sentence]
+        self.assertEqual(counts['paragraphs'], 10)
+        self.assertEqual(counts['sentences'], sum(text.count('.') for text in texts))
+        self.assertEqual(counts['words'], sum(len(text.split()) for text in texts) + 1)
+        self.assertEqual(counts['bytes'], len(' '.join(texts + [word]).encode()) - 11)
+        self.assertGreater(counts['reshuffles'], 0)
+        self.assertGreater(counts['draws'], counts['reshuffles'])
+        self.assertEqual(set(snapshot['times']),
+                         {'plan', 'render', 'shuffle', 'word', 'sentence', 'paragraph'})
+        self.assertEqual(snapshot['vocab'], len(lorem._TEXT))
+
+        lorem.get_sentence(count=5, seed=42, stats=stats)
+        self.assertEqual(stats.snapshot()['counts']['sentences'], counts['sentences'] + 5)
+        self.assertEqual(len(snapshots), 17)
+        stats.reset()
+        self.assertEqual(stats.snapshot()['counts'], {})
+
+        stats = lorem.GeneratorStats(callback=snapshots.append, interval=3600)
+        lorem.get_paragraph(count=5, stats=stats)
+        self.assertEqual(len(snapshots), 17)
+
+        stats = lorem.GeneratorStats()
+        inst = lorem.LoremGenerator(seed=42, stats=stats, cache=lorem.FragmentCache(size=5))
+        for _ in range(5):
+            inst.gen_sentence((0, 2), (4, 8))
+        draws = stats.snapshot()['counts']['draws']
+        for _ in range(20):  # drawn from the cache, by randrange
+            inst.gen_sentence((0, 2), (4, 8))
+        self.assertEqual(stats.snapshot()['counts']['draws'], draws + 20)
+
+        stats = lorem.GeneratorStats()
+        inst = lorem.LoremGenerator(seed=42, stats=stats)
+        words = islice(inst.iter_text('word'), 100)
+        self.assertEqual(words, islice(lorem.LoremGenerator(seed=42).iter_text('word'), 100))
+        self.assertEqual(stats.snapshot()['counts']['words'], 100)
+        self.assertEqual(stats.snapshot()['counts']['bytes'], len(''.join(words).encode()))
+
+    def test_random_access(self) -> 'None':
+        """Test random access by index."""
+        inst = lorem.LoremGenerator(seed=42)
+        paragraphs = [inst.paragraph_at(index) for index in range(10)]
+        sentence = inst.gen_sentence((0, 2), (4, 8))
+        self.assertEqual(sentence, lorem.LoremGenerator(seed=42).gen_sentence((0, 2), (4, 8)))
+        self.assertEqual(paragraphs, islice(lorem.paragraph(count=10, seed=42, regenerate=True), 10))
+        self.assertEqual(lorem.ThreadLocalLoremGenerator(seed=42).paragraph_at(10 ** 12),
+                         inst.paragraph_at(10 ** 12))
+        self.assertNotEqual(inst.paragraph_at(10 ** 12), inst.paragraph_at(10 ** 12 + 1))
+
+        self.assertEqual(inst.sentence_at(3, word_range=(1, 2)),
+                         islice(lorem.sentence(count=4, word_range=(1, 2), seed=42, regenerate=True), 4)[3])
+        self.assertIn(inst.word_at(10 ** 12), lorem._TEXT)
+        inst = lorem.LoremGenerator()
+        self.assertEqual(inst.word_at(5), inst.word_at(5))
+        self.assertIsNotNone(inst.seed)
+
+    def test_checkpoint(self) -> 'None':
+        """Test checkpoint and resume of generators."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'words.bin')
+            with lorem.MappedPool.build(['lorem{}'.format(index) for index in range(100)], path) as mapped:
+                model = lorem.MarkovModel.train(['Lorem ipsum dolor sit amet.', 'Sit amet, lorem dolor.'])
+                factories = [
+                    lambda: lorem.LoremGenerator(seed=42),
+                    lambda: lorem.LoremGenerator(pool=['lorem', 'ipsum', 'dolor'], seed=42),
+                    lambda: lorem.LoremGenerator(weights='zipf', seed=42),
+                    lambda: lorem.LoremGenerator(pool=mapped, seed=42),
+                    lambda: lorem.MarkovLoremGenerator(model, seed=42),
+                ]  # type: list[Callable[[], lorem.LoremGenerator]]
+                for factory in factories:
+                    for count in (0, 5, 63, 64, 500):
+                        inst = factory()
+                        islice(inst.pool, count)
+                        state = inst.getstate()
+                        expected = [inst.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(5)]
+
+                        resumed = factory()
+                        resumed.setstate(state)
+                        self.assertEqual([resumed.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(5)],
+                                         expected)
+                        resumed = pickle.loads(pickle.dumps(inst))
+                        self.assertEqual(resumed.gen_sentence((0, 2), (4, 8)), inst.gen_sentence((0, 2), (4, 8)))
+
+        for paragraphs in (lorem.paragraph(count=5, seed=42), lorem.paragraph(count=5),
+                           lorem.paragraph(count=5, seed=42, regenerate=True)):
+            islice(paragraphs, 7)
+            checkpoint = pickle.dumps(paragraphs)
+            expected = islice(paragraphs, 20)
+            self.assertEqual(islice(pickle.loads(checkpoint), 20), expected)
+
+        with self.assertRaises(TypeError):
+            pickle.dumps(lorem.LoremGenerator(stats=lorem.GeneratorStats()))
+        with self.assertRaises(TypeError):
+            lorem.ThreadLocalLoremGenerator().getstate()
+
+    @unittest.skipIf(lorem.numpy is None, 'numpy is not installed')
+    def test_tokens(self) -> 'None':
+        """Test token arrays backed by :mod:`numpy`."""
+        inst = lorem.LoremGenerator(seed=42)
+        batch = inst.gen_tokens(count=20, comma=(1, 3), word_range=(2, 4), sentence_range=(3, 6))
+        self.assertEqual(len(batch.paragraphs), 21)
+        self.assertEqual(batch.paragraphs[-1] + 1, len(batch.sentences))
+        self.assertEqual(batch.sentences[-1], len(batch.words))
+        self.assertEqual(len(batch.commas), len(batch.words))
+        self.assertEqual(sorted(batch.words[:len(lorem._TEXT)].tolist()), list(range(len(lorem._TEXT))))
+        self.assertTrue(all(3 <= stop - start <= 6 for start, stop in zip(batch.paragraphs, batch.paragraphs[1:])))
+        self.assertTrue(all(2 <= stop - start for start, stop in zip(batch.sentences, batch.sentences[1:])))
+
+        paragraphs = inst.render_tokens(batch)
+        self.assertEqual(len(paragraphs), 20)
+        for index, text in enumerate(paragraphs):
+            words = batch.words[batch.sentences[batch.paragraphs[index]]:batch.sentences[batch.paragraphs[index + 1]]]
+            self.assertEqual(text.lower().replace(',', '').replace('.', '').split(),
+                             [lorem._TEXT[word] for word in words])
+            self.assertEqual(text.count('.'), batch.paragraphs[index + 1] - batch.paragraphs[index])
+        self.assertEqual(sum(text.count(',') for text in paragraphs), batch.commas.sum())
+
+        self.assertEqual(lorem.LoremGenerator(seed=42).gen_tokens(20, (1, 3), (2, 4), (3, 6)).words.tolist(),
+                         batch.words.tolist())
+        self.assertEqual(inst.render_tokens(inst.gen_tokens(count=0)), [])
+        inst = lorem.LoremGenerator(pool=['lorem', 'ipsum'], weights=[1, 0], seed=42)
+        self.assertEqual(set(inst.render_tokens(inst.gen_tokens())[0].lower().split()) - {'lorem', 'lorem.', 'lorem,'},
+                         set())
+        with self.assertRaises(TypeError):
+            lorem.MarkovLoremGenerator(lorem.MarkovModel.train(['Lorem ipsum dolor sit amet.'])).gen_tokens()
+
+    def test_records(self) -> 'None':
+        """Test schema-driven records."""
+        schema = {
+            'name': {'kind': 'word', 'count': (1, 3)},
+            'title': 'sentence',
+            'body': {'kind': 'paragraph', 'count': 2, 'sep': '|', 'sentence_range': (2, 4)},
+            'empty': {'kind': 'word', 'count': 0},
+        }  # type: dict[str, Any]
+        inst = lorem.RecordGenerator(schema, seed=42)
+        self.assertEqual(inst.columns, ('name', 'title', 'body', 'empty'))
+        rows = list(inst.iter_rows(100, batch=30))
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows, list(lorem.RecordGenerator(schema, seed=42).iter_rows(100, batch=30)))
+        for name, title, body, empty in rows:
+            self.assertIn(len(name.split()), range(1, 4))
+            self.assertTrue(set(name.split()) <= set(lorem._TEXT))
+            self.assertEqual(title.count('.'), 1)
+            self.assertTrue(title[0].isupper() and title.endswith('.'))
+            self.assertEqual(len(body.split('|')), 2)
+            self.assertTrue(all(2 <= text.count('.') <= 4 for text in body.split('|')))
+            self.assertEqual(empty, '')
+        self.assertEqual([len(cells) for cells in inst.gen_columns(7).values()], [7] * 4)
+
+        file = io.StringIO(newline='')
+        report = inst.write_csv(file, 50, batch=16)
+        self.assertEqual(report['rows'], 50)
+        self.assertGreater(report['rows_per_second'], 0)
+        records = list(csv.reader(io.StringIO(file.getvalue(), newline='')))
+        self.assertEqual(records[0], list(inst.columns))
+        self.assertEqual(len(records), 51)
+
+        binary = io.BytesIO()
+        self.assertEqual(inst.write_jsonl(binary, 20, batch=8)['rows'], 20)
+        records = [json.loads(line) for line in binary.getvalue().decode().splitlines()]
+        self.assertEqual(len(records), 20)
+        self.assertEqual(list(records[0]), list(inst.columns))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'records.db')
+            self.assertEqual(inst.load_sqlite(path, 'posts', 100, batch=32)['rows'], 100)
+            inst.load_sqlite(path, 'posts', 10)
+            with contextlib.closing(sqlite3.connect(path)) as connection:
+                self.assertEqual(connection.execute('SELECT COUNT(*) FROM posts').fetchone(), (110,))
+
+        with self.assertRaises(ValueError):
+            lorem.RecordGenerator({'name': 'chapter'})  # type: ignore[dict-item]
+        with self.assertRaises(ValueError):
+            lorem.RecordGenerator({'name': {'kind': 'word', 'comma': (0, 2)}})
+
+    def test_seed(self) -> 'None':
+        """Test reproducible generation with ``seed`` and ``rng``."""
+        inst = lorem.LoremGenerator(seed=42)
+        words = islice(inst.pool, 100)
+        self.assertEqual(islice(lorem.LoremGenerator(seed=42).pool, 100), words)
+        self.assertEqual(islice(lorem.LoremGenerator(rng=random.Random(42)).pool, 100), words)
+
+        paragraph = lorem.get_paragraph(count=(2, 5), seed=42)
+        random.seed(0)  # global state shall not perturb seeded generation
+        self.assertEqual(lorem.get_paragraph(count=(2, 5), seed=42), paragraph)
+        self.assertEqual(lorem.get_sentence(count=3, seed='lorem'),
+                         lorem.get_sentence(count=3, seed='lorem'))
+        self.assertEqual(lorem.get_word(count=3, rng=random.Random(1)),
+                         lorem.get_word(count=3, rng=random.Random(1)))
+
+    def test_thread_local(self) -> 'None':
+        """Test :class:`lorem.ThreadLocalLoremGenerator`."""
+        inst = lorem.ThreadLocalLoremGenerator(seed=42)
+        barrier = threading.Barrier(4)
+        results = {}  # type: dict[int, list[str]]
+        resumes = {}  # type: dict[int, Any]
+
+        def target(key: 'int') -> 'None':
+            barrier.wait()
+            results[key] = [inst.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(50)]
+            resumes[key] = inst._resume
+
+        threads = [threading.Thread(target=target, args=(key,)) for key in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = []
+        for index in range(4):
+            rng = random.Random(lorem._derive_seed(42, index))
+            gen = lorem.LoremGenerator(rng=rng)
+            expected.append([gen.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in range(50)])
+        self.assertCountEqual(results.values(), expected)
+        # where the word pool of each thread is, is not shared
+        self.assertEqual(len(set(map(id, resumes.values()))), 4)
+        self.assertNotIn('_resume', vars(inst))
+        self.assertNotIn('_chunk', vars(inst))
+        with self.assertRaises(TypeError):
+            inst.getstate()
+
+        self.assertEqual(inst.seed, 42)
+        self.assertEqual(inst.gen_word(), next(lorem.LoremGenerator(
+            rng=random.Random(lorem._derive_seed(42, 4))).pool))
+
+    def test_fragment_cache(self) -> 'None':
+        """Test :class:`lorem.FragmentCache`."""
+        cache = lorem.FragmentCache(size=10)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        fresh = lorem.LoremGenerator(seed=42)
+        texts = [inst.gen_sentence((0, 2), (4, 8)) for _ in range(10)]
+        self.assertEqual(texts, [fresh.gen_sentence((0, 2), (4, 8)) for _ in range(10)])
+        for _ in range(100):
+            self.assertIn(inst.gen_sentence((0, 2), (4, 8)), texts)
+        self.assertEqual(len(cache), 1)
+
+        paragraphs = lorem.get_paragraph(count=20, seed=42, cache=cache).splitlines()
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(len(set(paragraphs)), 10)
+        self.assertEqual(lorem.get_paragraph(count=20, seed=42, cache=lorem.FragmentCache(size=10)),
+                         os.linesep.join(paragraphs))
+
+        cache = lorem.FragmentCache(size=10, refresh=1.0)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        refreshed = set(inst.gen_sentence((0, 2), (4, 8)) for _ in range(100))
+        self.assertGreater(len(refreshed), 50)
+
+        cache = lorem.FragmentCache(size=10, maxkeys=2)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        for words in range(1, 5):
+            inst.gen_sentence((0, 0), (words, words))
+        self.assertEqual(len(cache), 2)
+        self.assertIn((lorem._SourceKey((inst._text, None)), 'sentence', (0, 0), (4, 4)), cache)
+        self.assertIn((pickle.loads(pickle.dumps(inst._source)), 'sentence', (0, 0), (4, 4)), cache)
+
+        pool = ['word{}'.format(index) for index in range(200_000)]
+        cache = lorem.FragmentCache(size=10)
+        inst = lorem.LoremGenerator(pool=pool, seed=42, cache=cache)
+        shared = lorem.LoremGenerator(pool=list(pool), seed=42, cache=cache)
+        texts = [inst.gen_sentence((0, 2), (4, 8)) for _ in range(10)]
+        with mock.patch('lorem._SourceKey.__eq__', wraps=lorem._SourceKey.__eq__, autospec=True) as equal:
+            for _ in range(100):
+                self.assertIn(inst.gen_sentence((0, 2), (4, 8)), texts)
+            self.assertEqual(equal.call_count, 0)  # the pool is hashed once, and never compared
+            self.assertIn(shared.gen_sentence((0, 2), (4, 8)), texts)
+        self.assertEqual(len(cache), 1)
+
+        cache = lorem.FragmentCache(size=1000, maxsize=10_000)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        for _ in range(1000):
+            inst.gen_paragraph((0, 2), (4, 8), (5, 10))
+            inst.gen_sentence((0, 2), (4, 8))
+        self.assertLessEqual(cache.nbytes, 10_000)
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+        cache = lorem.FragmentCache(size=100, maxsize=300)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        paragraphs = [inst.gen_paragraph((0, 2), (4, 8), (1, 1)) for _ in range(50)]
+        self.assertLessEqual(cache.nbytes, 300)
+        self.assertGreater(cache.nbytes, 0)
+        self.assertLess(len(set(paragraphs)), 50)
+        cache = lorem.FragmentCache(size=10, maxsize=10, refresh=1.0)
+        inst = lorem.LoremGenerator(seed=42, cache=cache)
+        for _ in range(20):
+            inst.gen_sentence((0, 2), (4, 8))
+        self.assertEqual(cache.nbytes, 0)
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+        with self.assertRaises(ValueError):
+            lorem.FragmentCache(size=0)
+        with self.assertRaises(ValueError):
+            lorem.FragmentCache(refresh=2.0)
+
     def test_gen_word(self) -> 'None':
         """Test :func:`lorem.LoremGenerator.gen_word`."""
         iter_pool = ['lorem', 'ipsum']
@@ -91,6 +552,35 @@ class TestLorem(unittest.TestCase):
         word = inst.gen_word(func=lambda s, **kwargs: s, kwargs={'test': 'null'})
         self.assertEqual(word, 'lorem')
 
+    def test_transform(self) -> 'None':
+        """Test transform tables of pure functions."""
+        func = mock.Mock(side_effect=str.upper)
+        inst = lorem.LoremGenerator(pool=['lorem', 'ipsum'], seed=42)
+        words = [inst.gen_word(func=func, pure=True) for _ in range(100)]
+        self.assertEqual(set(words), {'LOREM', 'IPSUM'})
+        self.assertEqual(func.call_count, 2)
+        self.assertEqual(len(lorem.get_word(count=50, func=func, pool=['lorem', 'ipsum'], pure=True)), 299)
+        self.assertEqual(func.call_count, 2)
+        inst.gen_word(func=func)
+        self.assertEqual(func.call_count, 3)
+
+        self.assertIn(inst.gen_word(func='replace', args=('m', '*')), {'lore*', 'ipsu*'})
+        self.assertIn(inst.gen_word(func='replace', args=('m', '**')), {'lore**', 'ipsu**'})
+
+        def keep(text: 'str', sep: 'Any' = None) -> 'str':
+            return text
+        kwargs = {'sep': [None]}  # unhashable
+        self.assertIn(inst.gen_word(func=keep, kwargs=kwargs, pure=True), {'lorem', 'ipsum'})
+
+        lorem._transform_table.cache_clear()
+        with mock.patch('lorem._TRANSFORM_SIZE', 10):
+            inst = lorem.LoremGenerator(pool=['lorem{}'.format(index) for index in range(100)], seed=42)
+            text = inst.gen_sentence((0, 2), (50, 50))
+            self.assertTrue(text[0].isupper())
+            table = lorem._transform_table('capitalize', (), ())
+            self.assertLessEqual(len(table), 10)
+            self.assertEqual(table['lorem99'], 'Lorem99')
+
     def test_gen_sentence(self) -> 'None':
         """Test :func:`lorem.LoremGenerator.gen_sentence`."""
         iter_pool = ['lorem', 'ipsum']
@@ -111,6 +601,27 @@ class TestLorem(unittest.TestCase):
                 sentence = inst.gen_sentence(comma=(1, 2), word_range=(2, 4))
         self.assertEqual(sentence, 'Ipsum lorem.')
 
+    def test_plan(self) -> 'None':
+        """Test :func:`lorem.LoremGenerator._plan`."""
+        inst = lorem.LoremGenerator(seed=0)
+        plan = inst._plan(100, comma=(0, 2), word_range=(4, 8))
+        self.assertEqual(len(plan), 100)
+        for clauses in plan:
+            self.assertLessEqual(len(clauses), 3)
+            for count in clauses:
+                self.assertTrue(4 <= count <= 8)
+
+        inst = lorem.LoremGenerator()
+        for mock_choice in (self.mock_choice_first, self.mock_choice_last):
+            with self.mock_randint:
+                with mock_choice:
+                    table = inst._plan(3, comma=(2, 3), word_range=(0, 2))
+                    with mock.patch('lorem._TABLE_SIZE', 0):
+                        lorem._sentence_table.cache_clear()
+                        general = inst._plan(3, comma=(2, 3), word_range=(0, 2))
+            lorem._sentence_table.cache_clear()
+            self.assertEqual(list(map(list, table)), list(map(list, general)))
+
     def test_gen_paragraph(self) -> 'None':
         """Test :func:`lorem.LoremGenerator.gen_paragraph`."""
         iter_pool = ['lorem', 'ipsum']
@@ -131,6 +642,38 @@ class TestLorem(unittest.TestCase):
                 paragraph = inst.gen_paragraph(comma=(1, 2), word_range=(2, 4), sentence_range=(3, 4))
         self.assertEqual(paragraph, 'Lorem ipsum. Lorem ipsum. Lorem ipsum.')
 
+    def test_gen_into(self) -> 'None':
+        """Test :func:`lorem.LoremGenerator.gen_into`."""
+        inst, plain = lorem.LoremGenerator(seed=42), lorem.LoremGenerator(seed=42)
+        buffer = bytearray(4096)
+        filled = inst.gen_into(buffer)
+        self.assertGreater(filled, 4096 - 1024)
+        paragraphs = buffer[:filled].decode().split('\n')
+        self.assertEqual(paragraphs.pop(), '')
+        self.assertEqual(paragraphs, [plain.gen_paragraph((0, 2), (4, 8), (5, 10)) for _ in paragraphs])
+
+        inst = lorem.LoremGenerator(pool=['état', 'ça'], seed=42)
+        view = memoryview(bytearray(64))
+        filled = inst.gen_into(view[8:], kind='sentence', sep=b' ', word_range=(1, 2))
+        self.assertEqual(bytes(view[:8]), bytes(8))
+        for text in view[8:8 + filled].tobytes().decode().split():
+            self.assertIn(text.rstrip(',.'), {'État', 'état', 'Ça', 'ça'})
+
+        inst = lorem.LoremGenerator(pool=['lorem', 'ipsum'], seed=42)
+        self.assertEqual(inst.gen_into(bytearray(13), kind='word', sep=b' '), 12)
+        self.assertEqual(inst.gen_into(bytearray(3)), 0)
+        with self.assertRaises(ValueError):
+            inst.gen_into(bytearray(16), kind='chapter')  # type: ignore[arg-type]
+
+        with mock.patch('lorem._encode_pool', wraps=lorem._encode_pool) as encode:
+            inst.gen_into(bytearray(1024), kind='word')
+            inst.gen_into(bytearray(1024), kind='sentence')
+            self.assertEqual(encode.call_count, 0)  # looked up once per generator
+            inst._text = ('dolor',)
+            inst._restart(42)
+            inst.gen_into(bytearray(1024), kind='sentence')
+            self.assertEqual(encode.call_count, 1)
+
     def test_word(self) -> 'None':
         """Test :func:`lorem.word`."""
         with self.mock_pool:
@@ -166,6 +709,29 @@ class TestLorem(unittest.TestCase):
                                           'Lorem ipsum lorem ipsum. Lorem ipsum lorem ipsum. '
                                           'Lorem ipsum lorem ipsum.'])
 
+    def test_regenerate(self) -> 'None':
+        """Test cycling regenerated items of :func:`lorem.sentence` and :func:`lorem.paragraph`."""
+        sentences = islice(lorem.sentence(count=7, seed=42, regenerate=True), 70)
+        self.assertEqual(len(set(sentences)), 7)
+        for index in range(0, 70, 7):
+            self.assertEqual(set(sentences[index:index + 7]), set(sentences[:7]))
+        self.assertEqual(sentences, islice(lorem.sentence(count=7, seed=42, regenerate=True), 70))
+
+        with mock.patch('lorem._RandomCycle') as random_cycle:
+            paragraphs = islice(lorem.paragraph(count=3, regenerate=True), 9)
+        random_cycle.assert_not_called()
+        self.assertEqual(set(paragraphs), set(paragraphs[:3]))
+        self.assertEqual(list(lorem.paragraph(count=0, regenerate=True)), [])
+
+        # the cycle order follows the caller's random number generator, not the items
+        orders = {tuple(islice(lorem.sentence(count=7, seed=42, rng=random.Random(index), regenerate=True), 70))
+                  for index in range(5)}
+        self.assertTrue(all(order[:7] == tuple(sentences[:7]) for order in orders))
+        self.assertGreater(len(orders), 1)
+
+        with self.assertRaises(ValueError):
+            next(lorem.sentence(regenerate=True, cache=lorem.FragmentCache()))
+
     def test_get_word(self) -> 'None':
         """Test :func:`lorem.get_word`."""
         with self.mock_pool:
@@ -216,6 +782,247 @@ class TestLorem(unittest.TestCase):
                                     'Lorem ipsum lorem ipsum. Lorem ipsum lorem ipsum. '
                                     'Lorem ipsum lorem ipsum.')
 
+    def test_get_text(self) -> 'None':
+        """Test :func:`lorem.get_text`."""
+        for size in (0, 1, 2, 3, 10, 64, 1000, 4096):
+            text = lorem.get_text(size, seed=size)
+            self.assertEqual(len(text), size)
+            if size > 2:
+                self.assertTrue(text.rstrip().endswith('.'))
+
+        pool = ['lorem', 'ipsüm', 'dölor', 'sït', 'ämet']
+        for size in (5, 100, 4096):
+            text = lorem.get_text(size, unit='bytes', pool=pool, filler='_', seed=size)
+            self.assertEqual(len(text.encode('utf-8')), size)
+            self.assertTrue(text.rstrip('_').endswith('.'))
+
+        with self.assertRaises(ValueError):
+            lorem.get_text(10, unit='bytes', filler='ü')
+        with self.assertRaises(ValueError):
+            lorem.get_text(10, unit='words')  # type: ignore[arg-type]
+
+    def test_gen_fitted(self) -> 'None':
+        """Test :func:`lorem.LoremGenerator.gen_fitted`."""
+        inst = lorem.LoremGenerator(seed=42)
+        for size in (3, 4, 24, 40, 1000):
+            text = inst.gen_fitted(size)
+            self.assertEqual(len(text), size)
+            self.assertTrue(text[0].isupper() and text.endswith('.'))
+            self.assertLessEqual(set(text[:-1].lower().split()), set(lorem._TEXT))
+        for _ in range(100):
+            self.assertIn(len(inst.gen_fitted((40, 60))), range(40, 61))
+
+        inst = lorem.LoremGenerator(pool=['ab', 'abcd'], seed=42)
+        self.assertEqual([size for size in range(12) if inst._reachable('chars')(size)],
+                         [0, 3, 5, 6, 8, 9, 10, 11])
+        self.assertEqual(len(inst.gen_fitted(13)), 13)
+        self.assertEqual(inst.gen_fitted((4, 5)), 'Abcd.')
+        self.assertEqual(len(lorem.LoremGenerator(pool=['üb'], seed=42).gen_fitted(12, unit='bytes')
+                             .encode('utf-8')), 12)
+        for size in (0, 4, 7):
+            with self.assertRaises(ValueError):
+                inst.gen_fitted(size)
+        with self.assertRaises(ValueError):
+            inst.gen_fitted((1, 2))
+
+        with mock.patch('lorem._index_lengths', wraps=lorem._index_lengths) as index:
+            for _ in range(10):
+                inst.gen_fitted(13)
+            self.assertEqual(index.call_count, 0)  # looked up once per generator
+            inst._text = ('abc',)
+            inst._restart(42)
+            self.assertEqual(inst.gen_fitted(8), 'Abc abc.')
+            self.assertEqual(index.call_count, 1)
+
+    def test_write_text(self) -> 'None':
+        """Test :func:`lorem.write_text`."""
+        file = io.StringIO()
+        size = lorem.write_text(file, count=3, seed=42)
+        self.assertEqual(file.getvalue(), lorem.os.linesep.join(
+            itertools.islice(lorem.LoremGenerator(seed=42).iter_text(), 3)))
+        self.assertEqual(size, len(file.getvalue()))
+
+        file = io.StringIO()
+        with self.mock_pool:
+            lorem.write_text(file, count=5, kind='word', sep='-')
+        self.assertEqual(file.getvalue(), 'lorem-ipsum-lorem-ipsum-lorem')
+
+        binary = io.BytesIO()
+        self.assertEqual(lorem.write_text(binary, size=10_000, kind='sentence', buffer_size=1024), 10_000)
+        self.assertEqual(len(binary.getvalue()), 10_000)
+
+        chunks = []  # type: list[bytes]
+        writer = mock.Mock(spec=io.BufferedWriter)
+        writer.write.side_effect = chunks.append
+        lorem.write_text(writer, size=5000, buffer_size=1024)
+        self.assertEqual([len(chunk) for chunk in chunks], [1024, 1024, 1024, 1024, 904])
+
+        for size in range(1, 40):  # not ending partway through a character
+            binary = io.BytesIO()
+            written = lorem.write_text(binary, size=size, kind='word', pool=['été', 'ça'], buffer_size=8)
+            self.assertEqual(written, len(binary.getvalue()))
+            self.assertIn(size - written, (0, 1))
+            binary.getvalue().decode('utf-8')
+
+        with self.assertRaises(ValueError):
+            lorem.write_text(io.StringIO(), count=1, kind='chapter')  # type: ignore[arg-type]
+
+    def test_lorem_stream(self) -> 'None':
+        """Test :class:`lorem.LoremStream`."""
+        stream = lorem.LoremStream(size=10_000, count=3, sep='\n', seed=42)
+        self.assertEqual(len(stream), 10_000)
+        data = stream.read(7) + stream.read()
+        self.assertEqual(len(data), 10_000)
+        self.assertEqual(stream.tell(), 10_000)
+        self.assertEqual(stream.read(), b'')
+        self.assertEqual(set(data.decode().split('\n')[:-1]),
+                         set(itertools.islice(lorem.paragraph(count=3, seed=42), 3)))
+
+        with io.BufferedReader(lorem.LoremStream(size=10_000, count=3, sep='\n', seed=42),
+                               buffer_size=1024) as reader:
+            self.assertEqual(reader.read(), data)
+
+        stream = lorem.LoremStream(seed=42)
+        self.assertTrue(stream)
+        with self.assertRaises(TypeError):
+            len(stream)
+        buffer = memoryview(bytearray(1 << 16))
+        for _ in range(10):
+            self.assertEqual(stream.readinto(buffer), 1 << 16)
+        self.assertEqual(stream.tell(), 10 << 16)
+
+        stream.close()
+        with self.assertRaises(ValueError):
+            stream.read(1)
+        with self.assertRaises(ValueError):
+            lorem.LoremStream(size=-1)
+
+    def test_write_parallel(self) -> 'None':
+        """Test :func:`lorem.write_parallel`."""
+        serial = io.BytesIO()
+        self.assertEqual(lorem.write_parallel(serial, count=50, seed=42, jobs=1, shard_count=7),
+                         len(serial.getvalue()))
+        parallel = io.BytesIO()
+        lorem.write_parallel(parallel, count=50, seed=42, jobs=2, shard_count=7)
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+        self.assertEqual(serial.getvalue().count(lorem.os.linesep.encode()), 49)
+
+        text = io.StringIO()
+        self.assertEqual(lorem.write_parallel(text, size=10_000, seed=42, jobs=1, shard_count=7), 10_000)
+        self.assertEqual(text.getvalue(), serial.getvalue()[:10_000].decode())
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            template = os.path.join(tempdir, 'lorem-{:02d}.txt')
+            lorem.write_parallel(template, count=25, kind='word', seed=42, jobs=1, shard_count=10)
+            self.assertEqual(sorted(os.listdir(tempdir)), ['lorem-00.txt', 'lorem-01.txt', 'lorem-02.txt'])
+            with open(template.format(2)) as file:
+                self.assertEqual(len(file.read().split()), 5)
+
+        for size in range(1, 40):  # not ending partway through a character
+            binary = io.BytesIO()
+            written = lorem.write_parallel(binary, size=size, kind='word', pool=['été', 'ça'],
+                                           seed=42, jobs=1, shard_count=3)
+            self.assertEqual(written, len(binary.getvalue()))
+            self.assertIn(size - written, (0, 1))
+            binary.getvalue().decode('utf-8')
+
+    def test_async(self) -> 'None':
+        """Test :func:`lorem.aword`, :func:`lorem.asentence` and :func:`lorem.aparagraph`."""
+        async def collect(items: 'AsyncIterator[str]', stop: 'int') -> 'list[str]':
+            result = []  # type: list[str]
+            async for item in items:
+                result.append(item)
+                if len(result) >= stop:
+                    break
+            return result
+
+        async def ticker(ticks: 'list[int]') -> 'None':
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def run(items: 'AsyncIterator[str]', stop: 'int') -> 'tuple[list[str], int]':
+            ticks = []  # type: list[int]
+            task = asyncio.ensure_future(ticker(ticks))
+            result = await collect(items, stop)
+            task.cancel()
+            return result, len(ticks)
+
+        texts, ticks = run_async(run(lorem.aword(count=5, seed=42, chunk_size=10), 10))
+        self.assertEqual(texts, islice(lorem.word(count=5, seed=42), 10))
+        self.assertGreater(ticks, 1)
+
+        texts, ticks = run_async(run(lorem.asentence(count=5, seed=42), 10))
+        self.assertEqual(texts, islice(lorem.sentence(count=5, seed=42), 10))
+
+        texts, ticks = run_async(run(lorem.aparagraph(count=50, seed=42, chunk_size=1000), 50))
+        self.assertEqual(texts, islice(lorem.paragraph(count=50, seed=42), 50))
+        self.assertGreater(ticks, 10)
+
+    def test_awrite_text(self) -> 'None':
+        """Test :func:`lorem.awrite_text`."""
+        class Writer:
+            """Mock :class:`asyncio.StreamWriter`."""
+
+            def __init__(self) -> 'None':
+                self.chunks = []  # type: list[bytes]
+                self.drained = 0
+
+            def write(self, data: 'bytes') -> 'None':
+                self.chunks.append(data)
+
+            async def drain(self) -> 'None':
+                self.drained += 1
+
+        class Response:
+            """Mock :class:`aiohttp.web.StreamResponse`."""
+
+            def __init__(self) -> 'None':
+                self.chunks = []  # type: list[bytes]
+
+            async def write(self, data: 'bytes') -> 'None':
+                self.chunks.append(data)
+
+        writer = Writer()
+        self.assertEqual(run_async(lorem.awrite_text(writer, size=10_000, seed=42, chunk_size=1024)), 10_000)
+        self.assertEqual([len(chunk) for chunk in writer.chunks], [1024] * 9 + [784])
+        self.assertEqual(writer.drained, 10)
+
+        binary = io.BytesIO()
+        lorem.write_text(binary, size=10_000, seed=42)
+        self.assertEqual(b''.join(writer.chunks), binary.getvalue())
+
+        response = Response()
+        run_async(lorem.awrite_text(response, count=3, kind='sentence', seed=42))
+        self.assertEqual(b''.join(response.chunks).decode(), lorem.get_sentence(count=3, seed=42))
+
+        for size in range(1, 40):  # not ending partway through a character
+            writer = Writer()
+            written = run_async(lorem.awrite_text(writer, size=size, kind='word', pool=['été', 'ça'],
+                                                    seed=42, chunk_size=8))
+            self.assertEqual(written, len(b''.join(writer.chunks)))
+            self.assertIn(size - written, (0, 1))
+            b''.join(writer.chunks).decode('utf-8')
+
+    def test_main(self) -> 'None':
+        """Test :func:`lorem.main`."""
+        def run(*argv: 'str') -> 'bytes':
+            stdout = io.TextIOWrapper(io.BytesIO())
+            with mock.patch('sys.stdout', stdout):
+                self.assertEqual(lorem.main(list(argv)), 0)
+            return stdout.buffer.getvalue()
+
+        with self.mock_pool:
+            self.assertEqual(run('word', '-n', '3', '--sep', '\\t'),
+                             ('lorem\tipsum\tlorem' + lorem.os.linesep).encode())
+        self.assertEqual(len(run('paragraph', '--bytes', '1.5K')), 1536)
+        self.assertEqual(run('sentence', '-n', '5', '--seed', '42', '--word-range', '1', '3'),
+                         run('sentence', '-n', '5', '--seed', '42', '--word-range', '1', '3'))
+
+        with self.assertRaises(SystemExit):
+            with mock.patch('sys.stderr', io.StringIO()):
+                lorem.main(['paragraph', '--bytes', '10X'])
+
 
 if __name__ == '__main__':
     unittest.main()